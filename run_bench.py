@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+
+import argparse
+import collections.abc
+import gc
+import json
+import lxml.etree
+import pathlib
+import pickle
+import sw_compdocs.component
+import sw_compdocs.document
+import sw_compdocs.exporter
+import sw_compdocs.generator
+import sw_compdocs.language
+import sw_compdocs.snapshot
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+
+def _format_defn_xml(idx: int) -> str:
+    logic_node_list = [
+        f'<logic_node label="Power" mode="1" type="4" description="Electrical power connection {idx:d}."/>',
+        f'<logic_node label="Enabled" mode="1" type="0" description="Enables the component {idx:d}."/>',
+        f'<logic_node label="Value" mode="0" type="1" description="The value of component {idx:d}."/>',
+    ]
+    voxel_list = [
+        f'<voxel><position x="{x:d}" y="0" z="0"/></voxel>' for x in range(idx % 4 + 1)
+    ]
+    return f"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<definition name="Component {idx:d}" category="{idx % 16:d}" mass="{idx % 7:d}" value="{idx:d}" flags="0" tags="basic,component">
+    <tooltip_properties short_description="Short description {idx:d}." description="Description of component {idx:d}."/>
+    <logic_nodes>
+        {"\n        ".join(logic_node_list)}
+    </logic_nodes>
+    <voxels>
+        {"\n        ".join(voxel_list)}
+    </voxels>
+</definition>
+"""
+
+
+def _write_defn_dir(defn_dir: pathlib.Path, n: int) -> None:
+    for idx in range(n):
+        defn_file = pathlib.Path(defn_dir, f"component_{idx:04d}.xml")
+        with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+            fp.write(_format_defn_xml(idx))
+
+
+def _report(name: str, fn: collections.abc.Callable[[], object], number: int) -> None:
+    sec = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{name}: {sec * 1000:.3f} ms", flush=True)
+
+
+def bench_xml_parser(n: int) -> None:
+    xml_list = [_format_defn_xml(idx).encode() for idx in range(n)]
+
+    def parse_new() -> None:
+        for xml in xml_list:
+            parser = sw_compdocs.component._new_xml_parser()
+            lxml.etree.fromstring(xml, parser=parser)
+
+    def parse_reuse() -> None:
+        for xml in xml_list:
+            parser = sw_compdocs.component._get_xml_parser()
+            lxml.etree.fromstring(xml, parser=parser)
+
+    _report(f"parse {n:d} definitions (new parser per file)", parse_new, 3)
+    _report(f"parse {n:d} definitions (reused parser)", parse_reuse, 3)
+
+
+def bench_load_defn_dict(n: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        defn_dir = pathlib.Path(temp_dir)
+        _write_defn_dir(defn_dir, n)
+
+        def load() -> None:
+            sw_compdocs.component.load_defn_dict(defn_dir)
+
+        _report(f"load {n:d} definitions", load, 3)
+
+
+def bench_snapshot(n: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        defn_dir = pathlib.Path(temp_dir, "definitions")
+        defn_dir.mkdir()
+        _write_defn_dir(defn_dir, n)
+        snap_file = pathlib.Path(temp_dir, "snapshot.bin")
+        sw_compdocs.snapshot.save_comp_list(
+            snap_file, sw_compdocs.component.load_comp_list(defn_dir)
+        )
+
+        def load_defn() -> None:
+            sw_compdocs.component.load_comp_list(defn_dir)
+
+        def load_snap() -> None:
+            sw_compdocs.snapshot.load_comp_list(snap_file)
+
+        _report(f"load {n:d} components (definitions)", load_defn, 3)
+        _report(f"load {n:d} components (snapshot)", load_snap, 3)
+
+
+def bench_memory(n: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        defn_dir = pathlib.Path(temp_dir, "definitions")
+        defn_dir.mkdir()
+        _write_defn_dir(defn_dir, n)
+        snap_file = pathlib.Path(temp_dir, "snapshot.bin")
+        sw_compdocs.snapshot.save_comp_list(
+            snap_file, sw_compdocs.component.load_comp_list(defn_dir)
+        )
+
+        def measure(name: str, fn: collections.abc.Callable[[], object]) -> None:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                obj = fn()
+                gc.collect()
+                size, _ = tracemalloc.get_traced_memory()
+                # Anything still traced once the result is gone outlives the load,
+                # e.g. strings interned for the life of the interpreter.
+                del obj
+                gc.collect()
+                left_size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            print(
+                f"{name}: {size / 1024:.1f} KiB, {left_size / 1024:.1f} KiB after drop",
+                flush=True,
+            )
+
+        measure(
+            f"retain {n:d} components (definitions)",
+            lambda: sw_compdocs.component.load_comp_list(defn_dir),
+        )
+        measure(
+            f"retain {n:d} components (snapshot)",
+            lambda: sw_compdocs.snapshot.load_comp_list(snap_file),
+        )
+        measure(
+            f"retain 2 x {n:d} components (definitions)",
+            lambda: [sw_compdocs.component.load_comp_list(defn_dir) for _ in range(2)],
+        )
+        measure(
+            f"retain 2 x {n:d} components (snapshot)",
+            lambda: [sw_compdocs.snapshot.load_comp_list(snap_file) for _ in range(2)],
+        )
+
+
+def _make_language(
+    comp_list: collections.abc.Iterable[sw_compdocs.component.Component],
+) -> sw_compdocs.language.Language:
+    text_list: list[sw_compdocs.language.Text] = [
+        sw_compdocs.language.Text(en=en)
+        for en in ["PROPERTIES", "logic inputs", "logic outputs", "connections"]
+    ]
+    text_list.extend(
+        sw_compdocs.language.Text(en=str(ln_type))
+        for ln_type in sw_compdocs.component.LogicNodeType
+    )
+    for comp in comp_list:
+        text_list.extend([comp.name(), comp.short_description(), comp.description()])
+        for ln in comp.defn.logic_nodes:
+            text_list.extend([ln.label, ln.description])
+    return sw_compdocs.language.Language(
+        sw_compdocs.language.Translation(text.id or "", "", text.en, text.en.upper())
+        for text in text_list
+    )
+
+
+def bench_generate(n: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        defn_dir = pathlib.Path(temp_dir)
+        _write_defn_dir(defn_dir, n)
+        comp_list = sw_compdocs.component.load_comp_list(defn_dir)
+    lang = _make_language(comp_list)
+
+    def generate_document() -> None:
+        sw_compdocs.generator.generate_document(comp_list)
+
+    def generate_document_lang() -> None:
+        sw_compdocs.generator.generate_document(comp_list, lang=lang)
+
+    def generate_document_split_component() -> None:
+        sw_compdocs.generator.generate_document_split_component(comp_list)
+
+    _report(f"generate {n:d} components (category)", generate_document, 10)
+    _report(
+        f"generate {n:d} components (category, language)", generate_document_lang, 10
+    )
+    _report(
+        f"generate {n:d} components (component)", generate_document_split_component, 10
+    )
+
+
+def _make_document(n: int) -> sw_compdocs.document.Document:
+    doc = sw_compdocs.document.Document()
+    for idx in range(n):
+        doc.append(sw_compdocs.document.Heading(f"Component {idx:d}", level=2))
+        doc.append(sw_compdocs.document.Paragraph(f"Short description {idx:d}."))
+        doc.append(sw_compdocs.document.Paragraph(f"Description of component {idx:d}."))
+        doc.append(
+            sw_compdocs.document.UnorderedList(
+                [
+                    sw_compdocs.document.ListItem(f"Mass: {idx % 7:d}"),
+                    sw_compdocs.document.ListItem(f"Cost: ${idx:d}"),
+                ]
+            )
+        )
+        for _ in range(2):
+            doc.append(
+                sw_compdocs.document.Table(
+                    sw_compdocs.document.TableData(
+                        sw_compdocs.document.TableDataRow(
+                            ["Type", "Label", "Description"]
+                        ),
+                        [
+                            sw_compdocs.document.TableDataRow(
+                                ["number", "Value", f"The value of component {idx:d}."]
+                            )
+                        ],
+                    )
+                )
+            )
+    return doc
+
+
+def bench_render(n: int) -> None:
+    doc = _make_document(n)
+
+    def render_markdown_block_isinstance(blk: sw_compdocs.document.Block) -> str:
+        if isinstance(blk, sw_compdocs.document.Heading):
+            return sw_compdocs.exporter.render_markdown_heading(blk)
+        if isinstance(blk, sw_compdocs.document.Paragraph):
+            return sw_compdocs.exporter.render_markdown_paragraph(blk)
+        if isinstance(blk, sw_compdocs.document.UnorderedList):
+            return sw_compdocs.exporter.render_markdown_list_unordered(blk)
+        if isinstance(blk, sw_compdocs.document.Table):
+            return sw_compdocs.exporter.render_markdown_table(blk)
+        if isinstance(blk, sw_compdocs.document.Callout):
+            return sw_compdocs.exporter.render_markdown_callout(blk)
+        raise Exception
+
+    def render_isinstance() -> None:
+        "\n".join(render_markdown_block_isinstance(blk) for blk in doc)
+
+    def render_dict() -> None:
+        sw_compdocs.exporter.render_markdown(doc)
+
+    def render_html() -> None:
+        "".join(sw_compdocs.exporter.render_html(doc))
+
+    _report(f"render {len(doc):d} blocks (isinstance chain)", render_isinstance, 10)
+    _report(f"render {len(doc):d} blocks (dispatch table)", render_dict, 10)
+    _report(f"render {len(doc):d} blocks (html)", render_html, 10)
+
+
+def bench_document_serial(n: int) -> None:
+    doc = _make_document(n)
+    b_json = json.dumps(sw_compdocs.document.dump_document(doc)).encode()
+    b_pickle = pickle.dumps(doc)
+    print(f"serialized size: json {len(b_json):d} B, pickle {len(b_pickle):d} B")
+
+    def dump_json() -> None:
+        json.dumps(sw_compdocs.document.dump_document(doc)).encode()
+
+    def load_json() -> None:
+        sw_compdocs.document.load_document(json.loads(b_json))
+
+    def dump_pickle() -> None:
+        pickle.dumps(doc)
+
+    def load_pickle() -> None:
+        pickle.loads(b_pickle)
+
+    _report(f"dump {len(doc):d} blocks (json)", dump_json, 10)
+    _report(f"load {len(doc):d} blocks (json)", load_json, 10)
+    _report(f"dump {len(doc):d} blocks (pickle)", dump_pickle, 10)
+    _report(f"load {len(doc):d} blocks (pickle)", load_pickle, 10)
+
+
+def bench_container(n: int) -> None:
+    voxel_list = [sw_compdocs.component.Voxel() for _ in range(n * 100)]
+    voxel_seq = sw_compdocs.component.VoxelList(voxel_list)
+    doc = _make_document(n)
+
+    def new_voxel_list() -> None:
+        sw_compdocs.component.VoxelList(voxel_list)
+
+    def copy_voxel_list() -> None:
+        sw_compdocs.component.VoxelList(voxel_seq)
+
+    def slice_voxel_list() -> None:
+        voxel_seq[1:]
+
+    def extend_voxel_list() -> None:
+        sw_compdocs.component.VoxelList().extend(voxel_list)
+
+    def copy_document() -> None:
+        sw_compdocs.document.Document(doc)
+
+    def extend_document() -> None:
+        sw_compdocs.document.Document().extend(doc)
+
+    _report(f"build {len(voxel_list):d} voxels (list)", new_voxel_list, 10)
+    _report(f"build {len(voxel_list):d} voxels (VoxelList)", copy_voxel_list, 10)
+    _report(f"slice {len(voxel_list):d} voxels", slice_voxel_list, 10)
+    _report(f"extend {len(voxel_list):d} voxels", extend_voxel_list, 10)
+    _report(f"build {len(doc):d} blocks (Document)", copy_document, 10)
+    _report(f"extend {len(doc):d} blocks (Document)", extend_document, 10)
+
+
+def bench_startup(n: int) -> None:
+    def import_main() -> int:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import sw_compdocs.main"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        # -X importtime lines: "import time: self [us] | cumulative | imported package"
+        for line in proc.stderr.splitlines():
+            field_list = [field.strip() for field in line.split("|")]
+            if len(field_list) == 3 and field_list[2] == "sw_compdocs.main":
+                return int(field_list[1], base=10)
+        raise Exception
+
+    def run_help() -> None:
+        subprocess.run(
+            [sys.executable, "-m", "sw_compdocs", "--help"],
+            capture_output=True,
+            check=True,
+        )
+
+    usec = min(import_main() for _ in range(10))
+    print(f"import sw_compdocs.main: {usec / 1000:.3f} ms", flush=True)
+    _report("sw_compdocs --help", run_help, 5)
+
+
+bench_dict: dict[str, collections.abc.Callable[[int], None]] = {
+    "xml_parser": bench_xml_parser,
+    "load_defn_dict": bench_load_defn_dict,
+    "snapshot": bench_snapshot,
+    "generate": bench_generate,
+    "render": bench_render,
+    "document_serial": bench_document_serial,
+    "container": bench_container,
+    "startup": bench_startup,
+    "memory": bench_memory,
+}
+
+
+def main() -> None:
+    argp = argparse.ArgumentParser(allow_abbrev=False)
+    argp.add_argument("-n", "--number", type=int, default=1500)
+    argp.add_argument("bench", nargs="*", help=", ".join(bench_dict.keys()))
+    argv = argp.parse_args()
+    argv_number: int = argv.number
+    argv_bench: list[str] = argv.bench
+
+    for bench_name in argv_bench:
+        if bench_name not in bench_dict:
+            argp.error(f"invalid benchmark: {bench_name!r}")
+
+    bench_name_list = argv_bench if len(argv_bench) > 0 else list(bench_dict.keys())
+    for bench_name in bench_name_list:
+        print(f"==> Running {bench_name}", flush=True)
+        bench_dict[bench_name](argv_number)
+
+
+if __name__ == "__main__":
+    main()
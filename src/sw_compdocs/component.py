@@ -1,10 +1,16 @@
+import collections
 import collections.abc
+import concurrent.futures
 import dataclasses
 import enum
+import fnmatch
+import itertools
 import lxml.etree
 import os
 import pathlib
 import re
+import threading
+import time
 import typing
 
 from . import _types
@@ -51,6 +57,20 @@ class DefinitionXMLError(Exception):
         raise ValueError
 
 
+class DefinitionArchiveError(Exception):
+    def __init__(self, msg: str, *, file: _types.StrOrBytesPath | None = None) -> None:
+        super().__init__(msg)
+        self.msg: typing.Final[str] = msg
+        self.file: _types.StrOrBytesPath | None = file
+
+    def __str__(self) -> str:
+        msg = self.msg
+        if self.file is not None:
+            file = os.fsdecode(self.file)
+            msg = f"{self.msg} (in file '{file}')"
+        return msg
+
+
 class MultibodyLinkError(Exception):
     def __init__(self, parent_key: str, child_key: str) -> None:
         super().__init__(parent_key, child_key)
@@ -147,6 +167,22 @@ class Flags(enum.Flag, boundary=enum.KEEP):
     IS_DEPRECATED = 1 << 29
 
 
+# Logic node labels and descriptions and tags repeat across definitions, so a load
+# shares one object for each of them through a pool. The pool belongs to the load
+# rather than to sys.intern, so the strings are freed with the loaded definitions.
+def _get_attr_str(
+    elem: lxml.etree._Element,
+    key: str,
+    default: str = "",
+    *,
+    pool: dict[str, str] | None = None,
+) -> str:
+    s = elem.get(key, default)
+    if pool is not None:
+        s = pool.setdefault(s, s)
+    return s
+
+
 @dataclasses.dataclass
 class TooltipProperties:
     _: dataclasses.KW_ONLY
@@ -210,6 +246,37 @@ class LogicNodeType(enum.Enum):
         typing.assert_never(self)
 
 
+def _classify_logic_node(ln_type: LogicNodeType, ln_mode: LogicNodeMode) -> int:
+    if (
+        ln_type is LogicNodeType.BOOL
+        or ln_type is LogicNodeType.FLOAT
+        or ln_type is LogicNodeType.COMPOSITE
+        or ln_type is LogicNodeType.VIDEO
+        or ln_type is LogicNodeType.AUDIO
+    ):
+        if ln_mode is LogicNodeMode.INPUT:
+            return 0
+        if ln_mode is LogicNodeMode.OUTPUT:
+            return 1
+        typing.assert_never(ln_mode)
+    if (
+        ln_type is LogicNodeType.TORQUE
+        or ln_type is LogicNodeType.WATER
+        or ln_type is LogicNodeType.ELECTRIC
+        or ln_type is LogicNodeType.ROPE
+    ):
+        return 2
+    typing.assert_never(ln_type)
+
+
+# index into LogicNodeList.classify() result: 0 = input, 1 = output, 2 = connection
+_logic_node_class_dict: typing.Final[dict[tuple[LogicNodeType, LogicNodeMode], int]] = {
+    (ln_type, ln_mode): _classify_logic_node(ln_type, ln_mode)
+    for ln_type in LogicNodeType
+    for ln_mode in LogicNodeMode
+}
+
+
 @dataclasses.dataclass
 class LogicNode:
     _: dataclasses.KW_ONLY
@@ -225,9 +292,10 @@ class LogicNode:
         *,
         key: str | None = None,
         idx: int | None = None,
+        pool: dict[str, str] | None = None,
     ) -> typing.Self:
-        label = language.Text(en=elem.get("label", ""))
-        description = language.Text(en=elem.get("description", ""))
+        label = language.Text(en=_get_attr_str(elem, "label", pool=pool))
+        description = language.Text(en=_get_attr_str(elem, "description", pool=pool))
 
         mode = cls.mode
         mode_attr = elem.get("mode")
@@ -267,15 +335,25 @@ class LogicNode:
 
 
 class LogicNodeList(container.MutableSequence[LogicNode]):
+    def __init__(self, iterable: collections.abc.Iterable[LogicNode] = ()) -> None:
+        super().__init__(iterable)
+        self._classified: (
+            tuple[list[LogicNode], list[LogicNode], list[LogicNode]] | None
+        ) = None
+
     @classmethod
     def from_xml_elem(
-        cls, elem: lxml.etree._Element, *, key: str | None = None
+        cls,
+        elem: lxml.etree._Element,
+        *,
+        key: str | None = None,
+        pool: dict[str, str] | None = None,
     ) -> typing.Self:
         def generate() -> collections.abc.Iterator[LogicNode]:
             tag = "logic_node"
             for idx, sub in enumerate(elem.findall(tag)):
                 try:
-                    ln = LogicNode.from_xml_elem(sub, key=key, idx=idx)
+                    ln = LogicNode.from_xml_elem(sub, key=key, idx=idx, pool=pool)
                 except DefinitionXMLError as exc:
                     exc.prepend_xpath(f"{tag}[{idx + 1}]")
                     raise
@@ -290,6 +368,22 @@ class LogicNodeList(container.MutableSequence[LogicNode]):
             for idx, ln in enumerate(self):
                 ln.update_id(key, idx)
 
+    def classify(
+        self,
+    ) -> tuple[list[LogicNode], list[LogicNode], list[LogicNode]]:
+        if self._classified is None:
+            classified: tuple[list[LogicNode], list[LogicNode], list[LogicNode]]
+            classified = ([], [], [])
+            for ln in self._l:
+                classified[_logic_node_class_dict[ln.type, ln.mode]].append(ln)
+            self._classified = classified
+
+        in_list, out_list, conn_list = self._classified
+        return in_list[:], out_list[:], conn_list[:]
+
+    def _on_change(self) -> None:
+        self._classified = None
+
 
 @dataclasses.dataclass
 class VoxelPos:
@@ -387,9 +481,10 @@ class Definition:
         *,
         file: _types.StrOrBytesPath | None = None,
         key: str | None = None,
+        pool: dict[str, str] | None = None,
     ) -> typing.Self:
         name = language.Text(en=elem.get("name", ""))
-        tags = elem.get("tags", cls.tags)
+        tags = _get_attr_str(elem, "tags", cls.tags, pool=pool)
         child_name = elem.get("child_name", cls.child_name)
 
         category = cls.category
@@ -450,7 +545,9 @@ class Definition:
         if logic_nodes_elem is None:
             logic_nodes_elem = lxml.etree.Element("logic_nodes")
         try:
-            logic_nodes = LogicNodeList.from_xml_elem(logic_nodes_elem, key=key)
+            logic_nodes = LogicNodeList.from_xml_elem(
+                logic_nodes_elem, key=key, pool=pool
+            )
         except DefinitionXMLError as exc:
             exc.file = file
             exc.prepend_xpath("logic_nodes")
@@ -611,7 +708,25 @@ def _new_xml_parser() -> "lxml.etree.XMLParser[lxml.etree._Element]":
     # Stormworks uses XML with invalid attribute names.
     # To avoid errors, we enable the recover option.
     # https://nona-takahara.github.io/blog/entry10.html
-    return lxml.etree.XMLParser(recover=True)
+    #
+    # Definitions never use ID attributes or whitespace-only text, so neither is
+    # kept in the parsed tree.
+    return lxml.etree.XMLParser(recover=True, remove_blank_text=True, collect_ids=False)
+
+
+class _XMLParserLocal(threading.local):
+    def __init__(self) -> None:
+        super().__init__()
+        self.parser = _new_xml_parser()
+
+
+_xml_parser_local = _XMLParserLocal()
+
+
+def _get_xml_parser() -> "lxml.etree.XMLParser[lxml.etree._Element]":
+    # lxml parsers can be reused for any number of documents, but not by multiple
+    # threads at once. Each thread keeps its own parser.
+    return _xml_parser_local.parser
 
 
 def _parse_xml_root(
@@ -619,6 +734,7 @@ def _parse_xml_root(
     *,
     file: _types.StrOrBytesPath | None = None,
     key: str | None = None,
+    pool: dict[str, str] | None = None,
 ) -> Definition:
     # elem may be None if the XML is invalid.
     if elem is None:
@@ -637,7 +753,7 @@ def _parse_xml_root(
         raise exc
 
     try:
-        return Definition.from_xml_elem(elem, file=file, key=key)
+        return Definition.from_xml_elem(elem, file=file, key=key, pool=pool)
     except DefinitionXMLError as exc:
         exc.prepend_xpath(elem.tag)
         exc.prepend_xpath("/")
@@ -646,33 +762,214 @@ def _parse_xml_root(
 
 def parse_xml_file(file: _types.StrOrBytesPath) -> Definition:
     key = generate_key(file)
-    tree = lxml.etree.parse(file, parser=_new_xml_parser())
+    tree = lxml.etree.parse(file, parser=_get_xml_parser())
     elem = tree.getroot()
     return _parse_xml_root(elem, file=file, key=key)
 
 
 def parse_xml_str(s: str, *, key: str | None = None) -> Definition:
-    elem = lxml.etree.fromstring(s, parser=_new_xml_parser())
+    elem = lxml.etree.fromstring(s, parser=_get_xml_parser())
     return _parse_xml_root(elem, key=key)
 
 
-def load_defn_dict(defn_dir: _types.StrOrBytesPath) -> dict[str, Definition]:
+def parse_xml_bytes(
+    b: bytes,
+    *,
+    file: _types.StrOrBytesPath | None = None,
+    key: str | None = None,
+    pool: dict[str, str] | None = None,
+) -> Definition:
+    base_url = os.fsdecode(file) if file is not None else None
+    elem = lxml.etree.fromstring(b, parser=_get_xml_parser(), base_url=base_url)
+    return _parse_xml_root(elem, file=file, key=key, pool=pool)
+
+
+class DefinitionFile(typing.NamedTuple):
+    file: pathlib.Path
+    size: int
+    mtime_ns: int
+    data: bytes
+
+
+def _select_defn_members[T](
+    archive_file: pathlib.Path, member_iter: collections.abc.Iterable[tuple[str, T]]
+) -> list[T]:
+    # Only definition files at the top level of the archive are loaded, which
+    # corresponds to the files loaded from the definitions directory. If all members
+    # are in a single directory (the definitions directory itself was packed), the
+    # files in that directory are loaded instead.
+    path_list = [(pathlib.PurePosixPath(name), member) for name, member in member_iter]
+    top_set = {path.parts[0] if len(path.parts) > 1 else "" for path, _ in path_list}
+    defn_dir = pathlib.PurePosixPath(".")
+    if len(top_set) == 1 and "" not in top_set:
+        defn_dir = pathlib.PurePosixPath(*top_set)
+
+    member_list = [
+        member
+        for path, member in path_list
+        if path.parent == defn_dir and path.match("*.xml")
+    ]
+    if len(member_list) <= 0:
+        raise DefinitionArchiveError("no definition files found", file=archive_file)
+    return member_list
+
+
+def _read_defn_file(defn_file: pathlib.Path) -> DefinitionFile:
+    # The size and the modification time are taken from the opened file descriptor.
+    with open(defn_file, mode="rb") as fp:
+        st = os.fstat(fp.fileno())
+        data = fp.read()
+    return DefinitionFile(defn_file, st.st_size, st.st_mtime_ns, data)
+
+
+def _iter_defn_dir(
+    defn_dir: pathlib.Path, *, max_workers: int | None = None
+) -> collections.abc.Iterator[DefinitionFile]:
+    # os.scandir reports the file type along with the name on all major platforms,
+    # so no stat call is needed to skip directories.
+    with os.scandir(defn_dir) as it:
+        defn_file_list = [
+            pathlib.Path(defn_dir, entry.name)
+            for entry in it
+            if fnmatch.fnmatch(entry.name, "*.xml") and entry.is_file()
+        ]
+
+    # Files are read by a thread pool ahead of the consumer, so that reading
+    # overlaps with parsing. The number of files held in memory is bounded.
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    if max_workers <= 0:
+        raise ValueError
+    depth = max_workers * 2
+
+    defn_file_iter = iter(defn_file_list)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_queue = collections.deque(
+            executor.submit(_read_defn_file, defn_file)
+            for defn_file in itertools.islice(defn_file_iter, depth)
+        )
+        try:
+            while len(future_queue) > 0:
+                future = future_queue.popleft()
+                defn_file = next(defn_file_iter, None)
+                if defn_file is not None:
+                    future_queue.append(executor.submit(_read_defn_file, defn_file))
+                yield future.result()
+        finally:
+            for future in future_queue:
+                future.cancel()
+
+
+def _iter_defn_zip(defn_file: pathlib.Path) -> collections.abc.Iterator[DefinitionFile]:
+    import zipfile
+
+    with zipfile.ZipFile(defn_file, mode="r") as zf:
+        info_list = _select_defn_members(
+            defn_file,
+            ((info.filename, info) for info in zf.infolist() if not info.is_dir()),
+        )
+        for info in info_list:
+            mtime = time.mktime(info.date_time + (0, 0, -1))
+            yield DefinitionFile(
+                pathlib.Path(defn_file, info.filename),
+                info.file_size,
+                int(mtime) * 1_000_000_000,
+                zf.read(info),
+            )
+
+
+def _iter_defn_tar(defn_file: pathlib.Path) -> collections.abc.Iterator[DefinitionFile]:
+    import tarfile
+
+    with tarfile.open(defn_file, mode="r:*") as tf:
+        info_list = _select_defn_members(
+            defn_file, ((info.name, info) for info in tf if info.isfile())
+        )
+        for info in info_list:
+            fp = tf.extractfile(info)
+            if fp is None:
+                raise Exception
+            with fp:
+                data = fp.read()
+            yield DefinitionFile(
+                pathlib.Path(defn_file, info.name),
+                info.size,
+                int(info.mtime) * 1_000_000_000,
+                data,
+            )
+
+
+def _iter_defn_archive(
+    defn_file: pathlib.Path,
+) -> collections.abc.Iterator[DefinitionFile]:
+    # Archive support is imported here, so that loading a definitions directory
+    # does not need it.
+    import gzip
+    import lzma
+    import tarfile
+    import zipfile
+    import zlib
+
+    # Corrupt or truncated compressed members are reported by the decompressors
+    # rather than by zipfile or tarfile.
+    decompress_error = (EOFError, gzip.BadGzipFile, lzma.LZMAError, zlib.error)
+
+    try:
+        if zipfile.is_zipfile(defn_file):
+            try:
+                yield from _iter_defn_zip(defn_file)
+            except zipfile.BadZipFile as exc:
+                raise DefinitionArchiveError(str(exc), file=defn_file) from exc
+            return
+        if tarfile.is_tarfile(defn_file):
+            try:
+                yield from _iter_defn_tar(defn_file)
+            except tarfile.TarError as exc:
+                raise DefinitionArchiveError(str(exc), file=defn_file) from exc
+            return
+    except decompress_error as exc:
+        raise DefinitionArchiveError(str(exc), file=defn_file) from exc
+    raise DefinitionArchiveError("unsupported archive format", file=defn_file)
+
+
+def iter_defn_files(
+    defn_dir: _types.StrOrBytesPath, *, max_workers: int | None = None
+) -> collections.abc.Iterator[DefinitionFile]:
     if not isinstance(defn_dir, pathlib.Path):
         defn_dir = os.fsdecode(defn_dir)
         defn_dir = pathlib.Path(defn_dir)
 
+    if defn_dir.is_file():
+        return _iter_defn_archive(defn_dir)
+    return _iter_defn_dir(defn_dir, max_workers=max_workers)
+
+
+def load_defn_dict(
+    defn_dir: _types.StrOrBytesPath,
+    *,
+    max_workers: int | None = None,
+    errors: list[Exception] | None = None,
+) -> dict[str, Definition]:
     defn_dict: dict[str, Definition] = {}
-    for defn_file in defn_dir.glob("*.xml"):
-        if not defn_file.is_file():
+    pool: dict[str, str] = {}
+    for defn_file in iter_defn_files(defn_dir, max_workers=max_workers):
+        key = generate_key(defn_file.file)
+        try:
+            defn = parse_xml_bytes(
+                defn_file.data, file=defn_file.file, key=key, pool=pool
+            )
+        except (DefinitionXMLError, lxml.etree.ParseError) as exc:
+            if errors is None:
+                raise
+            errors.append(exc)
             continue
-
-        defn = parse_xml_file(defn_file)
-        assert defn.key is not None
-        defn_dict[defn.key] = defn
+        defn_dict[key] = defn
     return defn_dict
 
 
-def build_comp_list(defn_dict: dict[str, Definition]) -> list[Component]:
+def build_comp_list(
+    defn_dict: dict[str, Definition], *, errors: list[Exception] | None = None
+) -> list[Component]:
     comp: Component
     comp_list: list[Component]
 
@@ -687,11 +984,18 @@ def build_comp_list(defn_dict: dict[str, Definition]) -> list[Component]:
 
         child_key = defn.child_name
         try:
-            child = defn_dict[child_key]
-        except KeyError as exc:
-            raise MultibodyChildNotFoundError(key, child_key) from exc
-        if Flags.MULTIBODY_CHILD not in child.flags:
-            raise MultibodyChildFlagNotSetError(key, child_key)
+            try:
+                child = defn_dict[child_key]
+            except KeyError as exc:
+                raise MultibodyChildNotFoundError(key, child_key) from exc
+            if Flags.MULTIBODY_CHILD not in child.flags:
+                raise MultibodyChildFlagNotSetError(key, child_key)
+        except MultibodyLinkError as exc:
+            if errors is None:
+                raise
+            errors.append(exc)
+            pend_key_set.discard(key)
+            continue
 
         comp = Multibody(defn=defn, child=child)
         comp_list.append(comp)
@@ -710,5 +1014,8 @@ def build_comp_list(defn_dict: dict[str, Definition]) -> list[Component]:
     return comp_list
 
 
-def load_comp_list(defn_dir: _types.StrOrBytesPath) -> list[Component]:
-    return build_comp_list(load_defn_dict(defn_dir))
+def load_comp_list(
+    defn_dir: _types.StrOrBytesPath, *, errors: list[Exception] | None = None
+) -> list[Component]:
+    defn_dict = load_defn_dict(defn_dir, errors=errors)
+    return build_comp_list(defn_dict, errors=errors)
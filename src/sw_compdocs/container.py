@@ -1,4 +1,5 @@
 import collections.abc
+import copy
 import typing
 
 
@@ -29,12 +30,17 @@ class Sequence[T](collections.abc.Sequence[T]):
             return self._l == other._l
         return super().__eq__(other)
 
+    def copy(self) -> typing.Self:
+        return type(self)(self._l)
+
+    def view(self, index: slice = slice(None)) -> "SequenceView[T]":
+        return SequenceView(self._l, range(len(self._l))[index])
+
 
 class MutableSequence[T](collections.abc.MutableSequence[T]):
     def __init__(self, iterable: collections.abc.Iterable[T] = ()) -> None:
         super().__init__()
-        self._l: list[T] = []
-        self[:] = iterable
+        self._l: list[T] = self._new_list(iterable)
 
     @typing.overload
     def __getitem__(self, index: int) -> T: ...
@@ -44,7 +50,11 @@ class MutableSequence[T](collections.abc.MutableSequence[T]):
 
     def __getitem__(self, index: int | slice) -> T | typing.Self:
         if isinstance(index, slice):
-            return type(self)(self._l[index])
+            # elements of this container are already checked
+            other = copy.copy(self)
+            other._l = self._l[index]
+            other._on_change()
+            return other
         return self._l[index]
 
     @typing.overload
@@ -60,14 +70,14 @@ class MutableSequence[T](collections.abc.MutableSequence[T]):
             # type cast is safe because of overloads
             value = typing.cast(collections.abc.Iterable[T], value)
 
-            value = self._check_value_iter(value)
-            self._l[index] = value
+            self._l[index] = self._new_list(value)
         else:
             # type cast is safe because of overloads
             value = typing.cast(T, value)
 
             self._check_value(value)
             self._l[index] = value
+        self._on_change()
 
     @typing.overload
     def __delitem__(self, index: int) -> None: ...
@@ -77,6 +87,7 @@ class MutableSequence[T](collections.abc.MutableSequence[T]):
 
     def __delitem__(self, index: int | slice) -> None:
         del self._l[index]
+        self._on_change()
 
     def __len__(self) -> int:
         return len(self._l)
@@ -89,16 +100,75 @@ class MutableSequence[T](collections.abc.MutableSequence[T]):
             return self._l == other._l
         return super().__eq__(other)
 
+    def copy(self) -> typing.Self:
+        return self[:]
+
+    def view(self, index: slice = slice(None)) -> "SequenceView[T]":
+        return SequenceView(self._l, range(len(self._l))[index])
+
     def insert(self, index: int, value: T) -> None:
         self._check_value(value)
         self._l.insert(index, value)
+        self._on_change()
+
+    def extend(self, values: collections.abc.Iterable[T]) -> None:
+        self._l.extend(self._new_list(values))
+        self._on_change()
+
+    def _new_list(self, iterable: collections.abc.Iterable[T]) -> list[T]:
+        if isinstance(iterable, MutableSequence) and self._is_trusted(iterable):
+            return iterable._l.copy()
+
+        value_list = list(iterable)
+        self._check_value_list(value_list)
+        return value_list
 
-    def _check_value_iter(
-        self, value_iter: collections.abc.Iterable[T]
-    ) -> collections.abc.Iterable[T]:
-        for value in value_iter:
+    def _is_trusted(self, other: "MutableSequence[T]") -> bool:
+        return type(other) is type(self)
+
+    def _check_value_list(self, value_list: list[T]) -> None:
+        for value in value_list:
             self._check_value(value)
-            yield value
 
     def _check_value(self, value: T) -> None:
         pass
+
+    def _on_change(self) -> None:
+        pass
+
+
+class SequenceView[T](collections.abc.Sequence[T]):
+    # Read-only window over the storage of a container. Element changes in the parent
+    # are visible through the view, but the index range is fixed when it is created.
+    def __init__(self, l: list[T], r: range) -> None:
+        super().__init__()
+        self._l = l
+        self._r = r
+
+    @typing.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.Self: ...
+
+    def __getitem__(self, index: int | slice) -> T | typing.Self:
+        if isinstance(index, slice):
+            return type(self)(self._l, self._r[index])
+        return self._l[self._r[index]]
+
+    def __iter__(self) -> collections.abc.Iterator[T]:
+        return map(self._l.__getitem__, self._r)
+
+    def __len__(self) -> int:
+        return len(self._r)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(self.copy())})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            return self.copy() == other.copy()
+        return super().__eq__(other)
+
+    def copy(self) -> list[T]:
+        return list(self)
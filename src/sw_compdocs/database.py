@@ -0,0 +1,83 @@
+import dataclasses
+import typing
+
+
+class CategoryRow(typing.NamedTuple):
+    category: int
+    name: str
+
+
+class LogicNodeTypeRow(typing.NamedTuple):
+    type: int
+    name: str
+
+
+class ComponentRow(typing.NamedTuple):
+    key: str | None
+    file: str
+    name: str
+    category: int
+    mass: float
+    value: int
+    flags: int
+    tags: str
+    deprecated: bool
+    orphaned: bool
+    short_description: str
+    description: str
+
+
+class ComponentTagRow(typing.NamedTuple):
+    key: str | None
+    tag: str
+
+
+class MultibodyRow(typing.NamedTuple):
+    key: str | None
+    child_key: str | None
+    child_file: str
+    parent_mass: float
+    child_mass: float
+
+
+class LogicNodeRow(typing.NamedTuple):
+    key: str | None
+    child: bool
+    idx: int
+    mode: int
+    type: int
+    label: str
+    description: str
+
+
+class VoxelBoundsRow(typing.NamedTuple):
+    key: str | None
+    min_x: int
+    min_y: int
+    min_z: int
+    max_x: int
+    max_y: int
+    max_z: int
+
+
+@dataclasses.dataclass
+class Database:
+    category: list[CategoryRow] = dataclasses.field(default_factory=list[CategoryRow])
+    logic_node_type: list[LogicNodeTypeRow] = dataclasses.field(
+        default_factory=list[LogicNodeTypeRow]
+    )
+    component: list[ComponentRow] = dataclasses.field(
+        default_factory=list[ComponentRow]
+    )
+    component_tag: list[ComponentTagRow] = dataclasses.field(
+        default_factory=list[ComponentTagRow]
+    )
+    multibody: list[MultibodyRow] = dataclasses.field(
+        default_factory=list[MultibodyRow]
+    )
+    logic_node: list[LogicNodeRow] = dataclasses.field(
+        default_factory=list[LogicNodeRow]
+    )
+    voxel_bounds: list[VoxelBoundsRow] = dataclasses.field(
+        default_factory=list[VoxelBoundsRow]
+    )
@@ -30,6 +30,8 @@ class Paragraph(Block):
 class ListItem:
     s: str
     l: list[typing.Self] = dataclasses.field(default_factory=list[typing.Self])
+    _: dataclasses.KW_ONLY
+    link: str | None = None
 
 
 @dataclasses.dataclass
@@ -86,6 +88,19 @@ class TableData(container.MutableSequence[TableDataRow]):
                 return False
         return super().__eq__(other)
 
+    def _is_trusted(self, other: container.MutableSequence[TableDataRow]) -> bool:
+        return (
+            super()._is_trusted(other)
+            and isinstance(other, TableData)
+            and len(other.head) == len(self.head)
+        )
+
+    def _check_value_list(self, value_list: list[TableDataRow]) -> None:
+        n = len(self.head)
+        for value in value_list:
+            if len(value) != n:
+                raise ValueError
+
     def _check_value(self, value: TableDataRow) -> None:
         if len(value) != len(self.head):
             raise ValueError
@@ -114,3 +129,154 @@ class Document(container.MutableSequence[Block]):
         for blk in self:
             if isinstance(blk, Heading):
                 blk.level += level
+
+
+SERIAL_VERSION: typing.Final[int] = 1
+
+
+def _dump_list_item(li: ListItem) -> list[object]:
+    obj: list[object] = [li.s, [_dump_list_item(child) for child in li.l]]
+    if li.link is not None:
+        obj.append(li.link)
+    return obj
+
+
+def _dump_heading(blk: Heading) -> list[object]:
+    return ["h", blk.text, blk.level]
+
+
+def _dump_paragraph(blk: Paragraph) -> list[object]:
+    return ["p", blk.text]
+
+
+def _dump_list_unordered(blk: UnorderedList) -> list[object]:
+    return ["ul", [_dump_list_item(li) for li in blk.l]]
+
+
+def _dump_table(blk: Table) -> list[object]:
+    return ["table", list(blk.data.head), [list(row) for row in blk.data]]
+
+
+def _dump_callout(blk: Callout) -> list[object]:
+    return ["callout", blk.text, blk.kind.name]
+
+
+_block_dumper_dict: typing.Final[
+    dict[type[Block], collections.abc.Callable[[typing.Any], list[object]]]
+] = {
+    Heading: _dump_heading,
+    Paragraph: _dump_paragraph,
+    UnorderedList: _dump_list_unordered,
+    Table: _dump_table,
+    Callout: _dump_callout,
+}
+
+
+def _dump_block(blk: Block) -> list[object]:
+    for cls in type(blk).__mro__:
+        dumper = _block_dumper_dict.get(cls)
+        if dumper is not None:
+            return dumper(blk)
+    raise ValueError(f"unsupported block type {type(blk).__name__!r}")
+
+
+def dump_document(doc: Document) -> list[object]:
+    return [SERIAL_VERSION, [_dump_block(blk) for blk in doc]]
+
+
+def _load_list(obj: object) -> list[object]:
+    if not isinstance(obj, list):
+        raise ValueError(f"expected list, got {type(obj).__name__!r}")
+    return typing.cast(list[object], obj)
+
+
+def _load_str(obj: object) -> str:
+    if not isinstance(obj, str):
+        raise ValueError(f"expected str, got {type(obj).__name__!r}")
+    return obj
+
+
+def _load_row(obj: object) -> TableDataRow:
+    return TableDataRow([_load_str(s) for s in _load_list(obj)])
+
+
+def _load_list_item(obj: object) -> ListItem:
+    match _load_list(obj):
+        case [str(s), l]:
+            return ListItem(s, [_load_list_item(li) for li in _load_list(l)])
+        case [str(s), l, str(link)]:
+            return ListItem(s, [_load_list_item(li) for li in _load_list(l)], link=link)
+        case _:
+            raise ValueError("invalid list item")
+
+
+def _load_heading(args: list[object]) -> Heading:
+    match args:
+        # bool is a subclass of int, but is never a valid heading level.
+        case [str(text), int(level)] if not isinstance(level, bool):
+            return Heading(text, level=level)
+        case _:
+            raise ValueError("invalid heading")
+
+
+def _load_paragraph(args: list[object]) -> Paragraph:
+    match args:
+        case [str(text)]:
+            return Paragraph(text)
+        case _:
+            raise ValueError("invalid paragraph")
+
+
+def _load_list_unordered(args: list[object]) -> UnorderedList:
+    match args:
+        case [l]:
+            return UnorderedList([_load_list_item(li) for li in _load_list(l)])
+        case _:
+            raise ValueError("invalid unordered list")
+
+
+def _load_table(args: list[object]) -> Table:
+    match args:
+        case [head, rows]:
+            return Table(
+                TableData(_load_row(head), [_load_row(row) for row in _load_list(rows)])
+            )
+        case _:
+            raise ValueError("invalid table")
+
+
+def _load_callout(args: list[object]) -> Callout:
+    match args:
+        case [str(text), str(kind)] if kind in CalloutKind.__members__:
+            return Callout(text, kind=CalloutKind[kind])
+        case _:
+            raise ValueError("invalid callout")
+
+
+_block_loader_dict: typing.Final[
+    dict[str, collections.abc.Callable[[list[object]], Block]]
+] = {
+    "h": _load_heading,
+    "p": _load_paragraph,
+    "ul": _load_list_unordered,
+    "table": _load_table,
+    "callout": _load_callout,
+}
+
+
+def _load_block(obj: object) -> Block:
+    match _load_list(obj):
+        case [str(tag), *args] if tag in _block_loader_dict:
+            return _block_loader_dict[tag](args)
+        case _:
+            raise ValueError("invalid block")
+
+
+def load_document(obj: object) -> Document:
+    match _load_list(obj):
+        case [int(version), blk_list] if version == SERIAL_VERSION:
+            return Document(_load_block(blk) for blk in _load_list(blk_list))
+        case [int(version), _]:
+            raise ValueError(f"unsupported document version {version!r}")
+        case _:
+            raise ValueError("invalid document")
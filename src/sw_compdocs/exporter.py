@@ -1,12 +1,38 @@
+import codecs
 import collections.abc
+import contextlib
+import errno
+import html
+import io
+import locale
 import os
 import pathlib
+import threading
 import typing
+import urllib.parse
 
 from . import _types
 from . import document
 from . import wraperr
 
+# Modules that only some output formats need are imported where they are used, so
+# that Markdown output does not load them.
+if typing.TYPE_CHECKING:
+    from . import database
+
+
+class DatabaseError(Exception):
+    def __init__(self, msg: str, *, file: _types.StrOrBytesPath | None = None) -> None:
+        super().__init__(msg, file)
+        self.msg: typing.Final[str] = msg
+        self.file: typing.Final[_types.StrOrBytesPath | None] = file
+
+    def __str__(self) -> str:
+        if self.file is None:
+            return self.msg
+        file = os.fsdecode(self.file)
+        return f"{self.msg} (in file '{file}')"
+
 
 def render_markdown_heading(head: document.Heading) -> str:
     if head.level < 1 or 6 < head.level:
@@ -23,7 +49,10 @@ def render_markdown_list_unordered(ul: document.UnorderedList) -> str:
         l: collections.abc.Iterable[document.ListItem],
     ) -> collections.abc.Iterable[str]:
         for li in l:
-            yield "- " + li.s + "\n"
+            s = li.s
+            if li.link is not None:
+                s = f"[{s}]({urllib.parse.quote(li.link + '.md')})"
+            yield "- " + s + "\n"
             for s in fn(li.l):
                 yield "  " + s
 
@@ -67,34 +96,84 @@ def render_markdown_callout(callout: document.Callout) -> str:
     return "\n".join(l) + "\n"
 
 
+type BlockRendererDict = dict[
+    type[document.Block], collections.abc.Callable[[typing.Any], str]
+]
+
+
+def render_block(renderer_dict: BlockRendererDict, blk: document.Block) -> str:
+    renderer = renderer_dict.get(type(blk))
+    if renderer is None:
+        # Subclasses of known block types fall back to the nearest registered base.
+        for cls in type(blk).__mro__[1:]:
+            renderer = renderer_dict.get(cls)
+            if renderer is not None:
+                break
+        else:
+            raise Exception
+    return renderer(blk)
+
+
+markdown_renderer_dict: typing.Final[BlockRendererDict] = {
+    document.Heading: render_markdown_heading,
+    document.Paragraph: render_markdown_paragraph,
+    document.UnorderedList: render_markdown_list_unordered,
+    document.Table: render_markdown_table,
+    document.Callout: render_markdown_callout,
+}
+
+
 def render_markdown_block(blk: document.Block) -> str:
-    if isinstance(blk, document.Heading):
-        return render_markdown_heading(blk)
-    if isinstance(blk, document.Paragraph):
-        return render_markdown_paragraph(blk)
-    if isinstance(blk, document.UnorderedList):
-        return render_markdown_list_unordered(blk)
-    if isinstance(blk, document.Table):
-        return render_markdown_table(blk)
-    if isinstance(blk, document.Callout):
-        return render_markdown_callout(blk)
-    raise Exception
+    return render_block(markdown_renderer_dict, blk)
 
 
 def render_markdown(doc: document.Document) -> str:
-    return "\n".join(render_markdown_block(blk) for blk in doc)
+    return "\n".join(render_block(markdown_renderer_dict, blk) for blk in doc)
 
 
-def export_markdown(
-    doc: document.Document,
+def _is_text_unchanged(
     file: _types.StrOrBytesPath,
+    s: str,
+    *,
+    encoding: str | None = None,
+    newline: str | None = None,
+) -> bool:
+    if newline is None:
+        newline = os.linesep
+    if newline != "":
+        s = s.replace("\n", newline)
+
+    try:
+        with open(file, mode="r", encoding=encoding, errors="strict", newline="") as fp:
+            return fp.read() == s
+    except (FileNotFoundError, UnicodeDecodeError):
+        return False
+
+
+def _is_bytes_unchanged(file: _types.StrOrBytesPath, b: bytes) -> bool:
+    try:
+        with open(file, mode="rb") as fp:
+            return fp.read() == b
+    except FileNotFoundError:
+        return False
+
+
+def _write_text(
+    file: _types.StrOrBytesPath,
+    text_iter: collections.abc.Iterable[str],
     *,
     mode: typing.Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"] = "w",
     encoding: str | None = None,
     errors: str | None = None,
     newline: str | None = None,
-) -> None:
-    md = render_markdown(doc)
+    skip_unchanged: bool = False,
+    fsync: bool = False,
+) -> bool:
+    if skip_unchanged:
+        text = "".join(text_iter)
+        if _is_text_unchanged(file, text, encoding=encoding, newline=newline):
+            return False
+        text_iter = [text]
 
     with wraperr.wrap_unicode_error(file):
         with open(
@@ -104,7 +183,363 @@ def export_markdown(
             errors=errors,
             newline=newline,
         ) as fp:
-            fp.write(md)
+            fp.writelines(text_iter)
+            if fsync:
+                fp.flush()
+                os.fsync(fp.fileno())
+    return True
+
+
+def _fsync_dir(dir: pathlib.Path) -> None:
+    try:
+        fd = os.open(dir, os.O_RDONLY)
+    except OSError:
+        return  # directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _make_temp_file(file: pathlib.Path) -> pathlib.Path:
+    # tempfile.mkstemp creates files with mode 0o600, which would be kept after the
+    # rename. Create the file with the umask applied, like open() does.
+    import secrets
+
+    while True:
+        temp_file = file.with_name(f".{file.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(temp_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return temp_file
+
+
+class DirWriter:
+    def __init__(
+        self,
+        dir: _types.StrOrBytesPath,
+        *,
+        mode: typing.Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"] = "w",
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+        skip_unchanged: bool = False,
+        atomic: bool = False,
+    ) -> None:
+        if atomic and "a" in mode:
+            raise ValueError
+
+        self._dir: typing.Final[pathlib.Path] = pathlib.Path(os.fsdecode(dir))
+        self._mode: typing.Final = mode
+        self._encoding: typing.Final = encoding
+        self._errors: typing.Final = errors
+        self._newline: typing.Final = newline
+        self._skip_unchanged: typing.Final = skip_unchanged
+        self._atomic: typing.Final = atomic
+        self._lock: typing.Final[threading.Lock] = threading.Lock()
+        self._staged_list: list[tuple[pathlib.Path, pathlib.Path]] = []
+        self._dir_set: set[pathlib.Path] = set()
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def _prepare(self, name: str) -> pathlib.Path:
+        file = pathlib.Path(self._dir, name)
+        with self._lock:
+            if file.parent not in self._dir_set:
+                file.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_set.add(file.parent)
+        if self._atomic and "x" in self._mode and file.exists():
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), file)
+        return file
+
+    def _stage(self, file: pathlib.Path) -> pathlib.Path:
+        temp_file = _make_temp_file(file)
+        with self._lock:
+            self._staged_list.append((temp_file, file))
+        return temp_file
+
+    def write(self, name: str, text_iter: collections.abc.Iterable[str]) -> None:
+        file = self._prepare(name)
+        if not self._atomic:
+            _write_text(
+                file,
+                text_iter,
+                mode=self._mode,
+                encoding=self._encoding,
+                errors=self._errors,
+                newline=self._newline,
+                skip_unchanged=self._skip_unchanged,
+            )
+            return
+
+        if self._skip_unchanged:
+            text = "".join(text_iter)
+            if _is_text_unchanged(
+                file, text, encoding=self._encoding, newline=self._newline
+            ):
+                return
+            text_iter = [text]
+
+        temp_file = self._stage(file)
+        with wraperr.wrap_unicode_error(file):
+            _write_text(
+                temp_file,
+                text_iter,
+                mode="w",
+                encoding=self._encoding,
+                errors=self._errors,
+                newline=self._newline,
+                fsync=True,
+            )
+
+    def write_bytes(self, name: str, b: bytes) -> None:
+        file = self._prepare(name)
+        if self._skip_unchanged and _is_bytes_unchanged(file, b):
+            return
+        if not self._atomic:
+            with open(file, mode="wb" if "x" not in self._mode else "xb") as fp:
+                fp.write(b)
+            return
+
+        temp_file = self._stage(file)
+        with open(temp_file, mode="wb") as fp:
+            fp.write(b)
+            fp.flush()
+            os.fsync(fp.fileno())
+
+    def commit(self) -> None:
+        # Every staged file has been flushed to disk when it was written, so no file
+        # is renamed into place while another may still be lost on a crash.
+        try:
+            for temp_file, file in self._staged_list:
+                os.replace(temp_file, file)
+            for dir in {file.parent for _, file in self._staged_list}:
+                _fsync_dir(dir)
+        except BaseException:
+            self.abort()
+            raise
+        self._staged_list.clear()
+
+    def abort(self) -> None:
+        for temp_file, _ in self._staged_list:
+            temp_file.unlink(missing_ok=True)
+        self._staged_list.clear()
+
+
+# 1980-01-01 is the earliest timestamp a zip file can hold.
+_ARCHIVE_DATE_TIME: typing.Final = (1980, 1, 1, 0, 0, 0)
+_ARCHIVE_MTIME: typing.Final[int] = 315532800
+
+
+class ArchiveWriter:
+    def __init__(
+        self,
+        file: _types.StrOrBytesPath,
+        *,
+        format: typing.Literal["zip", "tar", "tar.gz"],
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+        atomic: bool = False,
+    ) -> None:
+        self._file: typing.Final[pathlib.Path] = pathlib.Path(os.fsdecode(file))
+        self._format: typing.Final = format
+        self._encoding: typing.Final[str] = (
+            encoding if encoding is not None else locale.getpreferredencoding(False)
+        )
+        self._errors: typing.Final[str] = errors if errors is not None else "strict"
+        self._newline: typing.Final[str] = (
+            newline if newline is not None else os.linesep
+        )
+        self._atomic: typing.Final = atomic
+        self._lock: typing.Final[threading.Lock] = threading.Lock()
+        self._member_dict: dict[str, bytes] = {}
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def write(self, name: str, text_iter: collections.abc.Iterable[str]) -> None:
+        text = "".join(text_iter)
+        if self._newline != "":
+            text = text.replace("\n", self._newline)
+        with wraperr.wrap_unicode_error(pathlib.Path(self._file, name)):
+            b = text.encode(self._encoding, errors=self._errors)
+        self.write_bytes(name, b)
+
+    def write_bytes(self, name: str, b: bytes) -> None:
+        with self._lock:
+            if name in self._member_dict:
+                raise ValueError
+            self._member_dict[name] = b
+
+    def _write_zip(self, fp: typing.BinaryIO) -> None:
+        import zipfile
+
+        with zipfile.ZipFile(fp, mode="w") as zf:
+            for name in sorted(self._member_dict):
+                info = zipfile.ZipInfo(name, date_time=_ARCHIVE_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.create_system = 3
+                info.external_attr = 0o644 << 16
+                zf.writestr(info, self._member_dict[name])
+
+    def _write_tar(self, fp: typing.BinaryIO) -> None:
+        import tarfile
+
+        with tarfile.open(fileobj=fp, mode="w", format=tarfile.PAX_FORMAT) as tf:
+            for name in sorted(self._member_dict):
+                b = self._member_dict[name]
+                info = tarfile.TarInfo(name)
+                info.size = len(b)
+                info.mtime = _ARCHIVE_MTIME
+                info.mode = 0o644
+                tf.addfile(info, io.BytesIO(b))
+
+    def commit(self) -> None:
+        file = self._file
+        if self._atomic:
+            file = _make_temp_file(self._file)
+
+        try:
+            with open(file, mode="wb") as fp:
+                if self._format == "zip":
+                    self._write_zip(fp)
+                elif self._format == "tar":
+                    self._write_tar(fp)
+                elif self._format == "tar.gz":
+                    import gzip
+
+                    with gzip.GzipFile(
+                        filename="", mode="wb", fileobj=fp, mtime=_ARCHIVE_MTIME
+                    ) as gz:
+                        self._write_tar(typing.cast(typing.BinaryIO, gz))
+                else:
+                    typing.assert_never(self._format)
+                if self._atomic:
+                    fp.flush()
+                    os.fsync(fp.fileno())
+            if self._atomic:
+                os.replace(file, self._file)
+        except BaseException:
+            if self._atomic:
+                file.unlink(missing_ok=True)
+            raise
+        finally:
+            self._member_dict.clear()
+
+    def abort(self) -> None:
+        self._member_dict.clear()
+
+
+def get_archive_format(
+    file: _types.StrOrBytesPath,
+) -> typing.Literal["zip", "tar", "tar.gz"] | None:
+    name = pathlib.PurePath(os.fsdecode(file)).name.lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith(".tar"):
+        return "tar"
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    return None
+
+
+def open_writer(
+    path: _types.StrOrBytesPath,
+    *,
+    encoding: str | None = None,
+    errors: str | None = None,
+    newline: str | None = None,
+    skip_unchanged: bool = False,
+    atomic: bool = False,
+) -> DirWriter | ArchiveWriter:
+    format = get_archive_format(path)
+    if format is not None:
+        return ArchiveWriter(
+            path,
+            format=format,
+            encoding=encoding,
+            errors=errors,
+            newline=newline,
+            atomic=atomic,
+        )
+    return DirWriter(
+        path,
+        encoding=encoding,
+        errors=errors,
+        newline=newline,
+        skip_unchanged=skip_unchanged,
+        atomic=atomic,
+    )
+
+
+def _map_workers[T](
+    fn: collections.abc.Callable[[T], None],
+    iterable: collections.abc.Iterable[T],
+    *,
+    max_workers: int | None = 1,
+) -> None:
+    if max_workers == 1:
+        for item in iterable:
+            fn(item)
+        return
+
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(fn, iterable):
+            pass
+
+
+def export_markdown(
+    doc: document.Document,
+    file: _types.StrOrBytesPath,
+    *,
+    mode: typing.Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"] = "w",
+    encoding: str | None = None,
+    errors: str | None = None,
+    newline: str | None = None,
+    skip_unchanged: bool = False,
+) -> None:
+    _write_text(
+        file,
+        [render_markdown(doc)],
+        mode=mode,
+        encoding=encoding,
+        errors=errors,
+        newline=newline,
+        skip_unchanged=skip_unchanged,
+    )
+
+
+def write_markdown_dict(
+    writer: DirWriter | ArchiveWriter,
+    doc_dict: collections.abc.Mapping[str, document.Document],
+    *,
+    max_workers: int | None = 1,
+) -> None:
+    def write(item: tuple[str, document.Document]) -> None:
+        name, doc = item
+        writer.write(name + ".md", [render_markdown(doc)])
+
+    _map_workers(write, doc_dict.items(), max_workers=max_workers)
 
 
 def export_markdown_dict(
@@ -115,16 +550,377 @@ def export_markdown_dict(
     encoding: str | None = None,
     errors: str | None = None,
     newline: str | None = None,
+    max_workers: int | None = 1,
+    skip_unchanged: bool = False,
+    atomic: bool = False,
 ) -> None:
-    dir = pathlib.Path(os.fsdecode(dir))
-    for name, doc in doc_dict.items():
-        file = pathlib.Path(dir, name + ".md")
-        dir.mkdir(exist_ok=True)
-        export_markdown(
-            doc,
-            file,
-            mode=mode,
-            encoding=encoding,
-            errors=errors,
-            newline=newline,
+    if len(doc_dict) <= 0:
+        return
+
+    with DirWriter(
+        dir,
+        mode=mode,
+        encoding=encoding,
+        errors=errors,
+        newline=newline,
+        skip_unchanged=skip_unchanged,
+        atomic=atomic,
+    ) as writer:
+        write_markdown_dict(writer, doc_dict, max_workers=max_workers)
+
+
+html_css_file: typing.Final[str] = "style.css"
+
+html_css: typing.Final[str] = """\
+body {
+  margin: 0 auto;
+  max-width: 960px;
+  padding: 0 16px;
+  font-family: sans-serif;
+  line-height: 1.5;
+}
+
+table {
+  border-collapse: collapse;
+}
+
+th,
+td {
+  border: 1px solid #d0d7de;
+  padding: 4px 8px;
+  text-align: left;
+}
+
+.callout {
+  border-left: 4px solid;
+  margin: 16px 0;
+  padding: 0 16px;
+}
+
+.callout-note {
+  border-color: #0969da;
+}
+
+.callout-warning {
+  border-color: #9a6700;
+}
+
+.callout-title {
+  font-weight: bold;
+}
+"""
+
+
+def _escape_html(s: str) -> str:
+    return html.escape(s).replace("\n", "<br>\n")
+
+
+def render_html_heading(head: document.Heading) -> str:
+    if head.level < 1 or 6 < head.level:
+        raise ValueError
+    return f"<h{head.level:d}>{_escape_html(head.text)}</h{head.level:d}>\n"
+
+
+def render_html_paragraph(para: document.Paragraph) -> str:
+    return "<p>" + _escape_html(para.text) + "</p>\n"
+
+
+def render_html_list_unordered(ul: document.UnorderedList) -> str:
+    def fn(
+        l: collections.abc.Iterable[document.ListItem],
+    ) -> collections.abc.Iterable[str]:
+        yield "<ul>\n"
+        for li in l:
+            s = _escape_html(li.s)
+            if li.link is not None:
+                href = html.escape(urllib.parse.quote(li.link + ".html"))
+                s = f'<a href="{href}">{s}</a>'
+            yield "<li>" + s
+            if len(li.l) > 0:
+                yield "\n"
+                yield from fn(li.l)
+            yield "</li>\n"
+        yield "</ul>\n"
+
+    return "".join(fn(ul.l))
+
+
+def render_html_table_data_row(
+    row: document.TableDataRow, *, cell: typing.Literal["td", "th"] = "td"
+) -> str:
+    return (
+        "<tr>" + "".join(f"<{cell}>{_escape_html(s)}</{cell}>" for s in row) + "</tr>\n"
+    )
+
+
+def render_html_table_data(data: document.TableData) -> str:
+    return (
+        "<table>\n<thead>\n"
+        + render_html_table_data_row(data.head, cell="th")
+        + "</thead>\n<tbody>\n"
+        + "".join(render_html_table_data_row(row) for row in data)
+        + "</tbody>\n</table>\n"
+    )
+
+
+def render_html_table(tbl: document.Table) -> str:
+    return render_html_table_data(tbl.data)
+
+
+def render_html_callout(callout: document.Callout) -> str:
+    if callout.kind is document.CalloutKind.NOTE:
+        kind = "note"
+        title = "Note"
+    elif callout.kind is document.CalloutKind.WARNING:
+        kind = "warning"
+        title = "Warning"
+    else:
+        typing.assert_never(callout.kind)
+
+    return (
+        f'<div class="callout callout-{kind}">\n'
+        + f'<p class="callout-title">{title}</p>\n'
+        + "<p>"
+        + _escape_html(callout.text)
+        + "</p>\n</div>\n"
+    )
+
+
+html_renderer_dict: typing.Final[BlockRendererDict] = {
+    document.Heading: render_html_heading,
+    document.Paragraph: render_html_paragraph,
+    document.UnorderedList: render_html_list_unordered,
+    document.Table: render_html_table,
+    document.Callout: render_html_callout,
+}
+
+
+def render_html_block(blk: document.Block) -> str:
+    return render_block(html_renderer_dict, blk)
+
+
+def get_html_charset(encoding: str | None) -> str:
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    return codecs.lookup(encoding).name.replace("_", "-")
+
+
+def render_html(
+    doc: document.Document,
+    *,
+    title: str | None = None,
+    css: str | None = None,
+    charset: str = "utf-8",
+) -> collections.abc.Iterator[str]:
+    if title is None:
+        title = next((blk.text for blk in doc if isinstance(blk, document.Heading)), "")
+
+    yield "<!DOCTYPE html>\n"
+    yield "<html>\n<head>\n"
+    yield f'<meta charset="{html.escape(charset)}">\n'
+    yield "<title>" + html.escape(title) + "</title>\n"
+    if css is not None:
+        yield f'<link rel="stylesheet" href="{html.escape(css)}">\n'
+    yield "</head>\n<body>\n"
+    for blk in doc:
+        yield render_block(html_renderer_dict, blk)
+    yield "</body>\n</html>\n"
+
+
+def export_html(
+    doc: document.Document,
+    file: _types.StrOrBytesPath,
+    *,
+    title: str | None = None,
+    css: str | None = None,
+    mode: typing.Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"] = "w",
+    encoding: str | None = None,
+    errors: str | None = None,
+    newline: str | None = None,
+    skip_unchanged: bool = False,
+) -> None:
+    _write_text(
+        file,
+        render_html(doc, title=title, css=css, charset=get_html_charset(encoding)),
+        mode=mode,
+        encoding=encoding,
+        errors=errors,
+        newline=newline,
+        skip_unchanged=skip_unchanged,
+    )
+
+
+def write_html_dict(
+    writer: DirWriter | ArchiveWriter,
+    doc_dict: collections.abc.Mapping[str, document.Document],
+    *,
+    encoding: str | None = None,
+    max_workers: int | None = 1,
+) -> None:
+    charset = get_html_charset(encoding)
+    writer.write(html_css_file, [html_css])
+
+    def write(item: tuple[str, document.Document]) -> None:
+        name, doc = item
+        writer.write(
+            name + ".html", render_html(doc, css=html_css_file, charset=charset)
+        )
+
+    _map_workers(write, doc_dict.items(), max_workers=max_workers)
+
+
+def export_html_dict(
+    doc_dict: collections.abc.Mapping[str, document.Document],
+    dir: _types.StrOrBytesPath,
+    *,
+    mode: typing.Literal["w", "wt", "tw", "a", "at", "ta", "x", "xt", "tx"] = "w",
+    encoding: str | None = None,
+    errors: str | None = None,
+    newline: str | None = None,
+    max_workers: int | None = 1,
+    skip_unchanged: bool = False,
+    atomic: bool = False,
+) -> None:
+    with DirWriter(
+        dir,
+        mode=mode,
+        encoding=encoding,
+        errors=errors,
+        newline=newline,
+        skip_unchanged=skip_unchanged,
+        atomic=atomic,
+    ) as writer:
+        write_html_dict(writer, doc_dict, encoding=encoding, max_workers=max_workers)
+
+
+def write_search_index(
+    writer: DirWriter | ArchiveWriter,
+    index_dict: collections.abc.Mapping[str, collections.abc.Mapping[str, object]],
+    *,
+    prefix: str = "",
+) -> None:
+    import json
+
+    from . import search
+
+    def dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    shard_list: list[dict[str, object]] = []
+    for name, index in index_dict.items():
+        writer.write_bytes(prefix + name + ".json", dumps(index))
+        shard_list.append({"name": name, "file": name + ".json"})
+    writer.write_bytes(
+        prefix + "index.json",
+        dumps({"version": search.VERSION, "shards": shard_list}),
+    )
+
+
+def export_search_index(
+    index_dict: collections.abc.Mapping[str, collections.abc.Mapping[str, object]],
+    dir: _types.StrOrBytesPath,
+    *,
+    atomic: bool = False,
+) -> None:
+    with DirWriter(dir, atomic=atomic) as writer:
+        write_search_index(writer, index_dict)
+
+
+_sqlite_schema: typing.Final[str] = """\
+CREATE TABLE category (
+    category INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE logic_node_type (
+    type INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE component (
+    key TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category INTEGER NOT NULL REFERENCES category (category),
+    mass REAL NOT NULL,
+    value INTEGER NOT NULL,
+    flags INTEGER NOT NULL,
+    tags TEXT NOT NULL,
+    deprecated INTEGER NOT NULL,
+    orphaned INTEGER NOT NULL,
+    short_description TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE TABLE component_tag (
+    key TEXT NOT NULL REFERENCES component (key),
+    tag TEXT NOT NULL,
+    PRIMARY KEY (key, tag)
+);
+CREATE TABLE multibody (
+    key TEXT PRIMARY KEY REFERENCES component (key),
+    child_key TEXT,
+    child_file TEXT NOT NULL,
+    parent_mass REAL NOT NULL,
+    child_mass REAL NOT NULL
+);
+CREATE TABLE logic_node (
+    key TEXT NOT NULL REFERENCES component (key),
+    child INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    mode INTEGER NOT NULL,
+    type INTEGER NOT NULL REFERENCES logic_node_type (type),
+    label TEXT NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (key, child, idx)
+);
+CREATE TABLE voxel_bounds (
+    key TEXT PRIMARY KEY REFERENCES component (key),
+    min_x INTEGER NOT NULL,
+    min_y INTEGER NOT NULL,
+    min_z INTEGER NOT NULL,
+    max_x INTEGER NOT NULL,
+    max_y INTEGER NOT NULL,
+    max_z INTEGER NOT NULL
+);
+"""
+
+# Indexes are created after the rows are inserted, which is faster than updating
+# them on every insert.
+_sqlite_index: typing.Final[str] = """\
+CREATE INDEX component_category_index ON component (category);
+CREATE INDEX component_tag_tag_index ON component_tag (tag);
+CREATE INDEX logic_node_type_index ON logic_node (type);
+"""
+
+
+def export_database(db: "database.Database", file: _types.StrOrBytesPath) -> None:
+    import sqlite3
+
+    pathlib.Path(os.fsdecode(file)).unlink(missing_ok=True)
+    try:
+        _write_database(db, file)
+    except sqlite3.Error as exc:
+        raise DatabaseError(str(exc), file=file) from exc
+
+
+def _write_database(db: "database.Database", file: _types.StrOrBytesPath) -> None:
+    import sqlite3
+
+    with contextlib.closing(sqlite3.connect(file, autocommit=False)) as conn:
+        conn.executescript(_sqlite_schema)
+        conn.executemany("INSERT INTO category VALUES (?, ?)", db.category)
+        conn.executemany(
+            "INSERT INTO logic_node_type VALUES (?, ?)", db.logic_node_type
+        )
+        conn.executemany(
+            "INSERT INTO component VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            db.component,
+        )
+        conn.executemany("INSERT INTO component_tag VALUES (?, ?)", db.component_tag)
+        conn.executemany("INSERT INTO multibody VALUES (?, ?, ?, ?, ?)", db.multibody)
+        conn.executemany(
+            "INSERT INTO logic_node VALUES (?, ?, ?, ?, ?, ?, ?)", db.logic_node
+        )
+        conn.executemany(
+            "INSERT INTO voxel_bounds VALUES (?, ?, ?, ?, ?, ?, ?)", db.voxel_bounds
         )
+        conn.executescript(_sqlite_index)
+        conn.commit()
@@ -2,6 +2,7 @@ import collections.abc
 import os
 import pathlib
 import typing
+import weakref
 
 from . import _types
 from . import component
@@ -9,6 +10,10 @@ from . import document
 from . import language
 from . import template
 
+# The database and search index modules are only needed by their output modes.
+if typing.TYPE_CHECKING:
+    from . import database
+
 
 class LabelKeyError(KeyError):
     def __init__(self, key: str) -> None:
@@ -28,6 +33,161 @@ class LabelMissingPlaceholderError(Exception):
         return f"missing placeholder in label text for key {self.key!r}"
 
 
+class DocumentNameError(Exception):
+    def __init__(self, msg: str, *, file: _types.StrOrBytesPath | None = None) -> None:
+        super().__init__(msg, file)
+        self.msg: typing.Final[str] = msg
+        self.file: typing.Final[_types.StrOrBytesPath | None] = file
+
+    def __str__(self) -> str:
+        if self.file is None:
+            return self.msg
+        file = os.fsdecode(self.file)
+        return f"{self.msg} (in file '{file}')"
+
+
+class Label(collections.abc.Mapping[str, str]):
+    def __init__(self, label: collections.abc.Mapping[str, str]) -> None:
+        super().__init__()
+        self._d = dict(label)
+        self._d_part = {key: text.split("{}") for key, text in self._d.items()}
+
+    def __getitem__(self, key: str) -> str:
+        return self._d[key]
+
+    def __iter__(self) -> collections.abc.Iterator[str]:
+        return iter(self._d)
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(self._d)})"
+
+    def format(self, key: str, repl: str) -> str:
+        try:
+            part_list = self._d_part[key]
+        except KeyError as exc:
+            raise LabelKeyError(key) from exc
+        if len(part_list) < 2:
+            raise LabelMissingPlaceholderError(key)
+        return repl.join(part_list)
+
+
+# label keys used by each generator, mapped to whether the text needs a "{}" placeholder
+document_label_key_dict: typing.Final[collections.abc.Mapping[str, bool]] = {
+    "DOCUMENT_PROP_MASS": True,
+    "DOCUMENT_PROP_MASS_PARENT": True,
+    "DOCUMENT_PROP_MASS_CHILD": True,
+    "DOCUMENT_PROP_DIMS": True,
+    "DOCUMENT_PROP_DIMS_PARENT": True,
+    "DOCUMENT_PROP_DIMS_CHILD": True,
+    "DOCUMENT_PROP_COST": True,
+    "DOCUMENT_PROP_TAGS": True,
+    "DOCUMENT_PROP_FILE": True,
+    "DOCUMENT_PROP_FILE_PARENT": True,
+    "DOCUMENT_PROP_FILE_CHILD": True,
+    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_TYPE": False,
+    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_LABEL": False,
+    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_DESC": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_BODY": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_TYPE": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_LABEL": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_DESC": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_PARENT": False,
+    "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_CHILD": False,
+    "DOCUMENT_DEPRECATED_TEXT": False,
+    "DOCUMENT_ORPHANED_TEXT": False,
+}
+
+sheet_label_key_dict: typing.Final[collections.abc.Mapping[str, bool]] = {
+    "SHEET_HEAD_NAME": False,
+    "SHEET_HEAD_FILE": False,
+    "SHEET_HEAD_CATEGORY": False,
+    "SHEET_HEAD_TAGS": False,
+    "SHEET_HEAD_MULTIBODY": False,
+    "SHEET_HEAD_DEPRECATED": False,
+    "SHEET_HEAD_ORPHANED": False,
+    "SHEET_HEAD_COST": False,
+    "SHEET_HEAD_MASS": False,
+    "SHEET_HEAD_DIMS_WIDTH": False,
+    "SHEET_HEAD_DIMS_DEPTH": False,
+    "SHEET_HEAD_DIMS_HEIGHT": False,
+    "SHEET_HEAD_SDESC": False,
+    "SHEET_HEAD_DESC": False,
+}
+
+
+def document_label_key_list(
+    comp_list: collections.abc.Iterable[component.Component],
+) -> list[str]:
+    key_set: set[str] = set()
+    for comp in comp_list:
+        key_set.update(
+            [
+                "DOCUMENT_PROP_MASS",
+                "DOCUMENT_PROP_DIMS",
+                "DOCUMENT_PROP_COST",
+                "DOCUMENT_PROP_TAGS",
+            ]
+        )
+        if component.Flags.IS_DEPRECATED in comp.defn.flags:
+            key_set.add("DOCUMENT_DEPRECATED_TEXT")
+        if component.Flags.MULTIBODY_CHILD in comp.defn.flags:
+            key_set.add("DOCUMENT_ORPHANED_TEXT")
+
+        if isinstance(comp, component.Multibody):
+            key_set.update(
+                [
+                    "DOCUMENT_PROP_MASS_PARENT",
+                    "DOCUMENT_PROP_MASS_CHILD",
+                    "DOCUMENT_PROP_DIMS_PARENT",
+                    "DOCUMENT_PROP_DIMS_CHILD",
+                    "DOCUMENT_PROP_FILE_PARENT",
+                    "DOCUMENT_PROP_FILE_CHILD",
+                ]
+            )
+            if len(comp.defn.logic_nodes) > 0 or len(comp.child.logic_nodes) > 0:
+                key_set.update(
+                    [
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_BODY",
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_TYPE",
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_LABEL",
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_DESC",
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_PARENT",
+                        "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_CHILD",
+                    ]
+                )
+        else:
+            key_set.add("DOCUMENT_PROP_FILE")
+            if len(comp.defn.logic_nodes) > 0:
+                key_set.update(
+                    [
+                        "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_TYPE",
+                        "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_LABEL",
+                        "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_DESC",
+                    ]
+                )
+    return [key for key in document_label_key_dict if key in key_set]
+
+
+def _check_label(
+    label: collections.abc.Mapping[str, str],
+    key_dict: collections.abc.Mapping[str, bool],
+    key_list: collections.abc.Iterable[str],
+) -> list[LabelKeyError | LabelMissingPlaceholderError]:
+    key_set = set(key_list)
+    exc_list: list[LabelKeyError | LabelMissingPlaceholderError] = []
+    for key, placeholder in key_dict.items():
+        text = label.get(key)
+        if text is None:
+            if key in key_set:
+                exc_list.append(LabelKeyError(key))
+        elif placeholder and "{}" not in text:
+            exc_list.append(LabelMissingPlaceholderError(key))
+    return exc_list
+
+
 def _label_get(
     label: collections.abc.Mapping[str, str] | None,
     key: str,
@@ -35,6 +195,8 @@ def _label_get(
 ) -> str:
     if label is None:
         return key
+    if repl is not None and isinstance(label, Label):
+        return label.format(key, repl)
     try:
         text = label[key]
     except KeyError as exc:
@@ -46,9 +208,39 @@ def _label_get(
     return text
 
 
+_lang_fixed_en_list: typing.Final[list[str]] = [
+    "PROPERTIES",
+    "logic inputs",
+    "logic outputs",
+    "connections",
+    *(str(ln_type) for ln_type in component.LogicNodeType),
+]
+
+# Language defines __eq__ and is therefore unhashable, so the cache is keyed by id() and
+# each entry is removed when its Language is collected.
+_lang_fixed_cache: dict[int, dict[str, str]] = {}
+
+
+def _lang_fixed_dict(lang: language.Language) -> dict[str, str]:
+    fixed_dict = _lang_fixed_cache.get(id(lang))
+    if fixed_dict is None:
+        fixed_dict = {}
+        for lang_en in _lang_fixed_en_list:
+            trans_list = lang.find_en_all(lang_en)
+            if len(trans_list) > 0:
+                fixed_dict[lang_en] = trans_list[0].local
+        _lang_fixed_cache[id(lang)] = fixed_dict
+        weakref.finalize(lang, _lang_fixed_cache.pop, id(lang), None)
+    return fixed_dict
+
+
 def _lang_find_en(lang: language.Language | None, lang_en: str) -> str:
     if lang is None:
         return lang_en
+    try:
+        return _lang_fixed_dict(lang)[lang_en]
+    except KeyError:
+        pass
     return lang.find_en(lang_en).local
 
 
@@ -58,6 +250,14 @@ def _lang_translate(lang: language.Language | None, text: language.Text) -> str:
     return lang.translate(text)
 
 
+def _lang_translate_many(
+    lang: language.Language | None, texts: collections.abc.Iterable[language.Text]
+) -> list[str]:
+    if lang is None:
+        return [text.en for text in texts]
+    return lang.translate_many(texts)
+
+
 def _bind_format(bind: collections.abc.Mapping[str, str] | None, s: str) -> str:
     if bind is not None:
         s = template.format(s, bind)
@@ -69,34 +269,92 @@ def _classify_logic(
 ) -> tuple[
     list[component.LogicNode], list[component.LogicNode], list[component.LogicNode]
 ]:
-    in_list: list[component.LogicNode] = []
-    out_list: list[component.LogicNode] = []
-    conn_list: list[component.LogicNode] = []
-    for ln in lns:
-        if (
-            ln.type is component.LogicNodeType.BOOL
-            or ln.type is component.LogicNodeType.FLOAT
-            or ln.type is component.LogicNodeType.COMPOSITE
-            or ln.type is component.LogicNodeType.VIDEO
-            or ln.type is component.LogicNodeType.AUDIO
-        ):
-            if ln.mode is component.LogicNodeMode.INPUT:
-                in_list.append(ln)
-                continue
-            if ln.mode is component.LogicNodeMode.OUTPUT:
-                out_list.append(ln)
-                continue
-            typing.assert_never(ln.mode)
-        if (
-            ln.type is component.LogicNodeType.TORQUE
-            or ln.type is component.LogicNodeType.WATER
-            or ln.type is component.LogicNodeType.ELECTRIC
-            or ln.type is component.LogicNodeType.ROPE
-        ):
-            conn_list.append(ln)
-            continue
-        typing.assert_never(ln.type)
-    return in_list, out_list, conn_list
+    return lns.classify()
+
+
+def _document_lang_fixed_en_list(
+    comp_list: collections.abc.Iterable[component.Component],
+) -> list[str]:
+    lang_en_set: set[str] = set()
+    for comp in comp_list:
+        lang_en_set.add("PROPERTIES")
+        lns_list = [comp.defn.logic_nodes]
+        if isinstance(comp, component.Multibody):
+            lns_list.append(comp.child.logic_nodes)
+        for lns in lns_list:
+            for head, ln_list in zip(
+                ["logic inputs", "logic outputs", "connections"], _classify_logic(lns)
+            ):
+                if len(ln_list) > 0:
+                    lang_en_set.add(head)
+                    lang_en_set.update(str(ln.type) for ln in ln_list)
+    return [lang_en for lang_en in _lang_fixed_en_list if lang_en in lang_en_set]
+
+
+def validate(
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    label: collections.abc.Mapping[str, str] | None = None,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+    mode: typing.Literal["document", "sheet", "database", "json"] = "document",
+) -> None:
+    def check(text: language.Text, *, formatted: bool) -> None:
+        s = text.en
+        if lang is not None:
+            try:
+                s = lang.translate(text)
+            except language.LanguageFindError as exc:
+                exc_key = ("id", text.id) if text.id is not None else ("en", text.en)
+                exc_dict.setdefault(exc_key, exc)
+                return
+        if bind is not None and formatted:
+            for key in template.keys(s):
+                if key not in bind:
+                    exc_dict.setdefault(("bind", key), template.TemplateKeyError(key))
+
+    def check_logic(lns: component.LogicNodeList) -> None:
+        for ln in lns:
+            check(ln.label, formatted=True)
+            check(ln.description, formatted=True)
+
+    comp_list = list(comp_list)
+    label_key_dict: collections.abc.Mapping[str, bool] = {}
+    label_key_list: list[str] = []
+    lang_fixed_en_list: list[str] = []
+    if mode == "document":
+        label_key_dict = document_label_key_dict
+        label_key_list = document_label_key_list(comp_list)
+        lang_fixed_en_list = _document_lang_fixed_en_list(comp_list)
+    elif mode == "sheet":
+        label_key_dict = sheet_label_key_dict
+        label_key_list = list(sheet_label_key_dict)
+    elif mode == "database":
+        lang_fixed_en_list = [str(ln_type) for ln_type in component.LogicNodeType]
+    elif mode == "json":
+        pass
+    else:
+        typing.assert_never(mode)
+
+    exc_dict: dict[tuple[str, str], Exception] = {}
+    if label is not None:
+        for exc in _check_label(label, label_key_dict, label_key_list):
+            exc_dict[("label", exc.key)] = exc
+    if lang is not None:
+        fixed_dict = _lang_fixed_dict(lang)
+        for lang_en in lang_fixed_en_list:
+            if lang_en not in fixed_dict:
+                exc_dict[("en", lang_en)] = language.LanguageFindEnError(lang_en)
+    for comp in comp_list:
+        check(comp.name(), formatted=False)
+        check(comp.short_description(), formatted=True)
+        check(comp.description(), formatted=True)
+        if mode != "sheet":
+            check_logic(comp.defn.logic_nodes)
+            if isinstance(comp, component.Multibody):
+                check_logic(comp.child.logic_nodes)
+    if len(exc_dict) > 0:
+        raise ExceptionGroup("invalid labels or translations", list(exc_dict.values()))
 
 
 def generate_document_property_list(
@@ -192,10 +450,11 @@ def generate_document_property(
     *,
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
+    level: int = 1,
 ) -> document.Document:
     return document.Document(
         [
-            document.Heading(_lang_find_en(lang, "PROPERTIES")),
+            document.Heading(_lang_find_en(lang, "PROPERTIES"), level=level),
             generate_document_property_list(comp, label=label),
         ]
     )
@@ -218,9 +477,8 @@ def generate_document_logic_table_normal(
     data = document.TableData(head)
     for ln in ln_list:
         ln_type = _lang_find_en(lang, str(ln.type))
-        ln_label = _lang_translate(lang, ln.label)
+        ln_label, ln_desc = _lang_translate_many(lang, [ln.label, ln.description])
         ln_label = _bind_format(bind, ln_label)
-        ln_desc = _lang_translate(lang, ln.description)
         ln_desc = _bind_format(bind, ln_desc)
         data.append(document.TableDataRow([ln_type, ln_label, ln_desc]))
     return document.Table(data)
@@ -232,25 +490,26 @@ def generate_document_logic_normal(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
     in_list, out_list, conn_list = _classify_logic(lns)
     doc = document.Document()
     if len(in_list) > 0:
-        in_head = document.Heading(_lang_find_en(lang, "logic inputs"))
+        in_head = document.Heading(_lang_find_en(lang, "logic inputs"), level=level)
         in_tbl = generate_document_logic_table_normal(
             in_list, label=label, lang=lang, bind=bind
         )
         doc.append(in_head)
         doc.append(in_tbl)
     if len(out_list) > 0:
-        out_head = document.Heading(_lang_find_en(lang, "logic outputs"))
+        out_head = document.Heading(_lang_find_en(lang, "logic outputs"), level=level)
         out_tbl = generate_document_logic_table_normal(
             out_list, label=label, lang=lang, bind=bind
         )
         doc.append(out_head)
         doc.append(out_tbl)
     if len(conn_list) > 0:
-        conn_head = document.Heading(_lang_find_en(lang, "connections"))
+        conn_head = document.Heading(_lang_find_en(lang, "connections"), level=level)
         conn_tbl = generate_document_logic_table_normal(
             conn_list, label=label, lang=lang, bind=bind
         )
@@ -272,9 +531,8 @@ def generate_document_logic_table_multibody(
     ) -> collections.abc.Iterable[document.TableDataRow]:
         for ln in ln_list:
             ln_type = _lang_find_en(lang, str(ln.type))
-            ln_label = _lang_translate(lang, ln.label)
+            ln_label, ln_desc = _lang_translate_many(lang, [ln.label, ln.description])
             ln_label = _bind_format(bind, ln_label)
-            ln_desc = _lang_translate(lang, ln.description)
             ln_desc = _bind_format(bind, ln_desc)
             yield document.TableDataRow([body, ln_type, ln_label, ln_desc])
 
@@ -302,6 +560,7 @@ def generate_document_logic_multibody(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
     parent_ln_list_tuple = _classify_logic(parent_lns)
     parent_in_ln_list, parent_out_ln_list, parent_conn_ln_list = parent_ln_list_tuple
@@ -310,21 +569,21 @@ def generate_document_logic_multibody(
 
     doc = document.Document()
     if len(parent_in_ln_list) > 0 or len(child_in_ln_list) > 0:
-        in_head = document.Heading(_lang_find_en(lang, "logic inputs"))
+        in_head = document.Heading(_lang_find_en(lang, "logic inputs"), level=level)
         in_tbl = generate_document_logic_table_multibody(
             parent_in_ln_list, child_in_ln_list, label=label, lang=lang, bind=bind
         )
         doc.append(in_head)
         doc.append(in_tbl)
     if len(parent_out_ln_list) > 0 or len(child_out_ln_list) > 0:
-        out_head = document.Heading(_lang_find_en(lang, "logic outputs"))
+        out_head = document.Heading(_lang_find_en(lang, "logic outputs"), level=level)
         out_tbl = generate_document_logic_table_multibody(
             parent_out_ln_list, child_out_ln_list, label=label, lang=lang, bind=bind
         )
         doc.append(out_head)
         doc.append(out_tbl)
     if len(parent_conn_ln_list) > 0 or len(child_conn_ln_list) > 0:
-        conn_head = document.Heading(_lang_find_en(lang, "connections"))
+        conn_head = document.Heading(_lang_find_en(lang, "connections"), level=level)
         conn_tbl = generate_document_logic_table_multibody(
             parent_conn_ln_list, child_conn_ln_list, label=label, lang=lang, bind=bind
         )
@@ -339,6 +598,7 @@ def generate_document_logic(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
     if isinstance(comp, component.Multibody):
         return generate_document_logic_multibody(
@@ -347,12 +607,14 @@ def generate_document_logic(
             label=label,
             lang=lang,
             bind=bind,
+            level=level,
         )
     return generate_document_logic_normal(
         comp.defn.logic_nodes,
         label=label,
         lang=lang,
         bind=bind,
+        level=level,
     )
 
 
@@ -362,13 +624,16 @@ def generate_document_component(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
     doc = document.Document()
 
-    comp_name = _lang_translate(lang, comp.name())
+    comp_name, comp_s_desc, comp_desc = _lang_translate_many(
+        lang, [comp.name(), comp.short_description(), comp.description()]
+    )
     if component.Flags.IS_DEPRECATED in comp.defn.flags:
         comp_name += " (Deprecated)"
-    doc.append(document.Heading(comp_name))
+    doc.append(document.Heading(comp_name, level=level))
 
     if component.Flags.IS_DEPRECATED in comp.defn.flags:
         doc.append(
@@ -386,24 +651,20 @@ def generate_document_component(
             )
         )
 
-    comp_s_desc_text = comp.short_description()
-    comp_s_desc = _lang_translate(lang, comp_s_desc_text)
     comp_s_desc = _bind_format(bind, comp_s_desc)
     if comp_s_desc != "":
         doc.append(document.Paragraph(comp_s_desc))
 
-    comp_desc_text = comp.description()
-    comp_desc = _lang_translate(lang, comp_desc_text)
     comp_desc = _bind_format(bind, comp_desc)
     if comp_desc != "":
         doc.append(document.Paragraph(comp_desc))
 
-    prop_doc = generate_document_property(comp, label=label, lang=lang)
-    prop_doc.shift(1)
+    prop_doc = generate_document_property(comp, label=label, lang=lang, level=level + 1)
     doc.extend(prop_doc)
 
-    logic_doc = generate_document_logic(comp, label=label, lang=lang, bind=bind)
-    logic_doc.shift(1)
+    logic_doc = generate_document_logic(
+        comp, label=label, lang=lang, bind=bind, level=level + 1
+    )
     doc.extend(logic_doc)
 
     return doc
@@ -415,14 +676,29 @@ def generate_document_component_list(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
     doc = document.Document()
     for comp in comp_list:
-        comp_doc = generate_document_component(comp, label=label, lang=lang, bind=bind)
+        comp_doc = generate_document_component(
+            comp, label=label, lang=lang, bind=bind, level=level
+        )
         doc.extend(comp_doc)
     return doc
 
 
+def _sort_key_component(
+    comp: component.Component,
+) -> tuple[bool, bool, str, bool, str]:
+    return (
+        component.Flags.MULTIBODY_CHILD in comp.defn.flags,
+        component.Flags.IS_DEPRECATED in comp.defn.flags,
+        comp.name().en.upper(),
+        comp.defn.key is None,
+        comp.defn.key or "",
+    )
+
+
 def generate_document_category(
     category: component.Category,
     comp_list: collections.abc.Iterable[component.Component],
@@ -430,38 +706,32 @@ def generate_document_category(
     label: collections.abc.Mapping[str, str] | None = None,
     lang: language.Language | None = None,
     bind: collections.abc.Mapping[str, str] | None = None,
+    level: int = 1,
 ) -> document.Document:
-    def sort_key_component(
-        comp: component.Component,
-    ) -> tuple[bool, bool, str, bool, str]:
-        return (
-            component.Flags.MULTIBODY_CHILD in comp.defn.flags,
-            component.Flags.IS_DEPRECATED in comp.defn.flags,
-            comp.name().en.upper(),
-            comp.defn.key is None,
-            comp.defn.key or "",
-        )
-
     comp_list = list(comp_list)
     for comp in comp_list:
         if comp.category() is not category:
             raise ValueError
-    comp_list.sort(key=sort_key_component)
+    comp_list.sort(key=_sort_key_component)
 
     comp_list_doc = generate_document_component_list(
         comp_list,
         label=label,
         lang=lang,
         bind=bind,
+        level=level + 1,
     )
-    comp_list_doc.shift(1)
 
     doc = document.Document()
-    doc.append(document.Heading(str(category)))
+    doc.append(document.Heading(str(category), level=level))
     doc.extend(comp_list_doc)
     return doc
 
 
+def generate_document_name(category: component.Category) -> str:
+    return f"{category.value:02d}_{category.name}"
+
+
 def generate_document(
     comp_list: collections.abc.Iterable[component.Component],
     *,
@@ -485,7 +755,7 @@ def generate_document(
     for category in category_list:
         category_comp_list = category_comp_dict[category]
 
-        doc_name = f"{category.value:02d}_{category.name}"
+        doc_name = generate_document_name(category)
         doc = generate_document_category(
             category,
             category_comp_list,
@@ -497,6 +767,79 @@ def generate_document(
     return doc_dict
 
 
+def generate_document_category_index(
+    category: component.Category,
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    lang: language.Language | None = None,
+) -> document.Document:
+    comp_list = list(comp_list)
+    for comp in comp_list:
+        if comp.category() is not category:
+            raise ValueError
+    comp_list.sort(key=_sort_key_component)
+
+    li_list: list[document.ListItem] = []
+    for comp in comp_list:
+        comp_name = _lang_translate(lang, comp.name())
+        if component.Flags.IS_DEPRECATED in comp.defn.flags:
+            comp_name += " (Deprecated)"
+        li_list.append(document.ListItem(comp_name, link=comp.defn.key))
+
+    doc = document.Document()
+    doc.append(document.Heading(str(category)))
+    doc.append(document.UnorderedList(li_list))
+    return doc
+
+
+def generate_document_split_component(
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    label: collections.abc.Mapping[str, str] | None = None,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> dict[str, document.Document]:
+    category_comp_dict: dict[component.Category, list[component.Component]] = {}
+    for comp in comp_list:
+        category_comp_list = category_comp_dict.setdefault(comp.category(), [])
+        category_comp_list.append(comp)
+
+    doc_dict: dict[str, document.Document] = {}
+    for category in sorted(category_comp_dict, key=lambda category: category.value):
+        category_comp_list = category_comp_dict[category]
+        doc_name = generate_document_name(category)
+        doc_dict[doc_name] = generate_document_category_index(
+            category, category_comp_list, lang=lang
+        )
+
+    comp_dict: dict[str, component.Component] = {}
+    for category_comp_list in category_comp_dict.values():
+        for comp in category_comp_list:
+            key = comp.defn.key
+            if key is None:
+                raise DocumentNameError(
+                    "component without key cannot have its own document",
+                    file=comp.defn.file,
+                )
+            other_comp = comp_dict.get(key)
+            if other_comp is not None:
+                other_file = os.fsdecode(other_comp.defn.file or "")
+                raise DocumentNameError(
+                    f"component key {key!r} is also used by the component in file '{other_file}'",
+                    file=comp.defn.file,
+                )
+            if key in doc_dict:
+                raise DocumentNameError(
+                    f"component key {key!r} conflicts with the category index document",
+                    file=comp.defn.file,
+                )
+            comp_dict[key] = comp
+            doc_dict[key] = generate_document_component(
+                comp, label=label, lang=lang, bind=bind
+            )
+    return doc_dict
+
+
 def generate_sheet_component(
     comp: component.Component,
     *,
@@ -596,3 +939,255 @@ def generate_sheet(
     record_list = [header]
     record_list.extend(generate_sheet_component_list(comp_list, lang=lang, bind=bind))
     return record_list
+
+
+def generate_database_component(
+    comp: component.Component,
+    db: "database.Database",
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> None:
+    from . import database
+
+    def file_fn(file: _types.StrOrBytesPath | None) -> str:
+        if file is None:
+            return ""
+        file = os.fsdecode(file)
+        file = pathlib.PurePath(file)
+        return file.name
+
+    def logic_fn(lns: component.LogicNodeList, child: bool) -> None:
+        for idx, ln in enumerate(lns):
+            ln_label = _lang_translate(lang, ln.label)
+            ln_label = _bind_format(bind, ln_label)
+            ln_desc = _lang_translate(lang, ln.description)
+            ln_desc = _bind_format(bind, ln_desc)
+            db.logic_node.append(
+                database.LogicNodeRow(
+                    key=comp.defn.key,
+                    child=child,
+                    idx=idx,
+                    mode=ln.mode.value,
+                    type=ln.type.value,
+                    label=ln_label,
+                    description=ln_desc,
+                )
+            )
+
+    comp_s_desc = _lang_translate(lang, comp.short_description())
+    comp_s_desc = _bind_format(bind, comp_s_desc)
+    comp_desc = _lang_translate(lang, comp.description())
+    comp_desc = _bind_format(bind, comp_desc)
+    db.component.append(
+        database.ComponentRow(
+            key=comp.defn.key,
+            file=file_fn(comp.defn.file),
+            name=_lang_translate(lang, comp.name()),
+            category=comp.category().value,
+            mass=comp.mass(),
+            value=comp.value(),
+            flags=comp.defn.flags.value,
+            tags=comp.tags(),
+            deprecated=component.Flags.IS_DEPRECATED in comp.defn.flags,
+            orphaned=component.Flags.MULTIBODY_CHILD in comp.defn.flags,
+            short_description=comp_s_desc,
+            description=comp_desc,
+        )
+    )
+
+    tag_list = [tag.strip() for tag in comp.tags().split(",")]
+    tag_list = [tag for tag in dict.fromkeys(tag_list) if tag != ""]
+    db.component_tag.extend(
+        database.ComponentTagRow(key=comp.defn.key, tag=tag) for tag in tag_list
+    )
+
+    if isinstance(comp, component.Multibody):
+        db.multibody.append(
+            database.MultibodyRow(
+                key=comp.defn.key,
+                child_key=comp.child.key,
+                child_file=file_fn(comp.child.file),
+                parent_mass=comp.defn.mass,
+                child_mass=comp.child.mass,
+            )
+        )
+
+    logic_fn(comp.defn.logic_nodes, False)
+    if isinstance(comp, component.Multibody):
+        logic_fn(comp.child.logic_nodes, True)
+
+    voxel_min = comp.voxel_min()
+    voxel_max = comp.voxel_max()
+    db.voxel_bounds.append(
+        database.VoxelBoundsRow(
+            key=comp.defn.key,
+            min_x=voxel_min.x,
+            min_y=voxel_min.y,
+            min_z=voxel_min.z,
+            max_x=voxel_max.x,
+            max_y=voxel_max.y,
+            max_z=voxel_max.z,
+        )
+    )
+
+
+def generate_database(
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> "database.Database":
+    from . import database
+
+    db = database.Database()
+    db.category.extend(
+        database.CategoryRow(category=category.value, name=str(category))
+        for category in component.Category
+    )
+    db.logic_node_type.extend(
+        database.LogicNodeTypeRow(type=typ.value, name=_lang_find_en(lang, str(typ)))
+        for typ in component.LogicNodeType
+    )
+    for comp in comp_list:
+        generate_database_component(comp, db, lang=lang, bind=bind)
+    return db
+
+
+def generate_json_logic_node(
+    ln: component.LogicNode,
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> dict[str, object]:
+    ln_label = _lang_translate(lang, ln.label)
+    ln_label = _bind_format(bind, ln_label)
+    ln_desc = _lang_translate(lang, ln.description)
+    ln_desc = _bind_format(bind, ln_desc)
+    return {
+        "label": ln_label,
+        "mode": ln.mode.value,
+        "type": ln.type.value,
+        "description": ln_desc,
+    }
+
+
+def generate_json_definition(
+    defn: component.Definition,
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> dict[str, object]:
+    defn_file = None
+    if defn.file is not None:
+        defn_file = os.fsdecode(defn.file)
+        defn_file = pathlib.PurePath(defn_file).name
+
+    voxel_min = defn.voxel_min()
+    voxel_max = defn.voxel_max()
+    return {
+        "key": defn.key,
+        "file": defn_file,
+        "mass": defn.mass,
+        "flags": defn.flags.value,
+        "logic_nodes": [
+            generate_json_logic_node(ln, lang=lang, bind=bind)
+            for ln in defn.logic_nodes
+        ],
+        "voxel_min": {"x": voxel_min.x, "y": voxel_min.y, "z": voxel_min.z},
+        "voxel_max": {"x": voxel_max.x, "y": voxel_max.y, "z": voxel_max.z},
+    }
+
+
+def generate_json_component(
+    comp: component.Component,
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> dict[str, object]:
+    comp_s_desc = _lang_translate(lang, comp.short_description())
+    comp_s_desc = _bind_format(bind, comp_s_desc)
+    comp_desc = _lang_translate(lang, comp.description())
+    comp_desc = _bind_format(bind, comp_desc)
+
+    comp_child = None
+    if isinstance(comp, component.Multibody):
+        comp_child = generate_json_definition(comp.child, lang=lang, bind=bind)
+
+    voxel_min = comp.voxel_min()
+    voxel_max = comp.voxel_max()
+    return {
+        "key": comp.defn.key,
+        "name": _lang_translate(lang, comp.name()),
+        "short_description": comp_s_desc,
+        "description": comp_desc,
+        "category": comp.category().value,
+        "mass": comp.mass(),
+        "value": comp.value(),
+        "tags": comp.tags(),
+        "deprecated": component.Flags.IS_DEPRECATED in comp.defn.flags,
+        "orphaned": component.Flags.MULTIBODY_CHILD in comp.defn.flags,
+        "voxel_min": {"x": voxel_min.x, "y": voxel_min.y, "z": voxel_min.z},
+        "voxel_max": {"x": voxel_max.x, "y": voxel_max.y, "z": voxel_max.z},
+        "parent": generate_json_definition(comp.defn, lang=lang, bind=bind),
+        "child": comp_child,
+    }
+
+
+def generate_jsonl(
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> collections.abc.Iterator[str]:
+    import json
+
+    for comp in comp_list:
+        obj = generate_json_component(comp, lang=lang, bind=bind)
+        yield json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def generate_search_index_component(
+    comp: component.Component,
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> list[str]:
+    text_list = [
+        _lang_translate(lang, comp.name()),
+        _bind_format(bind, _lang_translate(lang, comp.short_description())),
+        _bind_format(bind, _lang_translate(lang, comp.description())),
+        comp.tags(),
+    ]
+    defn_list = [comp.defn]
+    if isinstance(comp, component.Multibody):
+        defn_list.append(comp.child)
+    for defn in defn_list:
+        for ln in defn.logic_nodes:
+            text_list.append(_bind_format(bind, _lang_translate(lang, ln.label)))
+    return text_list
+
+
+def generate_search_index(
+    comp_list: collections.abc.Iterable[component.Component],
+    *,
+    lang: language.Language | None = None,
+    bind: collections.abc.Mapping[str, str] | None = None,
+) -> dict[str, dict[str, object]]:
+    from . import search
+
+    builder_dict: dict[component.Category, search.IndexBuilder] = {}
+    for comp in comp_list:
+        builder = builder_dict.get(comp.category())
+        if builder is None:
+            builder = search.IndexBuilder()
+            builder_dict[comp.category()] = builder
+        builder.add(
+            [comp.defn.key or "", _lang_translate(lang, comp.name())],
+            generate_search_index_component(comp, lang=lang, bind=bind),
+        )
+
+    return {
+        generate_document_name(category): builder_dict[category].build()
+        for category in sorted(builder_dict, key=lambda category: category.value)
+    }
@@ -82,9 +82,13 @@ class Language(container.Sequence[Translation]):
 
         self._d_id: dict[str, list[Translation]] = {}
         self._d_en: dict[str, list[Translation]] = {}
+        self._d_id_first: dict[str, Translation] = {}
+        self._d_en_first: dict[str, Translation] = {}
         for trans in self:
             self._d_id.setdefault(trans.id, []).append(trans)
             self._d_en.setdefault(trans.en, []).append(trans)
+            self._d_id_first.setdefault(trans.id, trans)
+            self._d_en_first.setdefault(trans.en, trans)
 
     @classmethod
     def _from_io(cls, f: collections.abc.Iterable[str]) -> typing.Self:
@@ -133,19 +137,19 @@ class Language(container.Sequence[Translation]):
         return self._d_id.get(id, [])[:]
 
     def find_id(self, id: str) -> Translation:
-        trans_list = self.find_id_all(id)
-        if len(trans_list) <= 0:
+        trans = self._d_id_first.get(id)
+        if trans is None:
             raise LanguageFindIDError(id)
-        return trans_list[0]
+        return trans
 
     def find_en_all(self, en: str) -> list[Translation]:
         return self._d_en.get(en, [])[:]
 
     def find_en(self, en: str) -> Translation:
-        trans_list = self.find_en_all(en)
-        if len(trans_list) <= 0:
+        trans = self._d_en_first.get(en)
+        if trans is None:
             raise LanguageFindEnError(en)
-        return trans_list[0]
+        return trans
 
     def translate(self, text: Text) -> str:
         if text.id is not None:
@@ -153,3 +157,20 @@ class Language(container.Sequence[Translation]):
         else:
             trans = self.find_en(text.en)
         return trans.local
+
+    def translate_many(self, texts: collections.abc.Iterable[Text]) -> list[str]:
+        d_id = self._d_id_first
+        d_en = self._d_en_first
+
+        local_list: list[str] = []
+        for text in texts:
+            if text.id is not None:
+                trans = d_id.get(text.id)
+                if trans is None:
+                    raise LanguageFindIDError(text.id)
+            else:
+                trans = d_en.get(text.en)
+                if trans is None:
+                    raise LanguageFindEnError(text.en)
+            local_list.append(trans.local)
+        return local_list
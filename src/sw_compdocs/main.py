@@ -1,21 +1,20 @@
 import argparse
 import collections.abc
-import csv
-import lxml.etree
 import os
 import sys
 import typing
 
 from . import _types
-from . import component
-from . import generator
-from . import language
-from . import exporter
-from . import resource
-from . import steamfind
-from . import template
 from . import wraperr
 
+# Modules other than the above are imported where they are used, so that the CLI
+# starts quickly and only loads what the selected mode needs.
+if typing.TYPE_CHECKING:
+    import lxml.etree
+
+    from . import component
+    from . import language
+
 
 class ShowHideAction(argparse.Action):
     def __init__(
@@ -59,42 +58,142 @@ class ShowHideAction(argparse.Action):
         return " | ".join(self.option_strings)
 
 
-def generate_document(
+def _generate_pages(
     *,
+    out_format: typing.Literal["markdown", "html"],
     out_dir: _types.StrOrBytesPath,
-    comp_list: collections.abc.Iterable[component.Component],
+    comp_list: collections.abc.Sequence["component.Component"],
     label: collections.abc.Mapping[str, str] | None,
-    lang: language.Language | None,
+    lang: "language.Language | None",
     bind: collections.abc.Mapping[str, str] | None,
     out_encoding: str | None = None,
     out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
+    out_split: typing.Literal["category", "component"] = "category",
+    out_atomic: bool = False,
+    search_index: bool = False,
 ) -> None:
+    from . import exporter
+    from . import generator
+
+    generator.validate(comp_list, label=label, lang=lang, bind=bind)
+    if label is not None:
+        label = generator.Label(label)
+
     if out_encoding is None:
         out_encoding = "utf-8"
     if out_newline is None:
         out_newline = "\n"
 
-    doc_dict = generator.generate_document(comp_list, label=label, lang=lang, bind=bind)
-    exporter.export_markdown_dict(
-        doc_dict,
+    if out_split == "category":
+        doc_dict = generator.generate_document(
+            comp_list, label=label, lang=lang, bind=bind
+        )
+    elif out_split == "component":
+        doc_dict = generator.generate_document_split_component(
+            comp_list, label=label, lang=lang, bind=bind
+        )
+    else:
+        typing.assert_never(out_split)
+
+    index_dict = None
+    if search_index:
+        index_dict = generator.generate_search_index(comp_list, lang=lang, bind=bind)
+
+    max_workers = None if out_split == "component" else 1
+    with exporter.open_writer(
         out_dir,
-        mode="w",
         encoding=out_encoding,
         errors="strict",
         newline=out_newline,
+        skip_unchanged=out_split == "component",
+        atomic=out_atomic,
+    ) as writer:
+        if out_format == "markdown":
+            exporter.write_markdown_dict(writer, doc_dict, max_workers=max_workers)
+        elif out_format == "html":
+            exporter.write_html_dict(
+                writer, doc_dict, encoding=out_encoding, max_workers=max_workers
+            )
+        else:
+            typing.assert_never(out_format)
+        if index_dict is not None:
+            exporter.write_search_index(writer, index_dict, prefix="search/")
+
+
+def generate_document(
+    *,
+    out_dir: _types.StrOrBytesPath,
+    comp_list: collections.abc.Sequence["component.Component"],
+    label: collections.abc.Mapping[str, str] | None,
+    lang: "language.Language | None",
+    bind: collections.abc.Mapping[str, str] | None,
+    out_encoding: str | None = None,
+    out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
+    out_split: typing.Literal["category", "component"] = "category",
+    out_atomic: bool = False,
+    search_index: bool = False,
+) -> None:
+    _generate_pages(
+        out_format="markdown",
+        out_dir=out_dir,
+        comp_list=comp_list,
+        label=label,
+        lang=lang,
+        bind=bind,
+        out_encoding=out_encoding,
+        out_newline=out_newline,
+        out_split=out_split,
+        out_atomic=out_atomic,
+        search_index=search_index,
+    )
+
+
+def generate_html(
+    *,
+    out_dir: _types.StrOrBytesPath,
+    comp_list: collections.abc.Sequence["component.Component"],
+    label: collections.abc.Mapping[str, str] | None,
+    lang: "language.Language | None",
+    bind: collections.abc.Mapping[str, str] | None,
+    out_encoding: str | None = None,
+    out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
+    out_split: typing.Literal["category", "component"] = "category",
+    out_atomic: bool = False,
+    search_index: bool = False,
+) -> None:
+    _generate_pages(
+        out_format="html",
+        out_dir=out_dir,
+        comp_list=comp_list,
+        label=label,
+        lang=lang,
+        bind=bind,
+        out_encoding=out_encoding,
+        out_newline=out_newline,
+        out_split=out_split,
+        out_atomic=out_atomic,
+        search_index=search_index,
     )
 
 
 def generate_sheet(
     *,
     out_file: _types.StrOrBytesPath,
-    comp_list: collections.abc.Iterable[component.Component],
+    comp_list: collections.abc.Sequence["component.Component"],
     label: collections.abc.Mapping[str, str] | None,
-    lang: language.Language | None,
+    lang: "language.Language | None",
     bind: collections.abc.Mapping[str, str] | None,
     out_encoding: str | None = None,
     out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
 ) -> None:
+    import csv
+
+    from . import generator
+
+    generator.validate(comp_list, label=label, lang=lang, bind=bind, mode="sheet")
+    if label is not None:
+        label = generator.Label(label)
+
     if out_encoding is None:
         out_encoding = "utf-8"
     if out_newline is None:
@@ -109,6 +208,49 @@ def generate_sheet(
             writer.writerows(record_list)
 
 
+def generate_database(
+    *,
+    out_file: _types.StrOrBytesPath,
+    comp_list: collections.abc.Sequence["component.Component"],
+    lang: "language.Language | None",
+    bind: collections.abc.Mapping[str, str] | None,
+) -> None:
+    from . import exporter
+    from . import generator
+
+    generator.validate(comp_list, lang=lang, bind=bind, mode="database")
+
+    db = generator.generate_database(comp_list, lang=lang, bind=bind)
+    exporter.export_database(db, out_file)
+
+
+def generate_jsonl(
+    *,
+    out_file: _types.StrOrBytesPath,
+    comp_list: collections.abc.Sequence["component.Component"],
+    lang: "language.Language | None",
+    bind: collections.abc.Mapping[str, str] | None,
+    out_encoding: str | None = None,
+    out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
+) -> None:
+    from . import generator
+
+    generator.validate(comp_list, lang=lang, bind=bind, mode="json")
+
+    if out_encoding is None:
+        out_encoding = "utf-8"
+    if out_newline is None:
+        out_newline = "\n"
+
+    line_iter = generator.generate_jsonl(comp_list, lang=lang, bind=bind)
+    with wraperr.wrap_unicode_error(out_file):
+        with open(
+            out_file, mode="w", encoding=out_encoding, errors="strict", newline=""
+        ) as fp:
+            for line in line_iter:
+                fp.write(line + out_newline)
+
+
 def run(
     *,
     out_path: _types.StrOrBytesPath,
@@ -118,10 +260,21 @@ def run(
     label_file: _types.StrOrBytesPath | None = None,
     lang_file: _types.StrOrBytesPath | None = None,
     bind_file: _types.StrOrBytesPath | None = None,
-    out_mode: typing.Literal["document", "sheet"] = "document",
+    out_mode: typing.Literal[
+        "document", "html", "sheet", "sqlite", "jsonl", "snapshot"
+    ] = "document",
     out_encoding: str | None = None,
     out_newline: typing.Literal["\r", "\n", "\r\n"] | None = None,
+    out_split: typing.Literal["category", "component"] = "category",
+    out_atomic: bool = False,
+    keep_going: bool = False,
+    search_index: bool = False,
 ) -> None:
+    from . import component
+    from . import language
+    from . import resource
+    from . import snapshot
+
     label = resource.load_label(label_file)
     bind = resource.load_keybindings(bind_file)
 
@@ -129,10 +282,14 @@ def run(
     if lang_file is not None:
         lang = language.Language.from_file(lang_file, errors="strict")
 
-    comp_list = component.load_comp_list(defn_dir)
+    errors: list[Exception] | None = [] if keep_going else None
+    if snapshot.is_snapshot(defn_dir):
+        comp_list_all = snapshot.load_comp_list(defn_dir)
+    else:
+        comp_list_all = component.load_comp_list(defn_dir, errors=errors)
     comp_list = [
         comp
-        for comp in comp_list
+        for comp in comp_list_all
         if (
             (show_deprecated or component.Flags.IS_DEPRECATED not in comp.defn.flags)
             and (
@@ -141,29 +298,77 @@ def run(
         )
     ]
 
-    if out_mode == "document":
-        generate_document(
-            out_dir=out_path,
-            comp_list=comp_list,
-            label=label,
-            lang=lang,
-            bind=bind,
-            out_encoding=out_encoding,
-            out_newline=out_newline,
-        )
-        return
-    if out_mode == "sheet":
-        generate_sheet(
-            out_file=out_path,
-            comp_list=comp_list,
-            label=label,
-            lang=lang,
-            bind=bind,
-            out_encoding=out_encoding,
-            out_newline=out_newline,
-        )
-        return
-    typing.assert_never(out_mode)
+    try:
+        if out_mode == "document":
+            generate_document(
+                out_dir=out_path,
+                comp_list=comp_list,
+                label=label,
+                lang=lang,
+                bind=bind,
+                out_encoding=out_encoding,
+                out_newline=out_newline,
+                out_split=out_split,
+                out_atomic=out_atomic,
+                search_index=search_index,
+            )
+        elif out_mode == "html":
+            generate_html(
+                out_dir=out_path,
+                comp_list=comp_list,
+                label=label,
+                lang=lang,
+                bind=bind,
+                out_encoding=out_encoding,
+                out_newline=out_newline,
+                out_split=out_split,
+                out_atomic=out_atomic,
+                search_index=search_index,
+            )
+        elif out_mode == "sheet":
+            generate_sheet(
+                out_file=out_path,
+                comp_list=comp_list,
+                label=label,
+                lang=lang,
+                bind=bind,
+                out_encoding=out_encoding,
+                out_newline=out_newline,
+            )
+        elif out_mode == "sqlite":
+            generate_database(
+                out_file=out_path,
+                comp_list=comp_list,
+                lang=lang,
+                bind=bind,
+            )
+        elif out_mode == "jsonl":
+            generate_jsonl(
+                out_file=out_path,
+                comp_list=comp_list,
+                lang=lang,
+                bind=bind,
+                out_encoding=out_encoding,
+                out_newline=out_newline,
+            )
+        elif out_mode == "snapshot":
+            snapshot.save_comp_list(out_path, comp_list_all)
+        else:
+            typing.assert_never(out_mode)
+    except ExceptionGroup as exc_group:
+        # Report the skipped definitions along with whatever stopped the output, so
+        # that fixing one does not reveal the other only on the next run.
+        if not errors:
+            raise
+        exc_list = errors + list(exc_group.exceptions)
+        raise ExceptionGroup("skipped invalid definitions", exc_list) from exc_group
+    except Exception as exc:
+        if not errors:
+            raise
+        raise ExceptionGroup("skipped invalid definitions", errors + [exc]) from exc
+
+    if errors:
+        raise ExceptionGroup("skipped invalid definitions", errors)
 
 
 def format_os_error(exc: OSError) -> str:
@@ -186,34 +391,66 @@ def format_os_error(exc: OSError) -> str:
     return f"{exc.strerror} (file: '{exc_filename}', '{exc_filename2}')"
 
 
-def format_parse_error(exc: lxml.etree.ParseError) -> str:
+def format_parse_error(exc: "lxml.etree.ParseError") -> str:
     if exc.filename is not None:
         exc_filename = os.fsdecode(exc.filename)
         return f"{exc.msg} (in file '{exc_filename}')"
     return str(exc.msg)
 
 
+def format_error(exc: BaseException) -> str | None:
+    import lxml.etree
+
+    from . import component
+    from . import exporter
+    from . import generator
+    from . import language
+    from . import resource
+    from . import snapshot
+    from . import template
+
+    if isinstance(
+        exc,
+        (
+            component.DefinitionXMLError,
+            component.DefinitionArchiveError,
+            component.MultibodyLinkError,
+            exporter.DatabaseError,
+            generator.DocumentNameError,
+            generator.LabelKeyError,
+            generator.LabelMissingPlaceholderError,
+            language.LanguageTSVError,
+            language.LanguageFindError,
+            resource.ResourceFileError,
+            resource.TOMLFileDecodeError,
+            snapshot.SnapshotError,
+            template.TemplateKeyError,
+            wraperr.UnicodeEncodeFileError,
+            wraperr.UnicodeDecodeFileError,
+            wraperr.UnicodeTranslateFileError,
+        ),
+    ):
+        return str(exc)
+    if isinstance(exc, lxml.etree.ParseError):
+        return format_parse_error(exc)
+    if isinstance(exc, OSError):
+        return format_os_error(exc)
+    return None
+
+
 def main(
     *,
     prog: str | None = "sw_compdocs",
     args: collections.abc.Sequence[str] | None = None,
 ) -> None:
-    argp_definitions_default = None
-    argp_definitions_required = True
-    argp_definitions_help = "stormworks definitions directory"
-    argp_definitions_default_path = steamfind.find_definitions()
-    if argp_definitions_default_path is not None:
-        argp_definitions_default = os.fsdecode(argp_definitions_default_path)
-        argp_definitions_required = False
-        argp_definitions_help += f" (default: '{argp_definitions_default}')"
-
     argp = argparse.ArgumentParser(prog=prog, allow_abbrev=False)
     argp.add_argument(
         "-d",
         "--definitions",
-        default=argp_definitions_default,
-        required=argp_definitions_required,
-        help=argp_definitions_help,
+        help=(
+            "stormworks definitions directory, archive or snapshot"
+            " (default: detected from the steam installation)"
+        ),
     )
     argp.add_argument(
         "--show-deprecated",
@@ -246,7 +483,7 @@ def main(
         "-m",
         "--mode",
         default="document",
-        choices=("document", "sheet"),
+        choices=("document", "html", "sheet", "sqlite", "jsonl", "snapshot"),
         help="output mode (default: %(default)s)",
     )
     argp.add_argument(
@@ -260,6 +497,29 @@ def main(
         choices=("CR", "LF", "CRLF"),
         help="output newline (default varies by output format)",
     )
+    argp.add_argument(
+        "--split",
+        default="category",
+        choices=("category", "component"),
+        help="split documents by category or by component"
+        + " (document and html modes only, default: %(default)s)",
+    )
+    argp.add_argument(
+        "--atomic",
+        action="store_true",
+        help="write all files to temporary files first and rename them into place"
+        + " at the end (document and html modes only)",
+    )
+    argp.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="skip invalid definitions and report all errors at the end",
+    )
+    argp.add_argument(
+        "--search-index",
+        action="store_true",
+        help="also generate a search index (document and html modes only)",
+    )
     argp.add_argument(
         "output",
         help="output path",
@@ -267,6 +527,13 @@ def main(
     argv = argp.parse_args(args=args)
 
     argv_definitions: object = argv.definitions
+    if argv_definitions is None:
+        from . import steamfind
+
+        argv_definitions_path = steamfind.find_definitions()
+        if argv_definitions_path is None:
+            argp.error("the following arguments are required: -d/--definitions")
+        argv_definitions = os.fsdecode(argv_definitions_path)
     if not isinstance(argv_definitions, str):
         raise Exception
 
@@ -290,8 +557,10 @@ def main(
     if argv_keybindings is not None and not isinstance(argv_keybindings, str):
         raise Exception
 
-    argv_mode: typing.Literal["document", "sheet"] = argv.mode
-    if argv_mode != "document" and argv_mode != "sheet":
+    argv_mode: typing.Literal[
+        "document", "html", "sheet", "sqlite", "jsonl", "snapshot"
+    ] = argv.mode
+    if argv_mode not in ("document", "html", "sheet", "sqlite", "jsonl", "snapshot"):
         raise Exception
 
     argv_encoding: object = argv.encoding
@@ -311,6 +580,28 @@ def main(
         case _:
             raise Exception
 
+    argv_split: typing.Literal["category", "component"] = argv.split
+    if argv_split not in ("category", "component"):
+        raise Exception
+    if argv_split != "category" and argv_mode not in ("document", "html"):
+        argp.error("--split is only available in document and html modes")
+
+    argv_atomic: object = argv.atomic
+    if not isinstance(argv_atomic, bool):
+        raise Exception
+    if argv_atomic and argv_mode not in ("document", "html"):
+        argp.error("--atomic is only available in document and html modes")
+
+    argv_keep_going: object = argv.keep_going
+    if not isinstance(argv_keep_going, bool):
+        raise Exception
+
+    argv_search_index: object = argv.search_index
+    if not isinstance(argv_search_index, bool):
+        raise Exception
+    if argv_search_index and argv_mode not in ("document", "html"):
+        argp.error("--search-index is only available in document and html modes")
+
     argv_output: object = argv.output
     if not isinstance(argv_output, str):
         raise Exception
@@ -331,34 +622,20 @@ def main(
             out_mode=argv_mode,
             out_encoding=argv_encoding,
             out_newline=argv_newline,
+            out_split=argv_split,
+            out_atomic=argv_atomic,
+            keep_going=argv_keep_going,
+            search_index=argv_search_index,
         )
-    except component.DefinitionXMLError as exc:
-        error(exc)
-    except component.MultibodyLinkError as exc:
-        error(exc)
-    except generator.LabelKeyError as exc:
-        error(exc)
-    except generator.LabelMissingPlaceholderError as exc:
-        error(exc)
-    except language.LanguageTSVError as exc:
-        error(exc)
-    except language.LanguageFindError as exc:
-        error(exc)
-    except resource.ResourceFileError as exc:
-        error(exc)
-    except resource.TOMLFileDecodeError as exc:
-        error(exc)
-    except template.TemplateKeyError as exc:
-        error(exc)
-    except wraperr.UnicodeEncodeFileError as exc:
-        error(exc)
-    except wraperr.UnicodeDecodeFileError as exc:
-        error(exc)
-    except wraperr.UnicodeTranslateFileError as exc:
-        error(exc)
-    except lxml.etree.ParseError as exc:
-        exc_msg = format_parse_error(exc)
-        error(exc_msg)
-    except OSError as exc:
-        exc_msg = format_os_error(exc)
+    except ExceptionGroup as exc_group:
+        exc_msg_list = [format_error(exc) for exc in exc_group.exceptions]
+        if None in exc_msg_list:
+            raise
+        for exc_msg in exc_msg_list:
+            print(f"{argp.prog}: error: {exc_msg}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as exc:
+        exc_msg = format_error(exc)
+        if exc_msg is None:
+            raise
         error(exc_msg)
@@ -0,0 +1,55 @@
+import collections.abc
+import re
+import typing
+import unicodedata
+
+
+VERSION: typing.Final[int] = 1
+
+# Scripts that are written without spaces between words: Thai, Hangul, CJK
+# punctuation and radicals, Kana, Han and the compatibility ideographs.
+_bigram_chars: typing.Final[str] = (
+    "\u0e00-\u0e7f\u1100-\u11ff\u2e80-\u2fdf\u3005-\u3007\u3040-\u30ff"
+    "\u3130-\u318f\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+    "\uf900-\ufaff\U00020000-\U0003134f"
+)
+_token_re: typing.Final[re.Pattern[str]] = re.compile(
+    rf"(?P<bigram>[{_bigram_chars}]+)|(?:(?![{_bigram_chars}])[^\W_])+"
+)
+
+
+def tokenize(s: str) -> list[str]:
+    # Words are indexed as is. Runs of scripts without spaces (e.g. Japanese) cannot
+    # be split into words here, so they are indexed as character bigrams.
+    s = unicodedata.normalize("NFKC", s).casefold()
+
+    token_list: list[str] = []
+    for m in _token_re.finditer(s):
+        token = m.group()
+        if m.group("bigram") is None or len(token) <= 1:
+            token_list.append(token)
+        else:
+            token_list.extend(token[i : i + 2] for i in range(len(token) - 1))
+    return token_list
+
+
+class IndexBuilder:
+    def __init__(self) -> None:
+        self._doc_list: list[list[str]] = []
+        self._term_dict: dict[str, list[int]] = {}
+
+    def add(self, ref: collections.abc.Sequence[str], text_list: list[str]) -> None:
+        idx = len(self._doc_list)
+        self._doc_list.append(list(ref))
+        for text in text_list:
+            for term in tokenize(text):
+                posting = self._term_dict.setdefault(term, [])
+                if len(posting) <= 0 or posting[-1] != idx:
+                    posting.append(idx)
+
+    def build(self) -> dict[str, object]:
+        return {
+            "version": VERSION,
+            "docs": self._doc_list,
+            "terms": {term: self._term_dict[term] for term in sorted(self._term_dict)},
+        }
@@ -0,0 +1,370 @@
+import array
+import collections.abc
+import mmap
+import os
+import struct
+import typing
+
+from . import _types
+from . import component
+from . import language
+
+
+class SnapshotError(Exception):
+    def __init__(self, msg: str, *, file: _types.StrOrBytesPath | None = None) -> None:
+        super().__init__(msg, file)
+        self.msg: typing.Final[str] = msg
+        self.file: typing.Final[_types.StrOrBytesPath | None] = file
+
+    def __str__(self) -> str:
+        if self.file is None:
+            return self.msg
+        file = os.fsdecode(self.file)
+        return f"{self.msg} (in file '{file}')"
+
+
+_MAGIC: typing.Final[bytes] = b"SWCDSNAP"
+_VERSION: typing.Final[int] = 1
+_ALIGN: typing.Final[int] = 8
+_NONE: typing.Final[int] = -1
+
+_header_struct: typing.Final[struct.Struct] = struct.Struct("<8sII")
+_column_struct: typing.Final[struct.Struct] = struct.Struct("<24sc7xQQ")
+
+# Column names and array typecodes, in file order. String columns ("i") hold indices
+# into the string pool, or -1 for None. Offset columns ("I") hold n + 1 entries.
+_column_list: typing.Final[tuple[tuple[str, str], ...]] = (
+    ("str_offset", "I"),
+    ("str_data", "B"),
+    ("defn_file", "i"),
+    ("defn_key", "i"),
+    ("defn_name_id", "i"),
+    ("defn_name_en", "i"),
+    ("defn_category", "i"),
+    ("defn_mass", "d"),
+    ("defn_value", "q"),
+    ("defn_flags", "q"),
+    ("defn_tags", "i"),
+    ("defn_child_name", "i"),
+    ("defn_s_desc_id", "i"),
+    ("defn_s_desc_en", "i"),
+    ("defn_desc_id", "i"),
+    ("defn_desc_en", "i"),
+    ("defn_child_x", "i"),
+    ("defn_child_y", "i"),
+    ("defn_child_z", "i"),
+    ("defn_logic_node", "I"),
+    ("defn_voxel", "I"),
+    ("logic_label_id", "i"),
+    ("logic_label_en", "i"),
+    ("logic_mode", "B"),
+    ("logic_type", "B"),
+    ("logic_desc_id", "i"),
+    ("logic_desc_en", "i"),
+    ("voxel_x", "i"),
+    ("voxel_y", "i"),
+    ("voxel_z", "i"),
+    ("comp_defn", "I"),
+    ("comp_child", "i"),
+)
+
+
+class _StringPool:
+    def __init__(self) -> None:
+        self._idx_dict: dict[str, int] = {}
+        self.offset: array.array[int] = array.array("I", [0])
+        self.data: bytearray = bytearray()
+
+    def add(self, s: str | None) -> int:
+        if s is None:
+            return _NONE
+        idx = self._idx_dict.get(s)
+        if idx is None:
+            idx = len(self._idx_dict)
+            self._idx_dict[s] = idx
+            self.data += s.encode("utf-8", errors="surrogateescape")
+            self.offset.append(len(self.data))
+        return idx
+
+
+def _dump_comp_list(
+    comp_list: collections.abc.Iterable[component.Component],
+) -> dict[str, array.array[typing.Any]]:
+    col: dict[str, array.array[typing.Any]] = {
+        name: array.array(typecode) for name, typecode in _column_list
+    }
+    pool = _StringPool()
+    defn_idx_dict: dict[int, int] = {}
+
+    def add_defn(defn: component.Definition) -> int:
+        idx = defn_idx_dict.get(id(defn))
+        if idx is not None:
+            return idx
+        idx = len(col["defn_key"])
+        defn_idx_dict[id(defn)] = idx
+
+        col["defn_file"].append(
+            pool.add(os.fsdecode(defn.file) if defn.file is not None else None)
+        )
+        col["defn_key"].append(pool.add(defn.key))
+        col["defn_name_id"].append(pool.add(defn.name.id))
+        col["defn_name_en"].append(pool.add(defn.name.en))
+        col["defn_category"].append(defn.category.value)
+        col["defn_mass"].append(defn.mass)
+        col["defn_value"].append(defn.value)
+        col["defn_flags"].append(defn.flags.value)
+        col["defn_tags"].append(pool.add(defn.tags))
+        col["defn_child_name"].append(pool.add(defn.child_name))
+        col["defn_s_desc_id"].append(
+            pool.add(defn.tooltip_properties.short_description.id)
+        )
+        col["defn_s_desc_en"].append(
+            pool.add(defn.tooltip_properties.short_description.en)
+        )
+        col["defn_desc_id"].append(pool.add(defn.tooltip_properties.description.id))
+        col["defn_desc_en"].append(pool.add(defn.tooltip_properties.description.en))
+        col["defn_child_x"].append(defn.voxel_location_child.x)
+        col["defn_child_y"].append(defn.voxel_location_child.y)
+        col["defn_child_z"].append(defn.voxel_location_child.z)
+
+        for ln in defn.logic_nodes:
+            col["logic_label_id"].append(pool.add(ln.label.id))
+            col["logic_label_en"].append(pool.add(ln.label.en))
+            col["logic_mode"].append(ln.mode.value)
+            col["logic_type"].append(ln.type.value)
+            col["logic_desc_id"].append(pool.add(ln.description.id))
+            col["logic_desc_en"].append(pool.add(ln.description.en))
+        col["defn_logic_node"].append(len(col["logic_mode"]))
+
+        for voxel in defn.voxels:
+            col["voxel_x"].append(voxel.position.x)
+            col["voxel_y"].append(voxel.position.y)
+            col["voxel_z"].append(voxel.position.z)
+        col["defn_voxel"].append(len(col["voxel_x"]))
+        return idx
+
+    col["defn_logic_node"].append(0)
+    col["defn_voxel"].append(0)
+    for comp in comp_list:
+        col["comp_defn"].append(add_defn(comp.defn))
+        col["comp_child"].append(
+            add_defn(comp.child) if isinstance(comp, component.Multibody) else _NONE
+        )
+
+    col["str_offset"] = pool.offset
+    col["str_data"] = array.array("B", pool.data)
+    return col
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def save_comp_list(
+    file: _types.StrOrBytesPath,
+    comp_list: collections.abc.Iterable[component.Component],
+) -> None:
+    col = _dump_comp_list(comp_list)
+
+    offset = _align(_header_struct.size + _column_struct.size * len(_column_list))
+    head = bytearray(_header_struct.pack(_MAGIC, _VERSION, len(_column_list)))
+    body_list: list[bytes] = []
+    for name, typecode in _column_list:
+        arr = col[name]
+        data = struct.pack(f"<{len(arr):d}{typecode}", *arr)
+        head += _column_struct.pack(
+            name.encode("ascii"), typecode.encode("ascii"), offset, len(arr)
+        )
+        body_list.append(data + bytes(_align(len(data)) - len(data)))
+        offset += _align(len(data))
+    head += bytes(_align(len(head)) - len(head))
+
+    with open(file, mode="wb") as fp:
+        fp.write(head)
+        fp.writelines(body_list)
+
+
+def is_snapshot(file: _types.StrOrBytesPath) -> bool:
+    try:
+        with open(file, mode="rb") as fp:
+            return fp.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def _load_columns(
+    mv: memoryview, *, file: _types.StrOrBytesPath | None = None
+) -> dict[str, collections.abc.Sequence[typing.Any]]:
+    if len(mv) < _header_struct.size:
+        raise SnapshotError("truncated snapshot header", file=file)
+    magic, version, ncol = _header_struct.unpack_from(mv, 0)
+    if magic != _MAGIC:
+        raise SnapshotError("not a snapshot file", file=file)
+    if version != _VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version!r}", file=file)
+    if len(mv) < _header_struct.size + _column_struct.size * ncol:
+        raise SnapshotError("truncated snapshot header", file=file)
+
+    typecode_dict = dict(_column_list)
+    col: dict[str, collections.abc.Sequence[typing.Any]] = {}
+    for i in range(ncol):
+        name_b, typecode_b, offset, count = _column_struct.unpack_from(
+            mv, _header_struct.size + _column_struct.size * i
+        )
+        name = name_b.rstrip(b"\x00").decode("ascii", errors="replace")
+        typecode = typecode_b.decode("ascii", errors="replace")
+        if name not in typecode_dict:
+            continue
+        itemsize = struct.calcsize("<" + typecode_dict[name])
+        if typecode != typecode_dict[name] or len(mv) < offset + itemsize * count:
+            raise SnapshotError(f"invalid snapshot column {name!r}", file=file)
+
+        if typecode == "B":
+            with mv[offset : offset + count] as data:
+                col[name] = data.tobytes()
+        else:
+            col[name] = struct.unpack_from(f"<{count:d}{typecode}", mv, offset)
+
+    for name, _ in _column_list:
+        if name not in col:
+            raise SnapshotError(f"missing snapshot column {name!r}", file=file)
+    return col
+
+
+def _build_comp_list(
+    col: dict[str, collections.abc.Sequence[typing.Any]],
+) -> list[component.Component]:
+    str_offset: collections.abc.Sequence[int] = col["str_offset"]
+    str_data = bytes(col["str_data"])
+    # The snapshot stores each distinct string once, so strings that repeat across
+    # components already share one object.
+    str_list = [
+        str_data[begin:end].decode("utf-8", errors="surrogateescape")
+        for begin, end in zip(str_offset, str_offset[1:])
+    ]
+
+    def s(idx: int) -> str | None:
+        return str_list[idx] if idx != _NONE else None
+
+    def en(idx: int) -> str:
+        return str_list[idx]
+
+    def text(id_idx: int, en_idx: int) -> language.Text:
+        return language.Text(id=s(id_idx), en=en(en_idx))
+
+    logic_node_list = [
+        component.LogicNode(
+            label=text(label_id, label_en),
+            mode=component.LogicNodeMode(mode),
+            type=component.LogicNodeType(type),
+            description=text(desc_id, desc_en),
+        )
+        for label_id, label_en, mode, type, desc_id, desc_en in zip(
+            col["logic_label_id"],
+            col["logic_label_en"],
+            col["logic_mode"],
+            col["logic_type"],
+            col["logic_desc_id"],
+            col["logic_desc_en"],
+            strict=True,
+        )
+    ]
+    voxel_list = [
+        component.Voxel(position=component.VoxelPos(x=x, y=y, z=z))
+        for x, y, z in zip(col["voxel_x"], col["voxel_y"], col["voxel_z"], strict=True)
+    ]
+
+    ln_offset: collections.abc.Sequence[int] = col["defn_logic_node"]
+    vx_offset: collections.abc.Sequence[int] = col["defn_voxel"]
+    defn_list: list[component.Definition] = []
+    for i, (
+        file,
+        key,
+        name_id,
+        name_en,
+        category,
+        mass,
+        value,
+        flags,
+        tags,
+        child_name,
+        s_desc_id,
+        s_desc_en,
+        desc_id,
+        desc_en,
+        child_x,
+        child_y,
+        child_z,
+    ) in enumerate(
+        zip(
+            col["defn_file"],
+            col["defn_key"],
+            col["defn_name_id"],
+            col["defn_name_en"],
+            col["defn_category"],
+            col["defn_mass"],
+            col["defn_value"],
+            col["defn_flags"],
+            col["defn_tags"],
+            col["defn_child_name"],
+            col["defn_s_desc_id"],
+            col["defn_s_desc_en"],
+            col["defn_desc_id"],
+            col["defn_desc_en"],
+            col["defn_child_x"],
+            col["defn_child_y"],
+            col["defn_child_z"],
+            strict=True,
+        )
+    ):
+        defn = component.Definition(
+            file=s(file),
+            key=s(key),
+            name=text(name_id, name_en),
+            category=component.Category(category),
+            mass=mass,
+            value=value,
+            flags=component.Flags(flags),
+            tags=en(tags),
+            child_name=en(child_name),
+            tooltip_properties=component.TooltipProperties(
+                short_description=text(s_desc_id, s_desc_en),
+                description=text(desc_id, desc_en),
+            ),
+            logic_nodes=component.LogicNodeList(
+                logic_node_list[ln_offset[i] : ln_offset[i + 1]]
+            ),
+            voxels=component.VoxelList(voxel_list[vx_offset[i] : vx_offset[i + 1]]),
+            voxel_location_child=component.VoxelPos(x=child_x, y=child_y, z=child_z),
+        )
+        defn_list.append(defn)
+
+    defn_idx: int
+    child_idx: int
+    comp_list: list[component.Component] = []
+    for defn_idx, child_idx in zip(col["comp_defn"], col["comp_child"], strict=True):
+        if child_idx == _NONE:
+            comp_list.append(component.Component(defn=defn_list[defn_idx]))
+        else:
+            comp_list.append(
+                component.Multibody(
+                    defn=defn_list[defn_idx], child=defn_list[child_idx]
+                )
+            )
+    return comp_list
+
+
+def load_comp_list(file: _types.StrOrBytesPath) -> list[component.Component]:
+    with open(file, mode="rb") as fp:
+        if os.fstat(fp.fileno()).st_size <= 0:
+            raise SnapshotError("truncated snapshot header", file=file)
+        with (
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as mv,
+        ):
+            col = _load_columns(mv, file=file)
+
+    try:
+        return _build_comp_list(col)
+    except (IndexError, ValueError) as exc:
+        raise SnapshotError("corrupt snapshot", file=file) from exc
@@ -12,6 +12,9 @@ class TemplateKeyError(Exception):
         return f"missing replacement string for placeholder $[{self.key}]"
 
 
+_placeholder_re: typing.Final[re.Pattern[str]] = re.compile(r"(?s:\$\[(?P<key>.*?)\])")
+
+
 def format(template: str, mapping: collections.abc.Mapping[str, str]) -> str:
     def repl(match: re.Match[str]) -> str:
         key: str = match["key"]
@@ -21,4 +24,8 @@ def format(template: str, mapping: collections.abc.Mapping[str, str]) -> str:
             raise TemplateKeyError(key) from exc
         return val
 
-    return re.sub(r"(?s:\$\[(?P<key>.*?)\])", repl, template)
+    return _placeholder_re.sub(repl, template)
+
+
+def keys(template: str) -> list[str]:
+    return [match["key"] for match in _placeholder_re.finditer(template)]
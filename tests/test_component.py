@@ -1,13 +1,17 @@
 import copy
+import io
 import lxml.etree
 import os
 import pathlib
 import sw_compdocs._types
 import sw_compdocs.component
 import sw_compdocs.language
+import tarfile
 import tempfile
+import threading
 import typing
 import unittest
+import zipfile
 
 
 class TestDefinitionXMLErrorInit(unittest.TestCase):
@@ -128,6 +132,51 @@ class TestDefinitionXMLErrorPrependXPath(unittest.TestCase):
                     exc.prepend_xpath(s)
 
 
+class TestDefinitionArchiveErrorInit(unittest.TestCase):
+    def test_pass(self) -> None:
+        exc = sw_compdocs.component.DefinitionArchiveError("msg", file="file")
+        exc_args: tuple[object, ...] = exc.args
+        self.assertEqual(exc_args, ("msg",))
+        self.assertEqual(exc.msg, "msg")
+        self.assertEqual(exc.file, "file")
+
+
+class TestDefinitionArchiveErrorStr(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_msg", str),
+                ("input_file", sw_compdocs._types.StrOrBytesPath | None),
+                ("want_s", str),
+            ],
+        )
+
+        for tc in [
+            tt(input_msg="msg", input_file=None, want_s="msg"),
+            tt(
+                input_msg="msg",
+                input_file="definitions.zip",
+                want_s="msg (in file 'definitions.zip')",
+            ),
+            tt(
+                input_msg="msg",
+                input_file=b"definitions.zip",
+                want_s="msg (in file 'definitions.zip')",
+            ),
+            tt(
+                input_msg="msg",
+                input_file=pathlib.PurePath("definitions.zip"),
+                want_s="msg (in file 'definitions.zip')",
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                exc = sw_compdocs.component.DefinitionArchiveError(
+                    tc.input_msg, file=tc.input_file
+                )
+                self.assertEqual(str(exc), tc.want_s)
+
+
 class TestMultibodyLinkErrorInit(unittest.TestCase):
     def test(self) -> None:
         exc = sw_compdocs.component.MultibodyLinkError("parent_key", "child_key")
@@ -1043,6 +1092,63 @@ class TestLogicNodeListUpdateID(unittest.TestCase):
                 self.assertEqual(lns, tc.want_lns)
 
 
+class TestLogicNodeListClassify(unittest.TestCase):
+    def test(self) -> None:
+        in_ln = sw_compdocs.component.LogicNode(
+            mode=sw_compdocs.component.LogicNodeMode.INPUT,
+            type=sw_compdocs.component.LogicNodeType.BOOL,
+        )
+        out_ln = sw_compdocs.component.LogicNode(
+            mode=sw_compdocs.component.LogicNodeMode.OUTPUT,
+            type=sw_compdocs.component.LogicNodeType.VIDEO,
+        )
+        conn_in_ln = sw_compdocs.component.LogicNode(
+            mode=sw_compdocs.component.LogicNodeMode.INPUT,
+            type=sw_compdocs.component.LogicNodeType.ELECTRIC,
+        )
+        conn_out_ln = sw_compdocs.component.LogicNode(
+            mode=sw_compdocs.component.LogicNodeMode.OUTPUT,
+            type=sw_compdocs.component.LogicNodeType.ROPE,
+        )
+
+        lns = sw_compdocs.component.LogicNodeList(
+            [conn_out_ln, out_ln, in_ln, conn_in_ln]
+        )
+        self.assertEqual(lns.classify(), ([in_ln], [out_ln], [conn_out_ln, conn_in_ln]))
+        lns.classify()[0].clear()
+        self.assertEqual(lns.classify(), ([in_ln], [out_ln], [conn_out_ln, conn_in_ln]))
+
+        lns.append(in_ln)
+        self.assertEqual(
+            lns.classify(), ([in_ln, in_ln], [out_ln], [conn_out_ln, conn_in_ln])
+        )
+        del lns[0]
+        self.assertEqual(lns.classify(), ([in_ln, in_ln], [out_ln], [conn_in_ln]))
+        lns[0] = conn_out_ln
+        self.assertEqual(
+            lns.classify(), ([in_ln, in_ln], [], [conn_out_ln, conn_in_ln])
+        )
+        self.assertEqual(lns[1:].classify(), ([in_ln, in_ln], [], [conn_in_ln]))
+        lns.clear()
+        self.assertEqual(lns.classify(), ([], [], []))
+
+
+class TestLogicNodeListPool(unittest.TestCase):
+    def test(self) -> None:
+        xml = '<logic_nodes><logic_node label="Electric" description="Power"/></logic_nodes>'
+        pool: dict[str, str] = {}
+        lns1 = sw_compdocs.component.LogicNodeList.from_xml_elem(
+            lxml.etree.fromstring(xml), key="clock", pool=pool
+        )
+        lns2 = sw_compdocs.component.LogicNodeList.from_xml_elem(
+            lxml.etree.fromstring(xml), key="clock", pool=pool
+        )
+        self.assertEqual(pool, {"Electric": "Electric", "Power": "Power"})
+        self.assertIs(lns1[0].label.en, lns2[0].label.en)
+        self.assertIs(lns1[0].description.en, lns2[0].description.en)
+        self.assertEqual(lns1, lns2)
+
+
 class TestVoxelPosFromXMLElem(unittest.TestCase):
     def test_pass(self) -> None:
         tt = typing.NamedTuple(
@@ -2196,6 +2302,22 @@ class TestMultibodyVoxelMax(unittest.TestCase):
                 self.assertEqual(got_voxel_max, tc.want_voxel_max)
 
 
+class TestGetXMLParser(unittest.TestCase):
+    def test(self) -> None:
+        parser_1 = sw_compdocs.component._get_xml_parser()
+        parser_2 = sw_compdocs.component._get_xml_parser()
+        self.assertIs(parser_1, parser_2)
+
+        parser_list: list[object] = []
+        thread = threading.Thread(
+            target=lambda: parser_list.append(sw_compdocs.component._get_xml_parser())
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(len(parser_list), 1)
+        self.assertIsNot(parser_list[0], parser_1)
+
+
 class TestParseXMLFile(unittest.TestCase):
     def test_pass(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -2414,6 +2536,133 @@ class TestParseXMLStr(unittest.TestCase):
         self.assertEqual(ctx.exception.xpath, "/")
 
 
+class TestParseXMLBytes(unittest.TestCase):
+    def test_pass(self) -> None:
+        defn = sw_compdocs.component.parse_xml_bytes(
+            """\
+<?xml version="1.0" encoding="UTF-8"?>
+<definition name="name">
+    <tooltip_properties description="description"/>
+</definition>
+""".encode(),
+            file="test.xml",
+            key="key",
+        )
+
+        self.assertEqual(defn.file, "test.xml")
+        self.assertEqual(defn.key, "key")
+        self.assertEqual(defn.name.en, "name")
+        self.assertEqual(defn.tooltip_properties.description.en, "description")
+
+    def test_exc_xml(self) -> None:
+        with self.assertRaises(sw_compdocs.component.DefinitionXMLError) as ctx:
+            sw_compdocs.component.parse_xml_bytes(
+                """\
+<definition>
+    <voxel_location_child x="invalid"/>
+</definition>
+""".encode(),
+                file="test.xml",
+                key="key",
+            )
+
+        self.assertEqual(ctx.exception.msg, "invalid voxel x 'invalid'")
+        self.assertEqual(ctx.exception.file, "test.xml")
+        self.assertEqual(ctx.exception.xpath, "/definition/voxel_location_child")
+
+    def test_exc_parse(self) -> None:
+        with self.assertRaises(sw_compdocs.component.DefinitionXMLError) as ctx:
+            sw_compdocs.component.parse_xml_bytes(b" ")
+        self.assertEqual(ctx.exception.msg, "invalid xml")
+        self.assertEqual(ctx.exception.file, None)
+        self.assertEqual(ctx.exception.xpath, "/")
+
+
+class TestIterDefnFiles(unittest.TestCase):
+    def test_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dmy1_file = pathlib.Path(temp_dir, "dmy1.xml")
+            with open(dmy1_file, mode="xb") as f:
+                f.write(b'<definition name="Dummy 1"/>')
+            os.utime(dmy1_file, ns=(1_000_000_000, 2_000_000_000))
+
+            dmy2_file = pathlib.Path(temp_dir, "dmy2.txt")
+            with open(dmy2_file, mode="xb") as f:
+                f.write(b'<definition name="Dummy 2"/>')
+
+            dmy3_dir = pathlib.Path(temp_dir, "dmy3.xml")
+            dmy3_dir.mkdir()
+
+            path_list: list[sw_compdocs._types.StrOrBytesPath] = [
+                os.fsdecode(temp_dir),
+                os.fsencode(temp_dir),
+                pathlib.Path(temp_dir),
+            ]
+            for path in path_list:
+                with self.subTest(path=path):
+                    got_list = list(sw_compdocs.component.iter_defn_files(path))
+                    self.assertEqual(
+                        got_list,
+                        [
+                            sw_compdocs.component.DefinitionFile(
+                                dmy1_file,
+                                28,
+                                2_000_000_000,
+                                b'<definition name="Dummy 1"/>',
+                            )
+                        ],
+                    )
+
+    def test_dir_max_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            want_dict: dict[pathlib.Path, bytes] = {}
+            for i in range(20):
+                dmy_file = pathlib.Path(temp_dir, f"dmy{i:d}.xml")
+                dmy_data = f'<definition name="Dummy {i:d}"/>'.encode()
+                with open(dmy_file, mode="xb") as f:
+                    f.write(dmy_data)
+                want_dict[dmy_file] = dmy_data
+
+            for max_workers in [None, 1, 2, 64]:
+                with self.subTest(max_workers=max_workers):
+                    got_dict = {
+                        defn_file.file: defn_file.data
+                        for defn_file in sw_compdocs.component.iter_defn_files(
+                            temp_dir, max_workers=max_workers
+                        )
+                    }
+                    self.assertEqual(got_dict, want_dict)
+
+    def test_dir_exc_max_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            it = sw_compdocs.component.iter_defn_files(temp_dir, max_workers=0)
+            with self.assertRaises(ValueError):
+                next(it)
+
+    def test_tar(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tar_file = pathlib.Path(temp_dir, "definitions.tar")
+            with tarfile.open(tar_file, mode="x") as tf:
+                data = b'<definition name="Dummy 1"/>'
+                info = tarfile.TarInfo("dmy1.xml")
+                info.size = len(data)
+                info.mtime = 2
+                tf.addfile(info, io.BytesIO(data))
+
+            got_list = list(sw_compdocs.component.iter_defn_files(tar_file))
+            self.assertEqual(
+                got_list,
+                [
+                    sw_compdocs.component.DefinitionFile(
+                        pathlib.Path(tar_file, "dmy1.xml"),
+                        28,
+                        2_000_000_000,
+                        b'<definition name="Dummy 1"/>',
+                    )
+                ],
+            )
+
+
 class TestLoadDefnDict(unittest.TestCase):
     def test_empty(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -2473,6 +2722,173 @@ class TestLoadDefnDict(unittest.TestCase):
                     got_defn_dict = sw_compdocs.component.load_defn_dict(path)
                     self.assertEqual(got_defn_dict, want_defn_dict)
 
+    def test_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dmy1_file = pathlib.Path(temp_dir, "dmy1.xml")
+            with open(dmy1_file, mode="xb") as f:
+                f.write(b'<definition name="Dummy 1"/>')
+
+            dmy2_file = pathlib.Path(temp_dir, "dmy2.xml")
+            with open(dmy2_file, mode="xb") as f:
+                f.write(b'<definition mass="invalid"/>')
+
+            dmy3_file = pathlib.Path(temp_dir, "dmy3.xml")
+            with open(dmy3_file, mode="xb") as f:
+                f.write(b'<invalid value="invalid"/>')
+
+            want_defn = sw_compdocs.component.Definition(
+                file=dmy1_file, name=sw_compdocs.language.Text(en="Dummy 1")
+            )
+            want_defn.update_id("dmy1")
+
+            errors: list[Exception] = []
+            got_defn_dict = sw_compdocs.component.load_defn_dict(
+                temp_dir, errors=errors
+            )
+            self.assertEqual(got_defn_dict, {"dmy1": want_defn})
+
+            got_msg_dict: dict[object, str] = {}
+            for exc in errors:
+                self.assertIsInstance(exc, sw_compdocs.component.DefinitionXMLError)
+                assert isinstance(exc, sw_compdocs.component.DefinitionXMLError)
+                got_msg_dict[exc.file] = exc.msg
+            self.assertEqual(
+                got_msg_dict,
+                {
+                    dmy2_file: "invalid component mass 'invalid'",
+                    dmy3_file: "invalid xml root tag 'invalid'",
+                },
+            )
+
+    def test_archive(self) -> None:
+        member_dict = {
+            "dmy1.xml": b'<?xml version="1.0" encoding="UTF-8"?>\r\n<definition name="Dummy 1"/>\r\n',
+            "./dmy2.xml": b'<?xml version="1.0" encoding="UTF-8"?>\r\n<definition name="Dummy 2"/>\r\n',
+            "dmy3.txt": b"",
+            "sub/dmy4.xml": b'<definition name="Dummy 4"/>',
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file = pathlib.Path(temp_dir, "definitions.zip")
+            with zipfile.ZipFile(zip_file, mode="x") as zf:
+                for name, data in member_dict.items():
+                    zf.writestr(name, data)
+
+            tar_file = pathlib.Path(temp_dir, "definitions.tar.gz")
+            with tarfile.open(tar_file, mode="x:gz") as tf:
+                for name, data in member_dict.items():
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+
+            for archive_file in [zip_file, tar_file]:
+                want_defn_dict = {
+                    "dmy1": sw_compdocs.component.Definition(
+                        file=pathlib.Path(archive_file, "dmy1.xml"),
+                        name=sw_compdocs.language.Text(en="Dummy 1"),
+                    ),
+                    "dmy2": sw_compdocs.component.Definition(
+                        file=pathlib.Path(archive_file, "dmy2.xml"),
+                        name=sw_compdocs.language.Text(en="Dummy 2"),
+                    ),
+                }
+                for key, defn in want_defn_dict.items():
+                    defn.update_id(key)
+
+                path_list: list[sw_compdocs._types.StrOrBytesPath] = [
+                    os.fsdecode(archive_file),
+                    os.fsencode(archive_file),
+                    archive_file,
+                ]
+                for path in path_list:
+                    with self.subTest(path=path):
+                        got_defn_dict = sw_compdocs.component.load_defn_dict(path)
+                        self.assertEqual(got_defn_dict, want_defn_dict)
+
+    def test_archive_dir(self) -> None:
+        member_dict = {
+            "definitions/dmy1.xml": b'<definition name="Dummy 1"/>',
+            "definitions/sub/dmy2.xml": b'<definition name="Dummy 2"/>',
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file = pathlib.Path(temp_dir, "definitions.zip")
+            with zipfile.ZipFile(zip_file, mode="x") as zf:
+                zf.mkdir("definitions")
+                for name, data in member_dict.items():
+                    zf.writestr(name, data)
+
+            tar_file = pathlib.Path(temp_dir, "definitions.tar")
+            with tarfile.open(tar_file, mode="x") as tf:
+                for name, data in member_dict.items():
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+
+            for archive_file in [zip_file, tar_file]:
+                with self.subTest(archive_file=archive_file):
+                    want_defn = sw_compdocs.component.Definition(
+                        file=pathlib.Path(archive_file, "definitions", "dmy1.xml"),
+                        name=sw_compdocs.language.Text(en="Dummy 1"),
+                    )
+                    want_defn.update_id("dmy1")
+
+                    got_defn_dict = sw_compdocs.component.load_defn_dict(archive_file)
+                    self.assertEqual(got_defn_dict, {"dmy1": want_defn})
+
+    def test_archive_exc_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file = pathlib.Path(temp_dir, "definitions.zip")
+            with zipfile.ZipFile(zip_file, mode="x") as zf:
+                zf.writestr("readme.txt", b"")
+                zf.writestr("definitions/dmy.xml", b"<definition/>")
+
+            with self.assertRaises(sw_compdocs.component.DefinitionArchiveError) as ctx:
+                sw_compdocs.component.load_defn_dict(zip_file)
+            self.assertEqual(ctx.exception.msg, "no definition files found")
+            self.assertEqual(ctx.exception.file, zip_file)
+
+    def test_archive_exc_xml(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file = pathlib.Path(temp_dir, "definitions.zip")
+            with zipfile.ZipFile(zip_file, mode="x") as zf:
+                zf.writestr("dmy.xml", b'<definition mass="invalid"/>')
+
+            with self.assertRaises(sw_compdocs.component.DefinitionXMLError) as ctx:
+                sw_compdocs.component.load_defn_dict(zip_file)
+            self.assertEqual(ctx.exception.msg, "invalid component mass 'invalid'")
+            self.assertEqual(ctx.exception.file, pathlib.Path(zip_file, "dmy.xml"))
+
+    def test_archive_exc_format(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_file = pathlib.Path(temp_dir, "definitions.zip")
+            with open(archive_file, mode="xb") as f:
+                f.write(b"invalid")
+
+            with self.assertRaises(sw_compdocs.component.DefinitionArchiveError) as ctx:
+                sw_compdocs.component.load_defn_dict(archive_file)
+            self.assertEqual(ctx.exception.msg, "unsupported archive format")
+            self.assertEqual(ctx.exception.file, archive_file)
+
+    def test_archive_exc_truncated(self) -> None:
+        data = b"".join(b'<definition name="Dummy %d"/>' % i for i in range(1000))
+        mode_list: list[typing.Literal["x:gz", "x:xz"]] = ["x:gz", "x:xz"]
+        for mode in mode_list:
+            with self.subTest(mode=mode), tempfile.TemporaryDirectory() as temp_dir:
+                tar_file = pathlib.Path(temp_dir, "definitions.tar")
+                with tarfile.open(tar_file, mode=mode) as tf:
+                    info = tarfile.TarInfo("dmy.xml")
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+                with open(tar_file, mode="r+b") as f:
+                    f.truncate(tar_file.stat().st_size // 2)
+
+                with self.assertRaises(
+                    sw_compdocs.component.DefinitionArchiveError
+                ) as ctx:
+                    sw_compdocs.component.load_defn_dict(tar_file)
+                self.assertEqual(ctx.exception.file, tar_file)
+
 
 class TestBuildCompList(unittest.TestCase):
     def test_pass(self) -> None:
@@ -2617,6 +3033,44 @@ class TestBuildCompList(unittest.TestCase):
                 self.assertEqual(ctx.exception.parent_key, tc.want_exc_parent_key)
                 self.assertEqual(ctx.exception.child_key, tc.want_exc_child_key)
 
+    def test_errors(self) -> None:
+        defn_dict = {
+            "multibody_a": sw_compdocs.component.Definition(
+                key="multibody_a",
+                flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                child_name="multibody_x",
+            ),
+            "multibody_b": sw_compdocs.component.Definition(
+                key="multibody_b",
+                flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                child_name="multibody_c",
+            ),
+            "multibody_c": sw_compdocs.component.Definition(key="multibody_c"),
+            "normal": sw_compdocs.component.Definition(key="normal"),
+        }
+
+        errors: list[Exception] = []
+        got_comp_list = sw_compdocs.component.build_comp_list(defn_dict, errors=errors)
+        self.assertEqual(
+            got_comp_list,
+            [
+                sw_compdocs.component.Component(
+                    defn=sw_compdocs.component.Definition(key="multibody_c"),
+                ),
+                sw_compdocs.component.Component(
+                    defn=sw_compdocs.component.Definition(key="normal"),
+                ),
+            ],
+        )
+
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(
+            errors[0], sw_compdocs.component.MultibodyChildNotFoundError
+        )
+        self.assertIsInstance(
+            errors[1], sw_compdocs.component.MultibodyChildFlagNotSetError
+        )
+
 
 class TestLoadCompList(unittest.TestCase):
     def test_empty(self) -> None:
@@ -1,3 +1,4 @@
+import collections.abc
 import sw_compdocs.container
 import typing
 import unittest
@@ -106,6 +107,17 @@ class TestMutableSequenceInit(unittest.TestCase):
         self.assertEqual(seq._l, list[typing.Never]())
         self.assertEqual(mock.call_args_list, list[typing.Never]())
 
+    def test_trusted(self) -> None:
+        src = sw_compdocs.container.MutableSequence((1, 2, 3))
+        with unittest.mock.patch.object(
+            sw_compdocs.container.MutableSequence, "_check_value"
+        ) as mock:
+            mock.return_value = None
+            seq = sw_compdocs.container.MutableSequence(src)
+        self.assertEqual(seq._l, list[int]([1, 2, 3]))
+        self.assertIsNot(seq._l, src._l)
+        self.assertEqual(mock.call_args_list, list[typing.Never]())
+
 
 class TestMutableSequenceGetItem(unittest.TestCase):
     def test(self) -> None:
@@ -419,3 +431,117 @@ class TestMutableSequenceInsert(unittest.TestCase):
         want_mock_call_args_list = [unittest.mock.call(4)]
         self.assertEqual(seq._l, want_seq_l)
         self.assertEqual(mock.call_args_list, want_mock_call_args_list)
+
+
+class TestMutableSequenceExtend(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_values", collections.abc.Iterable[int]),
+                ("want_mock_call_args_list", list[object]),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_values=[4, 5],
+                want_mock_call_args_list=[
+                    unittest.mock.call(4),
+                    unittest.mock.call(5),
+                ],
+            ),
+            tt(
+                input_values=sw_compdocs.container.MutableSequence([4, 5]),
+                want_mock_call_args_list=[],
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                seq = sw_compdocs.container.MutableSequence[int]((1, 2, 3))
+                with unittest.mock.patch.object(
+                    sw_compdocs.container.MutableSequence, "_check_value"
+                ) as mock:
+                    mock.return_value = None
+                    seq.extend(tc.input_values)
+                self.assertEqual(seq._l, [1, 2, 3, 4, 5])
+                self.assertEqual(mock.call_args_list, tc.want_mock_call_args_list)
+
+
+class TestSequenceCopy(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.Sequence((1, 2, 3))
+        got_seq = seq.copy()
+        self.assertEqual(got_seq, seq)
+        self.assertIsNot(got_seq._l, seq._l)
+
+
+class TestSequenceView(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_index", slice),
+                ("want_list", list[int]),
+            ],
+        )
+
+        for tc in [
+            tt(input_index=slice(None), want_list=[1, 2, 3, 4, 5]),
+            tt(input_index=slice(1, 3), want_list=[2, 3]),
+            tt(input_index=slice(None, None, 2), want_list=[1, 3, 5]),
+            tt(input_index=slice(None, None, -1), want_list=[5, 4, 3, 2, 1]),
+            tt(input_index=slice(-2, None), want_list=[4, 5]),
+            tt(input_index=slice(10, None), want_list=[]),
+        ]:
+            with self.subTest(tc=tc):
+                seq = sw_compdocs.container.Sequence((1, 2, 3, 4, 5))
+                got_view = seq.view(tc.input_index)
+                self.assertIs(got_view._l, seq._l)
+                self.assertEqual(list(got_view), tc.want_list)
+                self.assertEqual(len(got_view), len(tc.want_list))
+                self.assertEqual(got_view.copy(), tc.want_list)
+
+
+class TestMutableSequenceCopy(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.MutableSequence[int]((1, 2, 3))
+        got_seq = seq.copy()
+        got_seq.append(4)
+        self.assertEqual(seq._l, [1, 2, 3])
+        self.assertEqual(got_seq._l, [1, 2, 3, 4])
+
+
+class TestMutableSequenceView(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.MutableSequence[int]((1, 2, 3, 4, 5))
+        got_view = seq.view(slice(1, 4))
+        self.assertEqual(list(got_view), [2, 3, 4])
+
+        seq[2] = 6
+        self.assertEqual(list(got_view), [2, 6, 4])
+
+
+class TestSequenceViewGetItem(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.Sequence((1, 2, 3, 4, 5))
+        view = seq.view(slice(1, None))
+        self.assertEqual(view[0], 2)
+        self.assertEqual(view[-1], 5)
+        self.assertEqual(view[1:3], seq.view(slice(2, 4)))
+        self.assertEqual(list(view[::-2]), [5, 3])
+        with self.assertRaises(IndexError):
+            view[4]
+
+
+class TestSequenceViewRepr(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.Sequence((1, 2, 3))
+        self.assertEqual(repr(seq.view(slice(1, None))), "SequenceView([2, 3])")
+
+
+class TestSequenceViewEq(unittest.TestCase):
+    def test(self) -> None:
+        seq = sw_compdocs.container.Sequence((1, 2, 3))
+        self.assertEqual(seq.view(slice(1, None)), seq.view(slice(1, 3)))
+        self.assertNotEqual(seq.view(slice(1, None)), seq.view(slice(2, None)))
+        self.assertNotEqual(seq.view(), [1, 2, 3])
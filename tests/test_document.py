@@ -1,3 +1,5 @@
+import collections.abc
+import json
 import sw_compdocs.document
 import typing
 import unittest
@@ -660,6 +662,90 @@ class TestTableDataInsert(unittest.TestCase):
                     data.insert(0, tc.input_item)
 
 
+class TestTableDataGetItem(unittest.TestCase):
+    def test_slice(self) -> None:
+        data = sw_compdocs.document.TableData(
+            sw_compdocs.document.TableDataRow(("A1", "A2", "A3")),
+            [
+                sw_compdocs.document.TableDataRow(("B1", "B2", "B3")),
+                sw_compdocs.document.TableDataRow(("C1", "C2", "C3")),
+            ],
+        )
+        got_data = data[1:]
+        self.assertEqual(
+            got_data,
+            sw_compdocs.document.TableData(
+                sw_compdocs.document.TableDataRow(("A1", "A2", "A3")),
+                [sw_compdocs.document.TableDataRow(("C1", "C2", "C3"))],
+            ),
+        )
+        got_data.append(sw_compdocs.document.TableDataRow(("D1", "D2", "D3")))
+        self.assertEqual(len(data), 2)
+
+
+class TestTableDataExtend(unittest.TestCase):
+    def test_pass(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_head", sw_compdocs.document.TableDataRow),
+                (
+                    "input_values",
+                    collections.abc.Iterable[sw_compdocs.document.TableDataRow],
+                ),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_head=sw_compdocs.document.TableDataRow(("A1", "A2", "A3")),
+                input_values=[sw_compdocs.document.TableDataRow(("B1", "B2", "B3"))],
+            ),
+            tt(
+                input_head=sw_compdocs.document.TableDataRow(("A1", "A2", "A3")),
+                input_values=sw_compdocs.document.TableData(
+                    sw_compdocs.document.TableDataRow(("X1", "X2", "X3")),
+                    [sw_compdocs.document.TableDataRow(("B1", "B2", "B3"))],
+                ),
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                data = sw_compdocs.document.TableData(tc.input_head)
+                data.extend(tc.input_values)
+                self.assertEqual(
+                    list[sw_compdocs.document.TableDataRow](data),
+                    [sw_compdocs.document.TableDataRow(("B1", "B2", "B3"))],
+                )
+
+    def test_exc(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                (
+                    "input_values",
+                    collections.abc.Iterable[sw_compdocs.document.TableDataRow],
+                ),
+            ],
+        )
+
+        for tc in [
+            tt(input_values=[sw_compdocs.document.TableDataRow(("B1", "B2"))]),
+            tt(
+                input_values=sw_compdocs.document.TableData(
+                    sw_compdocs.document.TableDataRow(("X1", "X2")),
+                    [sw_compdocs.document.TableDataRow(("B1", "B2"))],
+                ),
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                data = sw_compdocs.document.TableData(
+                    sw_compdocs.document.TableDataRow(("A1", "A2", "A3"))
+                )
+                with self.assertRaises(ValueError):
+                    data.extend(tc.input_values)
+                self.assertEqual(len(data), 0)
+
+
 class TestDocumentShift(unittest.TestCase):
     def test_pass(self) -> None:
         tt = typing.NamedTuple(
@@ -720,3 +806,77 @@ class TestDocumentShift(unittest.TestCase):
                 doc = sw_compdocs.document.Document(tc.input_doc)  # copy
                 doc.shift(tc.input_level)
                 self.assertEqual(doc, tc.want_doc)
+
+
+class TestDumpLoadDocument(unittest.TestCase):
+    def test_pass(self) -> None:
+        doc = sw_compdocs.document.Document(
+            [
+                sw_compdocs.document.Heading("heading", level=2),
+                sw_compdocs.document.Paragraph("para\ngraph"),
+                sw_compdocs.document.UnorderedList(
+                    [
+                        sw_compdocs.document.ListItem(
+                            "a", [sw_compdocs.document.ListItem("b")]
+                        ),
+                        sw_compdocs.document.ListItem("c", link="c"),
+                    ]
+                ),
+                sw_compdocs.document.Table(
+                    sw_compdocs.document.TableData(
+                        sw_compdocs.document.TableDataRow(["A", "B"]),
+                        [sw_compdocs.document.TableDataRow(["1", "2"])],
+                    )
+                ),
+                sw_compdocs.document.Callout(
+                    "callout", kind=sw_compdocs.document.CalloutKind.WARNING
+                ),
+            ]
+        )
+
+        obj = sw_compdocs.document.dump_document(doc)
+        self.assertEqual(
+            obj,
+            [
+                1,
+                [
+                    ["h", "heading", 2],
+                    ["p", "para\ngraph"],
+                    ["ul", [["a", [["b", []]]], ["c", [], "c"]]],
+                    ["table", ["A", "B"], [["1", "2"]]],
+                    ["callout", "callout", "WARNING"],
+                ],
+            ],
+        )
+        self.assertEqual(
+            sw_compdocs.document.load_document(json.loads(json.dumps(obj))), doc
+        )
+
+    def test_exc_dump(self) -> None:
+        class Custom(sw_compdocs.document.Block):
+            pass
+
+        with self.assertRaises(ValueError):
+            sw_compdocs.document.dump_document(
+                sw_compdocs.document.Document([Custom()])
+            )
+
+    def test_exc_load(self) -> None:
+        obj_list: list[object] = [
+            None,
+            [],
+            [2, []],
+            [1, None],
+            [1, [["h", "heading"]]],
+            [1, [["h", 0, 1]]],
+            [1, [["h", "heading", True]]],
+            [1, [["x", "text"]]],
+            [1, [["ul", [["a"]]]]],
+            [1, [["table", [], []]]],
+            [1, [["table", ["A"], [["1", "2"]]]]],
+            [1, [["callout", "text", "INVALID"]]],
+        ]
+        for obj in obj_list:
+            with self.subTest(obj=obj):
+                with self.assertRaises(ValueError):
+                    sw_compdocs.document.load_document(obj)
@@ -1,10 +1,34 @@
+import contextlib
+import json
+import os
 import pathlib
+import sqlite3
+import tarfile
+import sw_compdocs.database
 import sw_compdocs.document
 import sw_compdocs.exporter
 import sw_compdocs.wraperr
 import tempfile
 import typing
 import unittest
+import zipfile
+
+
+class TestDatabaseErrorInit(unittest.TestCase):
+    def test_pass(self) -> None:
+        exc = sw_compdocs.exporter.DatabaseError("msg", file="file")
+        self.assertEqual(exc.args, ("msg", "file"))
+        self.assertEqual(exc.msg, "msg")
+        self.assertEqual(exc.file, "file")
+
+
+class TestDatabaseErrorStr(unittest.TestCase):
+    def test(self) -> None:
+        exc = sw_compdocs.exporter.DatabaseError("msg")
+        self.assertEqual(str(exc), "msg")
+
+        exc = sw_compdocs.exporter.DatabaseError("msg", file=b"file")
+        self.assertEqual(str(exc), "msg (in file 'file')")
 
 
 class TestRenderMarkdownHeading(unittest.TestCase):
@@ -83,6 +107,16 @@ class TestRenderMarkdownListUnordered(unittest.TestCase):
                 ),
                 want_text="- a\n  - b\n    - c\n",
             ),
+            # link
+            tt(
+                input_ul=sw_compdocs.document.UnorderedList(
+                    [
+                        sw_compdocs.document.ListItem("A", link="a"),
+                        sw_compdocs.document.ListItem("B C", link="b c"),
+                    ]
+                ),
+                want_text="- [A](a.md)\n- [B C](b%20c.md)\n",
+            ),
         ]:
             with self.subTest(tc=tc):
                 got_text = sw_compdocs.exporter.render_markdown_list_unordered(
@@ -305,6 +339,40 @@ class TestRenderMarkdownBlock(unittest.TestCase):
                 self.assertEqual(got_text, tc.want_text)
 
 
+class TestRenderBlock(unittest.TestCase):
+    def test_pass(self) -> None:
+        class Custom(sw_compdocs.document.Block):
+            pass
+
+        class SubHeading(sw_compdocs.document.Heading):
+            pass
+
+        def render_custom(blk: Custom) -> str:
+            return "custom\n"
+
+        renderer_dict = dict(sw_compdocs.exporter.markdown_renderer_dict)
+        renderer_dict[Custom] = render_custom
+        self.assertEqual(
+            sw_compdocs.exporter.render_block(renderer_dict, Custom()), "custom\n"
+        )
+        self.assertEqual(
+            sw_compdocs.exporter.render_block(renderer_dict, SubHeading("foo")),
+            "# foo\n",
+        )
+
+    def test_exc(self) -> None:
+        class Custom(sw_compdocs.document.Block):
+            pass
+
+        for renderer_dict in [
+            sw_compdocs.exporter.markdown_renderer_dict,
+            sw_compdocs.exporter.html_renderer_dict,
+        ]:
+            with self.subTest(renderer_dict=renderer_dict):
+                with self.assertRaises(Exception):
+                    sw_compdocs.exporter.render_block(renderer_dict, Custom())
+
+
 class TestRenderMarkdown(unittest.TestCase):
     def test_pass(self) -> None:
         tt = typing.NamedTuple(
@@ -453,3 +521,519 @@ class TestExportMarkdownDict(unittest.TestCase):
             ) as fp:
                 md = fp.read()
             self.assertEqual(md, "# ３\n")
+
+
+class TestExportMarkdownDictParallel(unittest.TestCase):
+    def test_skip_unchanged(self) -> None:
+        doc_dict = {
+            str(i): sw_compdocs.document.Document(
+                [sw_compdocs.document.Heading(str(i))]
+            )
+            for i in range(20)
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            sw_compdocs.exporter.export_markdown_dict(
+                doc_dict, out_dir, encoding="utf-8", newline="\r\n", max_workers=4
+            )
+            for i in range(20):
+                md_file = pathlib.Path(out_dir, f"{i}.md")
+                self.assertEqual(md_file.read_bytes(), f"# {i}\r\n".encode())
+
+            os.utime(pathlib.Path(out_dir, "0.md"), ns=(0, 0))
+            os.utime(pathlib.Path(out_dir, "1.md"), ns=(0, 0))
+            doc_dict["1"] = sw_compdocs.document.Document(
+                [sw_compdocs.document.Heading("changed")]
+            )
+            sw_compdocs.exporter.export_markdown_dict(
+                doc_dict,
+                out_dir,
+                encoding="utf-8",
+                newline="\r\n",
+                max_workers=None,
+                skip_unchanged=True,
+            )
+            self.assertEqual(pathlib.Path(out_dir, "0.md").stat().st_mtime_ns, 0)
+            self.assertNotEqual(pathlib.Path(out_dir, "1.md").stat().st_mtime_ns, 0)
+            self.assertEqual(
+                pathlib.Path(out_dir, "1.md").read_bytes(), b"# changed\r\n"
+            )
+
+
+class TestExportMarkdownDictAtomic(unittest.TestCase):
+    def test_pass(self) -> None:
+        doc_dict = {
+            "1": sw_compdocs.document.Document([sw_compdocs.document.Heading("1")]),
+            "2": sw_compdocs.document.Document([sw_compdocs.document.Heading("2")]),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            out_dir.mkdir()
+            pathlib.Path(out_dir, "1.md").write_bytes(b"old")
+
+            sw_compdocs.exporter.export_markdown_dict(
+                doc_dict, out_dir, encoding="utf-8", newline="\n", atomic=True
+            )
+            self.assertEqual(
+                sorted(file.name for file in out_dir.iterdir()), ["1.md", "2.md"]
+            )
+            self.assertEqual(pathlib.Path(out_dir, "1.md").read_bytes(), b"# 1\n")
+            self.assertEqual(pathlib.Path(out_dir, "2.md").read_bytes(), b"# 2\n")
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes")
+    def test_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            want_dir = pathlib.Path(temp_dir, "want")
+            with sw_compdocs.exporter.DirWriter(want_dir) as writer:
+                writer.write("a.md", ["a"])
+                writer.write_bytes("b.json", b"{}")
+
+            got_dir = pathlib.Path(temp_dir, "got")
+            with sw_compdocs.exporter.DirWriter(
+                got_dir, mode="x", atomic=True
+            ) as writer:
+                writer.write("a.md", ["a"])
+                writer.write_bytes("b.json", b"{}")
+
+            for name in ["a.md", "b.json"]:
+                with self.subTest(name=name):
+                    self.assertEqual(
+                        pathlib.Path(got_dir, name).stat().st_mode,
+                        pathlib.Path(want_dir, name).stat().st_mode,
+                    )
+
+    def test_exc(self) -> None:
+        doc_dict = {
+            "1": sw_compdocs.document.Document([sw_compdocs.document.Heading("1")]),
+            "2": sw_compdocs.document.Document(
+                [sw_compdocs.document.Heading("\udc00")]
+            ),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            out_dir.mkdir()
+            pathlib.Path(out_dir, "1.md").write_bytes(b"old")
+
+            with self.assertRaises(sw_compdocs.wraperr.UnicodeEncodeFileError) as ctx:
+                sw_compdocs.exporter.export_markdown_dict(
+                    doc_dict, out_dir, encoding="utf-8", errors="strict", atomic=True
+                )
+            self.assertEqual(ctx.exception.filename, pathlib.Path(out_dir, "2.md"))
+            self.assertEqual(sorted(file.name for file in out_dir.iterdir()), ["1.md"])
+            self.assertEqual(pathlib.Path(out_dir, "1.md").read_bytes(), b"old")
+
+    def test_exc_exist(self) -> None:
+        doc_dict = {
+            "1": sw_compdocs.document.Document([sw_compdocs.document.Heading("1")]),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            out_dir.mkdir()
+            pathlib.Path(out_dir, "1.md").write_bytes(b"old")
+
+            with self.assertRaises(FileExistsError):
+                sw_compdocs.exporter.export_markdown_dict(
+                    doc_dict, out_dir, mode="x", atomic=True
+                )
+            with self.assertRaises(ValueError):
+                sw_compdocs.exporter.export_markdown_dict(
+                    doc_dict, out_dir, mode="a", atomic=True
+                )
+            self.assertEqual(sorted(file.name for file in out_dir.iterdir()), ["1.md"])
+
+    def test_exc_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            pathlib.Path(out_dir, "2.md").mkdir(parents=True)
+            pathlib.Path(out_dir, "2.md", "keep").write_bytes(b"")
+
+            with self.assertRaises(OSError):
+                with sw_compdocs.exporter.DirWriter(out_dir, atomic=True) as writer:
+                    writer.write("1.md", ["1"])
+                    writer.write("2.md", ["2"])
+                    writer.write("3.md", ["3"])
+            self.assertEqual(
+                sorted(file.name for file in out_dir.iterdir()), ["1.md", "2.md"]
+            )
+
+
+class TestArchiveWriter(unittest.TestCase):
+    def test_zip(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_list: list[bytes] = []
+            for i in range(2):
+                file = pathlib.Path(temp_dir, f"out{i}.zip")
+                with sw_compdocs.exporter.ArchiveWriter(
+                    file, format="zip", encoding="utf-8", newline="\r\n"
+                ) as writer:
+                    writer.write("b.md", ["# b\n"])
+                    writer.write("a.md", ["# ", "あ\n"])
+                    writer.write_bytes("search/index.json", b"{}")
+                data_list.append(file.read_bytes())
+            self.assertEqual(data_list[0], data_list[1])
+
+            with zipfile.ZipFile(pathlib.Path(temp_dir, "out0.zip")) as zf:
+                self.assertEqual(zf.namelist(), ["a.md", "b.md", "search/index.json"])
+                self.assertEqual(zf.read("a.md"), "# あ\r\n".encode())
+                self.assertEqual(zf.read("search/index.json"), b"{}")
+                for info in zf.infolist():
+                    self.assertEqual(info.date_time, (1980, 1, 1, 0, 0, 0))
+
+    def test_tar_gz(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_list: list[bytes] = []
+            for i in range(2):
+                file = pathlib.Path(temp_dir, f"out{i}.tar.gz")
+                with sw_compdocs.exporter.ArchiveWriter(
+                    file, format="tar.gz", encoding="utf-8", newline="\n", atomic=True
+                ) as writer:
+                    writer.write("b.md", ["# b\n"])
+                    writer.write("a.md", ["# a\n"])
+                data_list.append(file.read_bytes())
+            self.assertEqual(data_list[0], data_list[1])
+            self.assertEqual(
+                sorted(file.name for file in pathlib.Path(temp_dir).iterdir()),
+                ["out0.tar.gz", "out1.tar.gz"],
+            )
+
+            with tarfile.open(pathlib.Path(temp_dir, "out0.tar.gz"), "r:gz") as tf:
+                self.assertEqual(tf.getnames(), ["a.md", "b.md"])
+                fp = tf.extractfile("b.md")
+                assert fp is not None
+                self.assertEqual(fp.read(), b"# b\n")
+
+    def test_exc(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "out.zip")
+            with self.assertRaises(sw_compdocs.wraperr.UnicodeEncodeFileError) as ctx:
+                with sw_compdocs.exporter.ArchiveWriter(
+                    file, format="zip", encoding="ascii"
+                ) as writer:
+                    writer.write("a.md", ["あ"])
+            self.assertEqual(ctx.exception.filename, pathlib.Path(file, "a.md"))
+            self.assertFalse(file.exists())
+
+            with self.assertRaises(ValueError):
+                with sw_compdocs.exporter.ArchiveWriter(file, format="zip") as writer:
+                    writer.write_bytes("a.md", b"")
+                    writer.write_bytes("a.md", b"")
+
+
+class TestGetArchiveFormat(unittest.TestCase):
+    def test(self) -> None:
+        for input_file, want_format in [
+            ("out", None),
+            ("out.zip", "zip"),
+            ("path/to/OUT.ZIP", "zip"),
+            ("out.tar", "tar"),
+            ("out.tar.gz", "tar.gz"),
+            (b"out.tgz", "tar.gz"),
+            ("out.gz", None),
+        ]:
+            with self.subTest(input_file=input_file):
+                self.assertEqual(
+                    sw_compdocs.exporter.get_archive_format(input_file), want_format
+                )
+
+
+class TestRenderHTMLHeading(unittest.TestCase):
+    def test_pass(self) -> None:
+        for level in range(1, 7):
+            with self.subTest(level=level):
+                text = sw_compdocs.exporter.render_html_heading(
+                    sw_compdocs.document.Heading("a<b", level=level)
+                )
+                self.assertEqual(text, f"<h{level}>a&lt;b</h{level}>\n")
+
+    def test_exc_level(self) -> None:
+        for level in [0, 7]:
+            with self.subTest(level=level):
+                with self.assertRaises(ValueError):
+                    sw_compdocs.exporter.render_html_heading(
+                        sw_compdocs.document.Heading("foo", level=level)
+                    )
+
+
+class TestRenderHTMLParagraph(unittest.TestCase):
+    def test(self) -> None:
+        text = sw_compdocs.exporter.render_html_paragraph(
+            sw_compdocs.document.Paragraph("a & b\nc")
+        )
+        self.assertEqual(text, "<p>a &amp; b<br>\nc</p>\n")
+
+
+class TestRenderHTMLListUnordered(unittest.TestCase):
+    def test(self) -> None:
+        text = sw_compdocs.exporter.render_html_list_unordered(
+            sw_compdocs.document.UnorderedList(
+                [
+                    sw_compdocs.document.ListItem(
+                        "a", [sw_compdocs.document.ListItem("b")]
+                    ),
+                    sw_compdocs.document.ListItem("<c>"),
+                    sw_compdocs.document.ListItem("<d>", link="d&e"),
+                ]
+            )
+        )
+        self.assertEqual(
+            text,
+            "<ul>\n<li>a\n<ul>\n<li>b</li>\n</ul>\n</li>\n<li>&lt;c&gt;</li>\n"
+            + '<li><a href="d%26e.html">&lt;d&gt;</a></li>\n</ul>\n',
+        )
+
+
+class TestRenderHTMLTable(unittest.TestCase):
+    def test(self) -> None:
+        text = sw_compdocs.exporter.render_html_table(
+            sw_compdocs.document.Table(
+                sw_compdocs.document.TableData(
+                    sw_compdocs.document.TableDataRow(["A", "B"]),
+                    [
+                        sw_compdocs.document.TableDataRow(["1", "2"]),
+                        sw_compdocs.document.TableDataRow(["3", "&"]),
+                    ],
+                )
+            )
+        )
+        self.assertEqual(
+            text,
+            "<table>\n<thead>\n<tr><th>A</th><th>B</th></tr>\n</thead>\n<tbody>\n"
+            + "<tr><td>1</td><td>2</td></tr>\n<tr><td>3</td><td>&amp;</td></tr>\n"
+            + "</tbody>\n</table>\n",
+        )
+
+
+class TestRenderHTMLCallout(unittest.TestCase):
+    def test(self) -> None:
+        text = sw_compdocs.exporter.render_html_callout(
+            sw_compdocs.document.Callout(
+                "foo", kind=sw_compdocs.document.CalloutKind.WARNING
+            )
+        )
+        self.assertEqual(
+            text,
+            '<div class="callout callout-warning">\n'
+            + '<p class="callout-title">Warning</p>\n'
+            + "<p>foo</p>\n</div>\n",
+        )
+
+
+class TestGetHTMLCharset(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple("tt", [("input_encoding", str), ("want_charset", str)])
+
+        for tc in [
+            tt(input_encoding="utf-8", want_charset="utf-8"),
+            tt(input_encoding="UTF8", want_charset="utf-8"),
+            tt(input_encoding="shift_jis", want_charset="shift-jis"),
+            tt(input_encoding="eucjp", want_charset="euc-jp"),
+        ]:
+            with self.subTest(tc=tc):
+                got_charset = sw_compdocs.exporter.get_html_charset(tc.input_encoding)
+                self.assertEqual(got_charset, tc.want_charset)
+
+
+class TestRenderHTML(unittest.TestCase):
+    def test(self) -> None:
+        doc = sw_compdocs.document.Document(
+            [
+                sw_compdocs.document.Paragraph("text"),
+                sw_compdocs.document.Heading("Title & more"),
+            ]
+        )
+        self.assertEqual(
+            "".join(sw_compdocs.exporter.render_html(doc, css="style.css")),
+            "<!DOCTYPE html>\n<html>\n<head>\n"
+            + '<meta charset="utf-8">\n'
+            + "<title>Title &amp; more</title>\n"
+            + '<link rel="stylesheet" href="style.css">\n'
+            + "</head>\n<body>\n"
+            + "<p>text</p>\n"
+            + "<h1>Title &amp; more</h1>\n"
+            + "</body>\n</html>\n",
+        )
+        self.assertIn(
+            "<title>Other</title>\n",
+            "".join(sw_compdocs.exporter.render_html(doc, title="Other")),
+        )
+        self.assertIn(
+            '<meta charset="shift-jis">\n',
+            "".join(sw_compdocs.exporter.render_html(doc, charset="shift-jis")),
+        )
+
+
+class TestExportHTMLDict(unittest.TestCase):
+    def test(self) -> None:
+        doc_dict = {
+            "1": sw_compdocs.document.Document([sw_compdocs.document.Heading("１")]),
+            "2": sw_compdocs.document.Document([sw_compdocs.document.Heading("２")]),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            sw_compdocs.exporter.export_html_dict(
+                doc_dict, out_dir, mode="x", encoding="utf-8", newline="\r\n"
+            )
+
+            self.assertEqual(
+                sorted(file.name for file in out_dir.iterdir()),
+                ["1.html", "2.html", "style.css"],
+            )
+            with open(
+                pathlib.Path(out_dir, "style.css"), mode="r", encoding="utf-8"
+            ) as fp:
+                self.assertEqual(fp.read(), sw_compdocs.exporter.html_css)
+            for name, doc in doc_dict.items():
+                with open(
+                    pathlib.Path(out_dir, name + ".html"),
+                    mode="r",
+                    encoding="utf-8",
+                    newline="",
+                ) as fp:
+                    self.assertEqual(
+                        fp.read(),
+                        "".join(
+                            sw_compdocs.exporter.render_html(doc, css="style.css")
+                        ).replace("\n", "\r\n"),
+                    )
+
+    def test_encoding(self) -> None:
+        doc_dict = {
+            "1": sw_compdocs.document.Document([sw_compdocs.document.Heading("１")]),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+            sw_compdocs.exporter.export_html_dict(
+                doc_dict, out_dir, encoding="shift_jis", newline="\n"
+            )
+
+            with open(
+                pathlib.Path(out_dir, "1.html"), mode="r", encoding="shift_jis"
+            ) as fp:
+                self.assertEqual(
+                    fp.read(),
+                    "".join(
+                        sw_compdocs.exporter.render_html(
+                            doc_dict["1"], css="style.css", charset="shift-jis"
+                        )
+                    ),
+                )
+
+
+class TestExportSearchIndex(unittest.TestCase):
+    def test(self) -> None:
+        index_dict: dict[str, dict[str, object]] = {
+            "00_BLOCKS": {"version": 1, "docs": [["a", "日本語"]], "terms": {}},
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out", "search")
+            sw_compdocs.exporter.export_search_index(index_dict, out_dir)
+
+            with open(pathlib.Path(out_dir, "index.json"), encoding="utf-8") as fp:
+                self.assertEqual(
+                    fp.read(),
+                    '{"version":1,"shards":[{"name":"00_BLOCKS","file":"00_BLOCKS.json"}]}',
+                )
+            with open(pathlib.Path(out_dir, "00_BLOCKS.json"), encoding="utf-8") as fp:
+                got_index: object = json.load(fp)
+            self.assertEqual(got_index, index_dict["00_BLOCKS"])
+
+
+class TestExportDatabase(unittest.TestCase):
+    def test_exc(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "missing", "out.sqlite")
+            with self.assertRaises(sw_compdocs.exporter.DatabaseError) as ctx:
+                sw_compdocs.exporter.export_database(
+                    sw_compdocs.database.Database(), file
+                )
+            self.assertEqual(ctx.exception.file, file)
+
+    def test_pass(self) -> None:
+        db = sw_compdocs.database.Database(
+            category=[sw_compdocs.database.CategoryRow(0, "Blocks")],
+            logic_node_type=[sw_compdocs.database.LogicNodeTypeRow(0, "on/off")],
+            component=[
+                sw_compdocs.database.ComponentRow(
+                    key="parent",
+                    file="parent.xml",
+                    name="Parent",
+                    category=0,
+                    mass=3.0,
+                    value=4,
+                    flags=1 << 6,
+                    tags="basic",
+                    deprecated=False,
+                    orphaned=False,
+                    short_description="s_desc",
+                    description="desc",
+                )
+            ],
+            component_tag=[sw_compdocs.database.ComponentTagRow("parent", "basic")],
+            multibody=[
+                sw_compdocs.database.MultibodyRow(
+                    "parent", "child", "child.xml", 1.0, 2.0
+                )
+            ],
+            logic_node=[
+                sw_compdocs.database.LogicNodeRow(
+                    "parent", True, 0, 1, 0, "label", "description"
+                )
+            ],
+            voxel_bounds=[
+                sw_compdocs.database.VoxelBoundsRow("parent", -1, 0, 0, 1, 2, 3)
+            ],
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = pathlib.Path(temp_dir, "test.sqlite")
+            with open(temp_file, mode="xb") as f:
+                f.write(b"overwritten")
+
+            sw_compdocs.exporter.export_database(db, temp_file)
+
+            with contextlib.closing(sqlite3.connect(temp_file)) as conn:
+                got_list = conn.execute(
+                    """\
+SELECT component.key, component.name, category.name, tag, child_key, label, logic_node_type.name, max_z
+FROM component
+JOIN category USING (category)
+JOIN component_tag USING (key)
+JOIN multibody USING (key)
+JOIN logic_node USING (key)
+JOIN logic_node_type USING (type)
+JOIN voxel_bounds USING (key)
+"""
+                ).fetchall()
+                index_list = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY name"
+                ).fetchall()
+
+            self.assertEqual(
+                got_list,
+                [
+                    (
+                        "parent",
+                        "Parent",
+                        "Blocks",
+                        "basic",
+                        "child",
+                        "label",
+                        "on/off",
+                        3,
+                    )
+                ],
+            )
+            self.assertEqual(
+                index_list,
+                [
+                    ("component_category_index",),
+                    ("component_tag_tag_index",),
+                    ("logic_node_type_index",),
+                ],
+            )
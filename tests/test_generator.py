@@ -1,10 +1,26 @@
 import collections.abc
+import gc
+import json
+import sw_compdocs._types
 import sw_compdocs.component
+import sw_compdocs.database
 import sw_compdocs.document
 import sw_compdocs.generator
 import sw_compdocs.language
+import sw_compdocs.resource
+import sw_compdocs.template
 import typing
 import unittest
+import unittest.mock
+
+
+class TestDocumentNameErrorStr(unittest.TestCase):
+    def test(self) -> None:
+        exc = sw_compdocs.generator.DocumentNameError("msg")
+        self.assertEqual(str(exc), "msg")
+
+        exc = sw_compdocs.generator.DocumentNameError("msg", file=b"file")
+        self.assertEqual(str(exc), "msg (in file 'file')")
 
 
 class TestLabelKeyErrorInit(unittest.TestCase):
@@ -58,6 +74,18 @@ class TestLabelGet(unittest.TestCase):
                 input_repl="repl",
                 want_s="text repl",
             ),
+            tt(
+                input_label=sw_compdocs.generator.Label({"LABEL": "text {}"}),
+                input_key="LABEL",
+                input_repl=None,
+                want_s="text {}",
+            ),
+            tt(
+                input_label=sw_compdocs.generator.Label({"LABEL": "{} text {}"}),
+                input_key="LABEL",
+                input_repl="repl",
+                want_s="repl text repl",
+            ),
         ]:
             with self.subTest(tc=tc):
                 got_s = sw_compdocs.generator._label_get(
@@ -66,16 +94,183 @@ class TestLabelGet(unittest.TestCase):
                 self.assertEqual(got_s, tc.want_s)
 
     def test_exc_label(self) -> None:
-        with self.assertRaises(sw_compdocs.generator.LabelKeyError) as ctx:
-            sw_compdocs.generator._label_get({}, "LABEL")
-        self.assertEqual(ctx.exception.key, "LABEL")
+        label_list: list[collections.abc.Mapping[str, str]] = [
+            {},
+            sw_compdocs.generator.Label({}),
+        ]
+        for label in label_list:
+            for repl in [None, "repl"]:
+                with self.subTest(label=label, repl=repl):
+                    with self.assertRaises(sw_compdocs.generator.LabelKeyError) as ctx:
+                        sw_compdocs.generator._label_get(label, "LABEL", repl)
+                    self.assertEqual(ctx.exception.key, "LABEL")
 
     def test_exc_placeholder(self) -> None:
-        with self.assertRaises(
-            sw_compdocs.generator.LabelMissingPlaceholderError
-        ) as ctx:
-            sw_compdocs.generator._label_get({"LABEL": "text"}, "LABEL", "repl")
-        self.assertEqual(ctx.exception.key, "LABEL")
+        for label in [
+            {"LABEL": "text"},
+            sw_compdocs.generator.Label({"LABEL": "text"}),
+        ]:
+            with self.subTest(label=label):
+                with self.assertRaises(
+                    sw_compdocs.generator.LabelMissingPlaceholderError
+                ) as ctx:
+                    sw_compdocs.generator._label_get(label, "LABEL", "repl")
+                self.assertEqual(ctx.exception.key, "LABEL")
+
+
+class TestLabel(unittest.TestCase):
+    def test(self) -> None:
+        label = sw_compdocs.generator.Label({"A": "a {}", "B": "b"})
+        self.assertEqual(dict(label), {"A": "a {}", "B": "b"})
+        self.assertEqual(len(label), 2)
+        self.assertEqual(label["A"], "a {}")
+        self.assertEqual(label.format("A", "x"), "a x")
+        self.assertEqual(repr(label), "Label({'A': 'a {}', 'B': 'b'})")
+
+
+class TestCheckLabel(unittest.TestCase):
+    def test_pass(self) -> None:
+        exc_list = sw_compdocs.generator._check_label(
+            {"A": "a {}", "B": "b", "C": "c {}"},
+            {"A": True, "B": False, "D": True},
+            ["A", "B"],
+        )
+        self.assertEqual(exc_list, [])
+
+    def test_exc(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_key_list", list[str]),
+                ("want_exc_list", list[tuple[type[Exception], str]]),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_key_list=["A", "B", "C", "D"],
+                want_exc_list=[
+                    (sw_compdocs.generator.LabelMissingPlaceholderError, "A"),
+                    (sw_compdocs.generator.LabelKeyError, "B"),
+                    (sw_compdocs.generator.LabelMissingPlaceholderError, "D"),
+                ],
+            ),
+            tt(
+                input_key_list=["A"],
+                want_exc_list=[
+                    (sw_compdocs.generator.LabelMissingPlaceholderError, "A"),
+                    (sw_compdocs.generator.LabelMissingPlaceholderError, "D"),
+                ],
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                exc_list = sw_compdocs.generator._check_label(
+                    {"A": "a", "C": "c {}", "D": "d"},
+                    {"A": True, "B": False, "C": True, "D": True},
+                    tc.input_key_list,
+                )
+                got_exc_list = [(type(exc), exc.key) for exc in exc_list]
+                self.assertEqual(got_exc_list, tc.want_exc_list)
+
+    def test_default(self) -> None:
+        for key_dict in [
+            sw_compdocs.generator.document_label_key_dict,
+            sw_compdocs.generator.sheet_label_key_dict,
+        ]:
+            with self.subTest(key_dict=key_dict):
+                self.assertLessEqual(
+                    key_dict.keys(), sw_compdocs.resource.default_label.keys()
+                )
+                exc_list = sw_compdocs.generator._check_label(
+                    sw_compdocs.resource.default_label, key_dict, key_dict
+                )
+                self.assertEqual(exc_list, [])
+
+
+class TestDocumentLabelKeyList(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_comp_list", list[sw_compdocs.component.Component]),
+                ("want_key_list", list[str]),
+            ],
+        )
+
+        ln = sw_compdocs.component.LogicNode()
+        for tc in [
+            tt(input_comp_list=[], want_key_list=[]),
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition()
+                    )
+                ],
+                want_key_list=[
+                    "DOCUMENT_PROP_MASS",
+                    "DOCUMENT_PROP_DIMS",
+                    "DOCUMENT_PROP_COST",
+                    "DOCUMENT_PROP_TAGS",
+                    "DOCUMENT_PROP_FILE",
+                ],
+            ),
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(
+                            flags=sw_compdocs.component.Flags.IS_DEPRECATED
+                            | sw_compdocs.component.Flags.MULTIBODY_CHILD,
+                            logic_nodes=sw_compdocs.component.LogicNodeList([ln]),
+                        )
+                    )
+                ],
+                want_key_list=[
+                    "DOCUMENT_PROP_MASS",
+                    "DOCUMENT_PROP_DIMS",
+                    "DOCUMENT_PROP_COST",
+                    "DOCUMENT_PROP_TAGS",
+                    "DOCUMENT_PROP_FILE",
+                    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_TYPE",
+                    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_LABEL",
+                    "DOCUMENT_LOGIC_TABLE_NORMAL_HEAD_DESC",
+                    "DOCUMENT_DEPRECATED_TEXT",
+                    "DOCUMENT_ORPHANED_TEXT",
+                ],
+            ),
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Multibody(
+                        defn=sw_compdocs.component.Definition(),
+                        child=sw_compdocs.component.Definition(
+                            logic_nodes=sw_compdocs.component.LogicNodeList([ln]),
+                        ),
+                    )
+                ],
+                want_key_list=[
+                    "DOCUMENT_PROP_MASS",
+                    "DOCUMENT_PROP_MASS_PARENT",
+                    "DOCUMENT_PROP_MASS_CHILD",
+                    "DOCUMENT_PROP_DIMS",
+                    "DOCUMENT_PROP_DIMS_PARENT",
+                    "DOCUMENT_PROP_DIMS_CHILD",
+                    "DOCUMENT_PROP_COST",
+                    "DOCUMENT_PROP_TAGS",
+                    "DOCUMENT_PROP_FILE_PARENT",
+                    "DOCUMENT_PROP_FILE_CHILD",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_BODY",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_TYPE",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_LABEL",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_HEAD_DESC",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_PARENT",
+                    "DOCUMENT_LOGIC_TABLE_MULTIBODY_BODY_CHILD",
+                ],
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                got_key_list = sw_compdocs.generator.document_label_key_list(
+                    tc.input_comp_list
+                )
+                self.assertEqual(got_key_list, tc.want_key_list)
 
 
 class TestLangFindEn(unittest.TestCase):
@@ -113,6 +308,44 @@ class TestLangFindEn(unittest.TestCase):
                 )
                 self.assertEqual(got_s, tc.want_s)
 
+    def test_exc(self) -> None:
+        lang = sw_compdocs.language.Language(
+            [sw_compdocs.language.Translation("", "", "PROPERTIES", "プロパティ")]
+        )
+        for lang_en in ["logic inputs", "en"]:
+            with self.subTest(lang_en=lang_en):
+                with self.assertRaises(sw_compdocs.language.LanguageFindEnError):
+                    sw_compdocs.generator._lang_find_en(lang, lang_en)
+
+
+class TestLangFixedDict(unittest.TestCase):
+    def test(self) -> None:
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("", "", "PROPERTIES", "プロパティ"),
+                sw_compdocs.language.Translation("", "", "number", "数値"),
+                sw_compdocs.language.Translation("", "", "en", "local"),
+            ]
+        )
+        with unittest.mock.patch.object(
+            lang, "find_en_all", wraps=lang.find_en_all
+        ) as mock:
+            got_dict = sw_compdocs.generator._lang_fixed_dict(lang)
+            self.assertEqual(got_dict, {"PROPERTIES": "プロパティ", "number": "数値"})
+            call_count = mock.call_count
+
+            self.assertIs(sw_compdocs.generator._lang_fixed_dict(lang), got_dict)
+            self.assertEqual(
+                sw_compdocs.generator._lang_find_en(lang, "PROPERTIES"), "プロパティ"
+            )
+            self.assertEqual(mock.call_count, call_count)
+
+        lang_id = id(lang)
+        self.assertIn(lang_id, sw_compdocs.generator._lang_fixed_cache)
+        del lang, mock
+        gc.collect()
+        self.assertNotIn(lang_id, sw_compdocs.generator._lang_fixed_cache)
+
 
 class TestLangTranslate(unittest.TestCase):
     def test_pass(self) -> None:
@@ -320,6 +553,210 @@ class TestClassifyLogic(unittest.TestCase):
                 self.assertEqual(got_ret, tc.want_ret)
 
 
+class TestValidate(unittest.TestCase):
+    def _new_comp_list(self) -> list[sw_compdocs.component.Component]:
+        def new_defn(key: str) -> sw_compdocs.component.Definition:
+            return sw_compdocs.component.Definition(
+                key=key,
+                name=sw_compdocs.language.Text(id=f"def_{key}_name", en=key),
+                tooltip_properties=sw_compdocs.component.TooltipProperties(
+                    short_description=sw_compdocs.language.Text(
+                        id=f"def_{key}_s_desc", en=""
+                    ),
+                    description=sw_compdocs.language.Text(
+                        id=f"def_{key}_desc", en="$[desc]"
+                    ),
+                ),
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(en="Label"),
+                            description=sw_compdocs.language.Text(
+                                id=f"def_{key}_node_0_desc", en="$[node]"
+                            ),
+                        )
+                    ]
+                ),
+            )
+
+        return [
+            sw_compdocs.component.Component(defn=new_defn("a")),
+            sw_compdocs.component.Multibody(defn=new_defn("b"), child=new_defn("c")),
+        ]
+
+    def test_pass(self) -> None:
+        comp_list = self._new_comp_list()
+        sw_compdocs.generator.validate(comp_list)
+        sw_compdocs.generator.validate(comp_list, bind={"desc": "", "node": ""})
+        sw_compdocs.generator.validate(comp_list, bind={"desc": ""}, mode="sheet")
+
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("", "", en, "x")
+                for en in ["Label", "PROPERTIES", "logic outputs", "on/off"]
+            ]
+            + [
+                sw_compdocs.language.Translation(f"def_{key}_{suffix}", "", "", "$[x]")
+                for key in ["a", "b", "c"]
+                for suffix in ["name", "s_desc", "desc", "node_0_desc"]
+            ]
+        )
+        sw_compdocs.generator.validate(comp_list, lang=lang, bind={"x": ""})
+
+    def test_exc(self) -> None:
+        comp_list = self._new_comp_list()
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("def_a_name", "", "", "A"),
+                sw_compdocs.language.Translation("def_a_s_desc", "", "", "$[s_desc]"),
+                sw_compdocs.language.Translation("def_a_desc", "", "", "$[desc]"),
+                sw_compdocs.language.Translation("def_b_name", "", "", "$[name]"),
+                sw_compdocs.language.Translation("def_b_s_desc", "", "", "$[s_desc]"),
+            ]
+        )
+
+        with self.assertRaises(ExceptionGroup) as ctx:
+            sw_compdocs.generator.validate(comp_list, lang=lang, bind={"desc": ""})
+
+        got_list: list[tuple[type[Exception], str]] = []
+        for exc in ctx.exception.exceptions:
+            if isinstance(exc, sw_compdocs.language.LanguageFindIDError):
+                got_list.append((type(exc), exc.id))
+            elif isinstance(exc, sw_compdocs.language.LanguageFindEnError):
+                got_list.append((type(exc), exc.en))
+            elif isinstance(exc, sw_compdocs.template.TemplateKeyError):
+                got_list.append((type(exc), exc.key))
+            else:
+                self.fail(exc)
+        self.assertEqual(
+            got_list,
+            [
+                (sw_compdocs.language.LanguageFindEnError, "PROPERTIES"),
+                (sw_compdocs.language.LanguageFindEnError, "logic outputs"),
+                (sw_compdocs.language.LanguageFindEnError, "on/off"),
+                (sw_compdocs.template.TemplateKeyError, "s_desc"),
+                (sw_compdocs.language.LanguageFindEnError, "Label"),
+                (sw_compdocs.language.LanguageFindIDError, "def_a_node_0_desc"),
+                (sw_compdocs.language.LanguageFindIDError, "def_b_desc"),
+                (sw_compdocs.language.LanguageFindIDError, "def_b_node_0_desc"),
+                (sw_compdocs.language.LanguageFindIDError, "def_c_node_0_desc"),
+            ],
+        )
+
+    def test_exc_fixed(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_mode", typing.Literal["document", "sheet", "database", "json"]),
+                ("want_en_list", list[str]),
+            ],
+        )
+
+        comp_list = self._new_comp_list()
+        lang = sw_compdocs.language.Language(
+            [sw_compdocs.language.Translation("", "", "Label", "ラベル")]
+            + [
+                sw_compdocs.language.Translation(f"def_{key}_{suffix}", "", "", "")
+                for key in ["a", "b", "c"]
+                for suffix in ["name", "s_desc", "desc", "node_0_desc"]
+            ]
+        )
+
+        for tc in [
+            tt(
+                input_mode="document",
+                want_en_list=["PROPERTIES", "logic outputs", "on/off"],
+            ),
+            tt(
+                input_mode="database",
+                want_en_list=[
+                    str(ln_type) for ln_type in sw_compdocs.component.LogicNodeType
+                ],
+            ),
+            tt(input_mode="sheet", want_en_list=[]),
+            tt(input_mode="json", want_en_list=[]),
+        ]:
+            with self.subTest(tc=tc):
+                got_en_list: list[str] = []
+                try:
+                    sw_compdocs.generator.validate(
+                        comp_list, lang=lang, mode=tc.input_mode
+                    )
+                except ExceptionGroup as exc_group:
+                    for exc in exc_group.exceptions:
+                        self.assertIsInstance(
+                            exc, sw_compdocs.language.LanguageFindEnError
+                        )
+                        if isinstance(exc, sw_compdocs.language.LanguageFindEnError):
+                            got_en_list.append(exc.en)
+                self.assertEqual(got_en_list, tc.want_en_list)
+
+    def test_exc_label(self) -> None:
+        comp_list = self._new_comp_list()
+        label = {
+            key: "{}"
+            for key in sw_compdocs.generator.document_label_key_list(comp_list)
+        }
+        label["DOCUMENT_PROP_MASS"] = "mass"
+        del label["DOCUMENT_PROP_FILE"]
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("", "", en, "x")
+                for en in ["Label", "logic outputs", "on/off"]
+            ]
+            + [
+                sw_compdocs.language.Translation(f"def_{key}_{suffix}", "", "", "")
+                for key in ["a", "b", "c"]
+                for suffix in ["name", "s_desc", "desc", "node_0_desc"]
+            ]
+        )
+
+        with self.assertRaises(ExceptionGroup) as ctx:
+            sw_compdocs.generator.validate(comp_list, label=label, lang=lang)
+
+        got_list: list[tuple[type[Exception], str]] = []
+        for exc in ctx.exception.exceptions:
+            if isinstance(
+                exc,
+                (
+                    sw_compdocs.generator.LabelKeyError,
+                    sw_compdocs.generator.LabelMissingPlaceholderError,
+                ),
+            ):
+                got_list.append((type(exc), exc.key))
+            elif isinstance(exc, sw_compdocs.language.LanguageFindEnError):
+                got_list.append((type(exc), exc.en))
+            else:
+                self.fail(exc)
+        self.assertEqual(
+            got_list,
+            [
+                (
+                    sw_compdocs.generator.LabelMissingPlaceholderError,
+                    "DOCUMENT_PROP_MASS",
+                ),
+                (sw_compdocs.generator.LabelKeyError, "DOCUMENT_PROP_FILE"),
+                (sw_compdocs.language.LanguageFindEnError, "PROPERTIES"),
+            ],
+        )
+
+        with self.assertRaises(ExceptionGroup) as ctx:
+            sw_compdocs.generator.validate(comp_list, label=label, mode="sheet")
+        self.assertEqual(
+            len(ctx.exception.exceptions),
+            len(sw_compdocs.generator.sheet_label_key_dict),
+        )
+        sw_compdocs.generator.validate(comp_list, label={}, mode="json")
+
+    def test_exc_logic(self) -> None:
+        comp_list = self._new_comp_list()
+        with self.assertRaises(ExceptionGroup) as ctx:
+            sw_compdocs.generator.validate(comp_list, bind={}, mode="sheet")
+        self.assertEqual(len(ctx.exception.exceptions), 1)
+        exc = ctx.exception.exceptions[0]
+        self.assertIsInstance(exc, sw_compdocs.template.TemplateKeyError)
+
+
 class TestGenerateDocumentPropertyList(unittest.TestCase):
     def test_pass(self) -> None:
         tt = typing.NamedTuple(
@@ -2863,6 +3300,35 @@ class TestGenerateDocumentCategory(unittest.TestCase):
                         tc.input_category, tc.input_comp_list
                     )
 
+    def test_level(self) -> None:
+        comp_list = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    name=sw_compdocs.language.Text(en="A"),
+                    logic_nodes=sw_compdocs.component.LogicNodeList(
+                        [
+                            sw_compdocs.component.LogicNode(
+                                label=sw_compdocs.language.Text(en="IN"),
+                                mode=sw_compdocs.component.LogicNodeMode.INPUT,
+                                type=sw_compdocs.component.LogicNodeType.BOOL,
+                            ),
+                        ]
+                    ),
+                ),
+            ),
+        ]
+
+        for level in [1, 2, 3]:
+            with self.subTest(level=level):
+                want_doc = sw_compdocs.generator.generate_document_category(
+                    sw_compdocs.component.Category.BLOCKS, comp_list
+                )
+                want_doc.shift(level - 1)
+                got_doc = sw_compdocs.generator.generate_document_category(
+                    sw_compdocs.component.Category.BLOCKS, comp_list, level=level
+                )
+                self.assertEqual(got_doc, want_doc)
+
 
 class TestGenerateDocument(unittest.TestCase):
     def test_pass(self) -> None:
@@ -4163,3 +4629,538 @@ class TestGenerateSheet(unittest.TestCase):
                 with self.assertRaises(sw_compdocs.generator.LabelKeyError) as ctx:
                     sw_compdocs.generator.generate_sheet([], label=label)
                 self.assertEqual(ctx.exception.key, key)
+
+
+class TestGenerateDatabaseComponent(unittest.TestCase):
+    def test_normal(self) -> None:
+        comp = sw_compdocs.component.Component(
+            defn=sw_compdocs.component.Definition(
+                file="path/to/test.xml",
+                key="test",
+                name=sw_compdocs.language.Text(en="Name"),
+                category=sw_compdocs.component.Category.SENSORS,
+                mass=0.25,
+                value=2,
+                flags=sw_compdocs.component.Flags.IS_DEPRECATED,
+                tags="basic, sensor,,basic",
+                tooltip_properties=sw_compdocs.component.TooltipProperties(
+                    short_description=sw_compdocs.language.Text(en="$[action_up]"),
+                    description=sw_compdocs.language.Text(en="description"),
+                ),
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(en="label"),
+                            mode=sw_compdocs.component.LogicNodeMode.INPUT,
+                            type=sw_compdocs.component.LogicNodeType.FLOAT,
+                            description=sw_compdocs.language.Text(en="desc"),
+                        ),
+                    ]
+                ),
+                voxels=sw_compdocs.component.VoxelList(
+                    [
+                        sw_compdocs.component.Voxel(
+                            position=sw_compdocs.component.VoxelPos(x=-1, y=0, z=0)
+                        ),
+                        sw_compdocs.component.Voxel(
+                            position=sw_compdocs.component.VoxelPos(x=1, y=2, z=3)
+                        ),
+                    ]
+                ),
+            )
+        )
+
+        db = sw_compdocs.database.Database()
+        sw_compdocs.generator.generate_database_component(
+            comp, db, bind={"action_up": "w"}
+        )
+        self.assertEqual(
+            db,
+            sw_compdocs.database.Database(
+                component=[
+                    sw_compdocs.database.ComponentRow(
+                        key="test",
+                        file="test.xml",
+                        name="Name",
+                        category=7,
+                        mass=0.25,
+                        value=2,
+                        flags=1 << 29,
+                        tags="basic, sensor,,basic",
+                        deprecated=True,
+                        orphaned=False,
+                        short_description="w",
+                        description="description",
+                    )
+                ],
+                component_tag=[
+                    sw_compdocs.database.ComponentTagRow(key="test", tag="basic"),
+                    sw_compdocs.database.ComponentTagRow(key="test", tag="sensor"),
+                ],
+                logic_node=[
+                    sw_compdocs.database.LogicNodeRow(
+                        key="test",
+                        child=False,
+                        idx=0,
+                        mode=1,
+                        type=1,
+                        label="label",
+                        description="desc",
+                    )
+                ],
+                voxel_bounds=[
+                    sw_compdocs.database.VoxelBoundsRow(
+                        key="test",
+                        min_x=-1,
+                        min_y=0,
+                        min_z=0,
+                        max_x=1,
+                        max_y=2,
+                        max_z=3,
+                    )
+                ],
+            ),
+        )
+
+    def test_multibody(self) -> None:
+        comp = sw_compdocs.component.Multibody(
+            defn=sw_compdocs.component.Definition(
+                file="parent.xml",
+                key="parent",
+                name=sw_compdocs.language.Text(id="def_parent_name", en="Parent"),
+                mass=1.0,
+                flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(
+                                id="def_parent_node_0_label", en="parent label"
+                            ),
+                            type=sw_compdocs.component.LogicNodeType.TORQUE,
+                        ),
+                    ]
+                ),
+            ),
+            child=sw_compdocs.component.Definition(
+                file="child.xml",
+                key="child",
+                mass=2.0,
+                flags=sw_compdocs.component.Flags.MULTIBODY_CHILD,
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(
+                                id="def_child_node_0_label", en="child label"
+                            ),
+                        ),
+                    ]
+                ),
+            ),
+        )
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("", "", "", ""),
+                sw_compdocs.language.Translation("def_parent_name", "", "", "親"),
+                sw_compdocs.language.Translation(
+                    "def_parent_node_0_label", "", "", "親ラベル"
+                ),
+                sw_compdocs.language.Translation(
+                    "def_child_node_0_label", "", "", "子ラベル"
+                ),
+            ]
+        )
+
+        db = sw_compdocs.database.Database()
+        sw_compdocs.generator.generate_database_component(comp, db, lang=lang)
+        self.assertEqual(
+            db.component,
+            [
+                sw_compdocs.database.ComponentRow(
+                    key="parent",
+                    file="parent.xml",
+                    name="親",
+                    category=0,
+                    mass=3.0,
+                    value=0,
+                    flags=1 << 6,
+                    tags="",
+                    deprecated=False,
+                    orphaned=False,
+                    short_description="",
+                    description="",
+                )
+            ],
+        )
+        self.assertEqual(
+            db.multibody,
+            [
+                sw_compdocs.database.MultibodyRow(
+                    key="parent",
+                    child_key="child",
+                    child_file="child.xml",
+                    parent_mass=1.0,
+                    child_mass=2.0,
+                )
+            ],
+        )
+        self.assertEqual(
+            db.logic_node,
+            [
+                sw_compdocs.database.LogicNodeRow(
+                    key="parent",
+                    child=False,
+                    idx=0,
+                    mode=0,
+                    type=2,
+                    label="親ラベル",
+                    description="",
+                ),
+                sw_compdocs.database.LogicNodeRow(
+                    key="parent",
+                    child=True,
+                    idx=0,
+                    mode=0,
+                    type=0,
+                    label="子ラベル",
+                    description="",
+                ),
+            ],
+        )
+
+
+class TestGenerateDatabase(unittest.TestCase):
+    def test(self) -> None:
+        comp_list = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(key="a")
+            ),
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(key="b")
+            ),
+        ]
+        db = sw_compdocs.generator.generate_database(comp_list)
+        self.assertEqual(
+            db.category,
+            [
+                sw_compdocs.database.CategoryRow(category.value, str(category))
+                for category in sw_compdocs.component.Category
+            ],
+        )
+        self.assertEqual(
+            db.logic_node_type,
+            [
+                sw_compdocs.database.LogicNodeTypeRow(typ.value, str(typ))
+                for typ in sw_compdocs.component.LogicNodeType
+            ],
+        )
+        self.assertEqual([row.key for row in db.component], ["a", "b"])
+
+
+class TestGenerateJSONComponent(unittest.TestCase):
+    def test_normal(self) -> None:
+        comp = sw_compdocs.component.Component(
+            defn=sw_compdocs.component.Definition(
+                file="path/to/test.xml",
+                key="test",
+                name=sw_compdocs.language.Text(en="Name"),
+                category=sw_compdocs.component.Category.SENSORS,
+                mass=0.25,
+                value=2,
+                flags=sw_compdocs.component.Flags.IS_DEPRECATED,
+                tags="basic",
+                tooltip_properties=sw_compdocs.component.TooltipProperties(
+                    short_description=sw_compdocs.language.Text(en="$[action_up]"),
+                    description=sw_compdocs.language.Text(en="description"),
+                ),
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(en="label"),
+                            mode=sw_compdocs.component.LogicNodeMode.INPUT,
+                            type=sw_compdocs.component.LogicNodeType.FLOAT,
+                            description=sw_compdocs.language.Text(en="desc"),
+                        ),
+                    ]
+                ),
+                voxels=sw_compdocs.component.VoxelList(
+                    [
+                        sw_compdocs.component.Voxel(
+                            position=sw_compdocs.component.VoxelPos(x=-1, y=0, z=0)
+                        ),
+                        sw_compdocs.component.Voxel(
+                            position=sw_compdocs.component.VoxelPos(x=1, y=2, z=3)
+                        ),
+                    ]
+                ),
+            )
+        )
+
+        obj = sw_compdocs.generator.generate_json_component(
+            comp, bind={"action_up": "w"}
+        )
+        self.assertEqual(
+            obj,
+            {
+                "key": "test",
+                "name": "Name",
+                "short_description": "w",
+                "description": "description",
+                "category": 7,
+                "mass": 0.25,
+                "value": 2,
+                "tags": "basic",
+                "deprecated": True,
+                "orphaned": False,
+                "voxel_min": {"x": -1, "y": 0, "z": 0},
+                "voxel_max": {"x": 1, "y": 2, "z": 3},
+                "parent": {
+                    "key": "test",
+                    "file": "test.xml",
+                    "mass": 0.25,
+                    "flags": 1 << 29,
+                    "logic_nodes": [
+                        {"label": "label", "mode": 1, "type": 1, "description": "desc"}
+                    ],
+                    "voxel_min": {"x": -1, "y": 0, "z": 0},
+                    "voxel_max": {"x": 1, "y": 2, "z": 3},
+                },
+                "child": None,
+            },
+        )
+
+    def test_multibody(self) -> None:
+        comp = sw_compdocs.component.Multibody(
+            defn=sw_compdocs.component.Definition(
+                key="parent",
+                name=sw_compdocs.language.Text(id="def_parent_name", en="Parent"),
+                mass=1.0,
+                flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                voxel_location_child=sw_compdocs.component.VoxelPos(y=1),
+            ),
+            child=sw_compdocs.component.Definition(
+                file="child.xml",
+                key="child",
+                mass=2.0,
+                flags=sw_compdocs.component.Flags.MULTIBODY_CHILD,
+                logic_nodes=sw_compdocs.component.LogicNodeList(
+                    [
+                        sw_compdocs.component.LogicNode(
+                            label=sw_compdocs.language.Text(
+                                id="def_child_node_0_label", en="child label"
+                            ),
+                        ),
+                    ]
+                ),
+            ),
+        )
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("", "", "", ""),
+                sw_compdocs.language.Translation("def_parent_name", "", "", "親"),
+                sw_compdocs.language.Translation(
+                    "def_child_node_0_label", "", "", "子ラベル"
+                ),
+            ]
+        )
+
+        obj = sw_compdocs.generator.generate_json_component(comp, lang=lang)
+        self.assertEqual(obj["name"], "親")
+        self.assertEqual(obj["mass"], 3.0)
+        self.assertEqual(obj["voxel_max"], {"x": 0, "y": 1, "z": 0})
+        self.assertEqual(
+            obj["child"],
+            {
+                "key": "child",
+                "file": "child.xml",
+                "mass": 2.0,
+                "flags": 1 << 7,
+                "logic_nodes": [
+                    {"label": "子ラベル", "mode": 0, "type": 0, "description": ""}
+                ],
+                "voxel_min": {"x": 0, "y": 0, "z": 0},
+                "voxel_max": {"x": 0, "y": 0, "z": 0},
+            },
+        )
+
+
+class TestGenerateJSONL(unittest.TestCase):
+    def test(self) -> None:
+        comp_list = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    key="a", name=sw_compdocs.language.Text(en="名前\n")
+                )
+            ),
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(key="b")
+            ),
+        ]
+        line_list = list(sw_compdocs.generator.generate_jsonl(comp_list))
+        self.assertEqual(len(line_list), 2)
+        self.assertNotIn("\n", line_list[0])
+        self.assertIn("名前", line_list[0])
+        self.assertEqual(
+            [json.loads(line) for line in line_list],
+            [sw_compdocs.generator.generate_json_component(comp) for comp in comp_list],
+        )
+
+
+class TestGenerateSearchIndex(unittest.TestCase):
+    def test(self) -> None:
+        comp_list: list[sw_compdocs.component.Component] = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    key="a",
+                    name=sw_compdocs.language.Text(en="Alpha"),
+                    category=sw_compdocs.component.Category.LOGIC,
+                    tags="gate",
+                    tooltip_properties=sw_compdocs.component.TooltipProperties(
+                        short_description=sw_compdocs.language.Text(
+                            en="press $[action_up]"
+                        ),
+                    ),
+                )
+            ),
+            sw_compdocs.component.Multibody(
+                defn=sw_compdocs.component.Definition(
+                    key="b",
+                    name=sw_compdocs.language.Text(en="Beta"),
+                    flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                ),
+                child=sw_compdocs.component.Definition(
+                    key="c",
+                    flags=sw_compdocs.component.Flags.MULTIBODY_CHILD,
+                    logic_nodes=sw_compdocs.component.LogicNodeList(
+                        [
+                            sw_compdocs.component.LogicNode(
+                                label=sw_compdocs.language.Text(
+                                    en="Gate $[action_down]"
+                                )
+                            )
+                        ]
+                    ),
+                ),
+            ),
+        ]
+
+        index_dict = sw_compdocs.generator.generate_search_index(
+            comp_list, bind={"action_up": "W", "action_down": "S"}
+        )
+        self.assertEqual(
+            index_dict,
+            {
+                "00_BLOCKS": {
+                    "version": 1,
+                    "docs": [["b", "Beta"]],
+                    "terms": {"beta": [0], "gate": [0], "s": [0]},
+                },
+                "05_LOGIC": {
+                    "version": 1,
+                    "docs": [["a", "Alpha"]],
+                    "terms": {"alpha": [0], "gate": [0], "press": [0], "w": [0]},
+                },
+            },
+        )
+
+
+class TestGenerateDocumentSplitComponent(unittest.TestCase):
+    def test_pass(self) -> None:
+        comp_list = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    key="b",
+                    name=sw_compdocs.language.Text(en="B"),
+                    category=sw_compdocs.component.Category.LOGIC,
+                )
+            ),
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    key="a",
+                    name=sw_compdocs.language.Text(en="A"),
+                    category=sw_compdocs.component.Category.LOGIC,
+                    flags=sw_compdocs.component.Flags.IS_DEPRECATED,
+                )
+            ),
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    key="c", name=sw_compdocs.language.Text(en="C")
+                )
+            ),
+        ]
+
+        doc_dict = sw_compdocs.generator.generate_document_split_component(comp_list)
+        self.assertEqual(
+            list(doc_dict.keys()), ["00_BLOCKS", "05_LOGIC", "b", "a", "c"]
+        )
+        self.assertEqual(
+            doc_dict["05_LOGIC"],
+            sw_compdocs.document.Document(
+                [
+                    sw_compdocs.document.Heading("Logic"),
+                    sw_compdocs.document.UnorderedList(
+                        [
+                            sw_compdocs.document.ListItem("B", link="b"),
+                            sw_compdocs.document.ListItem("A (Deprecated)", link="a"),
+                        ]
+                    ),
+                ]
+            ),
+        )
+        for comp in comp_list:
+            key = comp.defn.key
+            assert key is not None
+            self.assertEqual(
+                doc_dict[key], sw_compdocs.generator.generate_document_component(comp)
+            )
+
+    def test_exc(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_comp_list", list[sw_compdocs.component.Component]),
+                ("want_msg", str),
+                ("want_file", sw_compdocs._types.StrOrBytesPath | None),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(file="a.xml")
+                    )
+                ],
+                want_msg="component without key cannot have its own document",
+                want_file="a.xml",
+            ),
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(
+                            file="a/00_BLOCKS.xml", key="00_BLOCKS"
+                        )
+                    )
+                ],
+                want_msg="component key '00_BLOCKS' conflicts with the category index document",
+                want_file="a/00_BLOCKS.xml",
+            ),
+            tt(
+                input_comp_list=[
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(file="a/x.xml", key="x")
+                    ),
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(file="b/x.xml", key="x")
+                    ),
+                ],
+                want_msg="component key 'x' is also used by the component in file 'a/x.xml'",
+                want_file="b/x.xml",
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                with self.assertRaises(sw_compdocs.generator.DocumentNameError) as ctx:
+                    sw_compdocs.generator.generate_document_split_component(
+                        tc.input_comp_list
+                    )
+                self.assertEqual(ctx.exception.msg, tc.want_msg)
+                self.assertEqual(ctx.exception.file, tc.want_file)
@@ -719,3 +719,58 @@ class TestLanguageTranslate(unittest.TestCase):
             with self.subTest(tc=tc):
                 got_local = tc.input_lang.translate(tc.input_text)
                 self.assertEqual(got_local, tc.want_local)
+
+
+class TestLanguageTranslateMany(unittest.TestCase):
+    def test_pass(self) -> None:
+        lang = sw_compdocs.language.Language(
+            [
+                sw_compdocs.language.Translation("id", "", "", "local_1"),
+                sw_compdocs.language.Translation("", "", "en", "local_2"),
+                sw_compdocs.language.Translation("id", "", "en", "local_3"),
+            ]
+        )
+        got_local_list = lang.translate_many(
+            [
+                sw_compdocs.language.Text(id="id", en="en"),
+                sw_compdocs.language.Text(en="en"),
+                sw_compdocs.language.Text(id="id"),
+            ]
+        )
+        self.assertEqual(got_local_list, ["local_1", "local_2", "local_1"])
+        self.assertEqual(lang.translate_many([]), [])
+
+    def test_exc(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_text_list", list[sw_compdocs.language.Text]),
+                ("want_exc_type", type[sw_compdocs.language.LanguageFindError]),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_text_list=[
+                    sw_compdocs.language.Text(en="en"),
+                    sw_compdocs.language.Text(id="missing", en="en"),
+                ],
+                want_exc_type=sw_compdocs.language.LanguageFindIDError,
+            ),
+            tt(
+                input_text_list=[
+                    sw_compdocs.language.Text(id="id"),
+                    sw_compdocs.language.Text(en="missing"),
+                ],
+                want_exc_type=sw_compdocs.language.LanguageFindEnError,
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                lang = sw_compdocs.language.Language(
+                    [
+                        sw_compdocs.language.Translation("id", "", "", "local_1"),
+                        sw_compdocs.language.Translation("", "", "en", "local_2"),
+                    ]
+                )
+                with self.assertRaises(tc.want_exc_type):
+                    lang.translate_many(tc.input_text_list)
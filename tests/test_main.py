@@ -1,11 +1,16 @@
 import argparse
 import collections.abc
+import contextlib
 import csv
 import errno
 import io
+import json
 import lxml.etree
+import os
 import pathlib
+import sqlite3
 import sw_compdocs.component
+import sw_compdocs.exporter
 import sw_compdocs.generator
 import sw_compdocs.language
 import sw_compdocs.main
@@ -17,6 +22,7 @@ import sys
 import tempfile
 import typing
 import unittest
+import zipfile
 import unittest.mock
 
 
@@ -677,6 +683,237 @@ template_02 = "テンプレート 02"
                 )
             self.assertEqual(ctx.exception.filename, out_file)
 
+    def test_sqlite(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_file = pathlib.Path(temp_dir, "out.sqlite")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test_01.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 01" mass="1" tags="basic"/>')
+
+            defn_file = pathlib.Path(defn_dir, "test_02.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 02" mass="2"/>')
+
+            sw_compdocs.main.run(
+                out_path=out_file,
+                defn_dir=defn_dir,
+                out_mode="sqlite",
+            )
+
+            with contextlib.closing(sqlite3.connect(out_file)) as conn:
+                got_list = conn.execute(
+                    "SELECT key, name, mass, file FROM component ORDER BY key"
+                ).fetchall()
+                got_tag_list = conn.execute(
+                    "SELECT key, tag FROM component_tag"
+                ).fetchall()
+            self.assertEqual(
+                got_list,
+                [
+                    ("test_01", "Test 01", 1.0, "test_01.xml"),
+                    ("test_02", "Test 02", 2.0, "test_02.xml"),
+                ],
+            )
+            self.assertEqual(got_tag_list, [("test_01", "basic")])
+
+    def test_html(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test &amp; Co" category="5"/>')
+
+            sw_compdocs.main.run(out_path=out_dir, defn_dir=defn_dir, out_mode="html")
+
+            self.assertEqual(
+                sorted(file.name for file in out_dir.iterdir()),
+                ["05_LOGIC.html", "style.css"],
+            )
+            with open(
+                pathlib.Path(out_dir, "05_LOGIC.html"), mode="r", encoding="utf-8"
+            ) as fp:
+                got_html = fp.read()
+            self.assertIn("<title>Logic</title>", got_html)
+            self.assertIn("<h2>Test &amp; Co</h2>", got_html)
+
+    def test_split_component(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test_01.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 01" category="5"/>')
+
+            defn_file = pathlib.Path(defn_dir, "test_02.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 02" category="5"/>')
+
+            sw_compdocs.main.run(
+                out_path=out_dir, defn_dir=defn_dir, out_split="component"
+            )
+
+            self.assertEqual(
+                sorted(file.name for file in out_dir.iterdir()),
+                ["05_LOGIC.md", "test_01.md", "test_02.md"],
+            )
+            with open(
+                pathlib.Path(out_dir, "05_LOGIC.md"), mode="r", encoding="utf-8"
+            ) as fp:
+                self.assertEqual(
+                    fp.read(),
+                    "# Logic\n\n- [Test 01](test_01.md)\n- [Test 02](test_02.md)\n",
+                )
+            with open(
+                pathlib.Path(out_dir, "test_02.md"), mode="r", encoding="utf-8"
+            ) as fp:
+                self.assertTrue(fp.read().startswith("# Test 02\n"))
+
+    def test_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_file = pathlib.Path(temp_dir, "out.zip")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test" category="5"/>')
+
+            sw_compdocs.main.run(
+                out_path=out_file, defn_dir=defn_dir, out_mode="html", search_index=True
+            )
+
+            with zipfile.ZipFile(out_file) as zf:
+                self.assertEqual(
+                    zf.namelist(),
+                    [
+                        "05_LOGIC.html",
+                        "search/05_LOGIC.json",
+                        "search/index.json",
+                        "style.css",
+                    ],
+                )
+                self.assertIn(b"<h2>Test</h2>", zf.read("05_LOGIC.html"))
+
+    def test_search_index(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = pathlib.Path(temp_dir, "out")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test Sensor" category="7"/>')
+
+            sw_compdocs.main.run(out_path=out_dir, defn_dir=defn_dir, search_index=True)
+
+            with open(
+                pathlib.Path(out_dir, "search", "index.json"),
+                mode="r",
+                encoding="utf-8",
+            ) as fp:
+                got_manifest: object = json.load(fp)
+            self.assertEqual(
+                got_manifest,
+                {
+                    "version": 1,
+                    "shards": [{"name": "07_SENSORS", "file": "07_SENSORS.json"}],
+                },
+            )
+
+            with open(
+                pathlib.Path(out_dir, "search", "07_SENSORS.json"),
+                mode="r",
+                encoding="utf-8",
+            ) as fp:
+                got_index: object = json.load(fp)
+            self.assertEqual(
+                got_index,
+                {
+                    "version": 1,
+                    "docs": [["test", "Test Sensor"]],
+                    "terms": {"sensor": [0], "test": [0]},
+                },
+            )
+
+    def test_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snap_file = pathlib.Path(temp_dir, "snapshot.bin")
+            out_file = pathlib.Path(temp_dir, "out.jsonl")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test_01.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 01" mass="1"/>')
+
+            defn_file = pathlib.Path(defn_dir, "test_02.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 02" mass="2" flags="536870912"/>')
+
+            sw_compdocs.main.run(
+                out_path=snap_file,
+                defn_dir=defn_dir,
+                show_deprecated=False,
+                out_mode="snapshot",
+            )
+            sw_compdocs.main.run(
+                out_path=out_file,
+                defn_dir=snap_file,
+                out_mode="jsonl",
+            )
+
+            with open(out_file, mode="r", encoding="utf-8") as fp:
+                got_key_list = [json.loads(line)["key"] for line in fp]
+            self.assertEqual(got_key_list, ["test_01", "test_02"])
+
+    def test_jsonl(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_file = pathlib.Path(temp_dir, "out.jsonl")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "test_01.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 01" mass="1"/>')
+
+            defn_file = pathlib.Path(defn_dir, "test_02.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Test 02" mass="2"/>')
+
+            sw_compdocs.main.run(
+                out_path=out_file,
+                defn_dir=defn_dir,
+                out_mode="jsonl",
+                out_newline="\r\n",
+            )
+
+            with open(out_file, mode="r", encoding="utf-8", newline="") as fp:
+                got_line_list = fp.read().split("\r\n")
+            self.assertEqual(got_line_list[-1], "")
+
+            got_obj_list: list[dict[str, object]] = [
+                json.loads(line) for line in got_line_list[:-1]
+            ]
+            self.assertEqual(
+                [(obj["key"], obj["name"], obj["mass"]) for obj in got_obj_list],
+                [("test_01", "Test 01", 1.0), ("test_02", "Test 02", 2.0)],
+            )
+
     def test_filter(self) -> None:
         tt = typing.NamedTuple(
             "tt",
@@ -772,6 +1009,118 @@ Name,File,Category,Tags,Multibody,Deprecated,Orphaned,Cost,Mass,Width,Depth,Heig
                         got_csv = fp.read()
                     self.assertEqual(got_csv, tc.want_csv)
 
+    def test_keep_going(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_file = pathlib.Path(temp_dir, "out.csv")
+
+            defn_dir = pathlib.Path(temp_dir, "definitions")
+            defn_dir.mkdir()
+
+            defn_file = pathlib.Path(defn_dir, "01_normal.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition name="Normal"/>')
+
+            defn_file = pathlib.Path(defn_dir, "02_invalid.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition mass="invalid"/>')
+
+            defn_file = pathlib.Path(defn_dir, "03_parent.xml")
+            with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                fp.write('<definition flags="64" child_name="04_missing"/>')
+
+            with self.assertRaises(ExceptionGroup) as ctx:
+                sw_compdocs.main.run(
+                    out_path=out_file,
+                    defn_dir=defn_dir,
+                    out_mode="sheet",
+                    out_encoding="utf-8",
+                    out_newline="\n",
+                    keep_going=True,
+                )
+            self.assertEqual(
+                [str(exc) for exc in ctx.exception.exceptions],
+                [
+                    f"invalid component mass 'invalid' (in file '{defn_file.parent / '02_invalid.xml'}' at xpath '/definition')",
+                    "missing child component '04_missing' for parent component '03_parent'",
+                ],
+            )
+
+            with open(out_file, mode="r", encoding="utf-8", newline="\n") as fp:
+                got_csv = fp.read()
+            self.assertEqual(
+                got_csv,
+                """\
+Name,File,Category,Tags,Multibody,Deprecated,Orphaned,Cost,Mass,Width,Depth,Height,Short Description,Description
+Normal,01_normal.xml,Blocks,,FALSE,FALSE,FALSE,0,0,1,1,1,,
+""",
+            )
+
+    def test_keep_going_exc(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_out_name", str),
+                ("input_lang_list", list[list[str]] | None),
+                ("want_exc_type_list", list[type[Exception]]),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_out_name="missing/out.csv",
+                input_lang_list=None,
+                want_exc_type_list=[
+                    sw_compdocs.component.DefinitionXMLError,
+                    FileNotFoundError,
+                ],
+            ),
+            tt(
+                input_out_name="out.csv",
+                input_lang_list=[["id", "description", "en", "local"]],
+                want_exc_type_list=[
+                    sw_compdocs.component.DefinitionXMLError,
+                    sw_compdocs.language.LanguageFindIDError,
+                    sw_compdocs.language.LanguageFindIDError,
+                    sw_compdocs.language.LanguageFindIDError,
+                ],
+            ),
+        ]:
+            with self.subTest(tc=tc), tempfile.TemporaryDirectory() as temp_dir:
+                defn_dir = pathlib.Path(temp_dir, "definitions")
+                defn_dir.mkdir()
+
+                defn_file = pathlib.Path(defn_dir, "01_normal.xml")
+                with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                    fp.write('<definition name="Normal"/>')
+
+                defn_file = pathlib.Path(defn_dir, "02_invalid.xml")
+                with open(defn_file, mode="x", encoding="utf-8", newline="\r\n") as fp:
+                    fp.write('<definition mass="invalid"/>')
+
+                lang_file = None
+                if tc.input_lang_list is not None:
+                    lang_file = pathlib.Path(temp_dir, "japanese.tsv")
+                    with open(
+                        lang_file, mode="x", encoding="utf-8", newline="\n"
+                    ) as fp:
+                        w = csv.writer(
+                            fp, dialect=sw_compdocs.language.LanguageTSVDialect
+                        )
+                        w.writerows(tc.input_lang_list)
+
+                with self.assertRaises(ExceptionGroup) as ctx:
+                    sw_compdocs.main.run(
+                        out_path=pathlib.Path(temp_dir, tc.input_out_name),
+                        defn_dir=defn_dir,
+                        lang_file=lang_file,
+                        out_mode="sheet",
+                        keep_going=True,
+                    )
+                self.assertEqual(
+                    [type(exc) for exc in ctx.exception.exceptions],
+                    tc.want_exc_type_list,
+                )
+
 
 class TestFormatOSError(unittest.TestCase):
     def test(self) -> None:
@@ -865,6 +1214,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -885,6 +1238,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -905,6 +1262,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -925,6 +1286,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -945,6 +1310,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -966,6 +1335,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -987,6 +1360,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1008,6 +1385,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1029,6 +1410,10 @@ class TestMain(unittest.TestCase):
                     out_mode="sheet",
                     out_encoding=None,
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1050,6 +1435,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding="shift-jis",
                     out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1071,6 +1460,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline="\r",
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1092,6 +1485,10 @@ class TestMain(unittest.TestCase):
                     out_mode="document",
                     out_encoding=None,
                     out_newline="\r\n",
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
                 ),
             ),
             tt(
@@ -1115,6 +1512,159 @@ class TestMain(unittest.TestCase):
                     out_mode="sheet",
                     out_encoding=None,
                     out_newline="\n",
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--mode",
+                    "sqlite",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="sqlite",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--mode",
+                    "jsonl",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="jsonl",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--atomic",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="document",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="category",
+                    out_atomic=True,
+                    keep_going=False,
+                    search_index=False,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--split",
+                    "component",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="document",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="component",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=False,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--mode",
+                    "html",
+                    "--search-index",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="html",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=False,
+                    search_index=True,
+                ),
+            ),
+            tt(
+                input_args=[
+                    "--definitions",
+                    "path/to/definitions",
+                    "--keep-going",
+                    "path/to/output",
+                ],
+                want_call_args=unittest.mock.call(
+                    out_path="path/to/output",
+                    defn_dir="path/to/definitions",
+                    show_deprecated=True,
+                    show_orphaned=False,
+                    label_file=None,
+                    lang_file=None,
+                    bind_file=None,
+                    out_mode="document",
+                    out_encoding=None,
+                    out_newline=None,
+                    out_split="category",
+                    out_atomic=False,
+                    keep_going=True,
+                    search_index=False,
                 ),
             ),
         ]:
@@ -1155,6 +1705,10 @@ class TestMain(unittest.TestCase):
                 out_mode="document",
                 out_encoding=None,
                 out_newline=None,
+                out_split="category",
+                out_atomic=False,
+                keep_going=False,
+                search_index=False,
             ),
         )
 
@@ -1174,6 +1728,64 @@ class TestMain(unittest.TestCase):
         mock_call_args: object = mock.call_args
         self.assertIsNone(mock_call_args)
 
+    def test_argp_definitions_steamfind(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_args", list[str]),
+                ("input_find", pathlib.Path | None),
+                ("want_find_called", bool),
+                ("want_defn_dir", str | None),
+            ],
+        )
+
+        for tc in [
+            tt(
+                input_args=["-d", "path/to/definitions", "path/to/output"],
+                input_find=pathlib.Path("path/to/steam/definitions"),
+                want_find_called=False,
+                want_defn_dir="path/to/definitions",
+            ),
+            tt(
+                input_args=["path/to/output"],
+                input_find=pathlib.Path("path/to/steam/definitions"),
+                want_find_called=True,
+                want_defn_dir=os.fsdecode(pathlib.Path("path/to/steam/definitions")),
+            ),
+            tt(
+                input_args=["path/to/output"],
+                input_find=None,
+                want_find_called=True,
+                want_defn_dir=None,
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                with (
+                    unittest.mock.patch.object(
+                        sw_compdocs.steamfind,
+                        "find_definitions",
+                        return_value=tc.input_find,
+                    ) as find_mock,
+                    unittest.mock.patch.object(sw_compdocs.main, "run") as run_mock,
+                    unittest.mock.patch.object(sys, "stdout", new=io.StringIO()),
+                    unittest.mock.patch.object(sys, "stderr", new=io.StringIO()),
+                ):
+                    if tc.want_defn_dir is None:
+                        with self.assertRaises(SystemExit) as ctx:
+                            sw_compdocs.main.main(args=tc.input_args)
+                        self.assertEqual(ctx.exception.code, 2)
+                    else:
+                        sw_compdocs.main.main(args=tc.input_args)
+
+                self.assertEqual(find_mock.called, tc.want_find_called)
+                if tc.want_defn_dir is None:
+                    self.assertFalse(run_mock.called)
+                else:
+                    run_mock_kwargs: collections.abc.Mapping[str, object] = (
+                        run_mock.call_args.kwargs
+                    )
+                    self.assertEqual(run_mock_kwargs["defn_dir"], tc.want_defn_dir)
+
     def test_argp_invalid(self) -> None:
         for input_args in [
             [
@@ -1190,6 +1802,31 @@ class TestMain(unittest.TestCase):
                 "LFCR",
                 "path/to/output",
             ],
+            [
+                "--definitions",
+                "path/to/definitions",
+                "--mode",
+                "sheet",
+                "--search-index",
+                "path/to/output",
+            ],
+            [
+                "--definitions",
+                "path/to/definitions",
+                "--mode",
+                "jsonl",
+                "--split",
+                "component",
+                "path/to/output",
+            ],
+            [
+                "--definitions",
+                "path/to/definitions",
+                "--mode",
+                "sqlite",
+                "--atomic",
+                "path/to/output",
+            ],
         ]:
             with (
                 self.assertRaises(SystemExit) as ctx,
@@ -1217,12 +1854,30 @@ class TestMain(unittest.TestCase):
                 input_exc=sw_compdocs.component.DefinitionXMLError("message"),
                 want_stderr="sw_compdocs: error: message\n",
             ),
+            tt(
+                input_exc=sw_compdocs.component.DefinitionArchiveError(
+                    "message", file="path/to/definitions.zip"
+                ),
+                want_stderr="sw_compdocs: error: message (in file 'path/to/definitions.zip')\n",
+            ),
             tt(
                 input_exc=sw_compdocs.component.MultibodyLinkError(
                     "parent_key", "child_key"
                 ),
                 want_stderr="sw_compdocs: error: failed to link parent component 'parent_key' and child component 'child_key'\n",
             ),
+            tt(
+                input_exc=sw_compdocs.exporter.DatabaseError(
+                    "message", file="path/to/out.sqlite"
+                ),
+                want_stderr="sw_compdocs: error: message (in file 'path/to/out.sqlite')\n",
+            ),
+            tt(
+                input_exc=sw_compdocs.generator.DocumentNameError(
+                    "message", file="path/to/definitions/key.xml"
+                ),
+                want_stderr="sw_compdocs: error: message (in file 'path/to/definitions/key.xml')\n",
+            ),
             tt(
                 input_exc=sw_compdocs.generator.LabelKeyError("key"),
                 want_stderr="sw_compdocs: error: missing label text for key 'key'\n",
@@ -1287,6 +1942,18 @@ class TestMain(unittest.TestCase):
                 input_exc=OSError(errno.ENOENT, "strerror", "filename", 2, "filename2"),
                 want_stderr="sw_compdocs: error: strerror (file: 'filename', 'filename2')\n",
             ),
+            tt(
+                input_exc=ExceptionGroup(
+                    "message",
+                    [
+                        sw_compdocs.component.DefinitionXMLError("message 1"),
+                        sw_compdocs.component.MultibodyLinkError(
+                            "parent_key", "child_key"
+                        ),
+                    ],
+                ),
+                want_stderr="sw_compdocs: error: message 1\nsw_compdocs: error: failed to link parent component 'parent_key' and child component 'child_key'\n",
+            ),
         ]:
             with self.subTest(tc=tc):
                 stderr = io.StringIO()
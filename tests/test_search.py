@@ -0,0 +1,50 @@
+import sw_compdocs.search
+import typing
+import unittest
+
+
+class TestTokenize(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple("tt", [("input_s", str), ("want_token_list", list[str])])
+
+        for tc in [
+            tt(input_s="", want_token_list=[]),
+            tt(input_s="Hello, World!", want_token_list=["hello", "world"]),
+            tt(input_s="snake_case 1x1", want_token_list=["snake", "case", "1x1"]),
+            tt(input_s="ＡＢＣ", want_token_list=["abc"]),
+            tt(input_s="センサー", want_token_list=["セン", "ンサ", "サー"]),
+            tt(
+                input_s="光 sensor光センサ",
+                want_token_list=["光", "sensor", "光セ", "セン", "ンサ"],
+            ),
+            tt(
+                input_s="Sensor de combustión",
+                want_token_list=["sensor", "de", "combustión"],
+            ),
+            tt(input_s="Größe", want_token_list=["grösse"]),
+            tt(input_s="Датчик топлива", want_token_list=["датчик", "топлива"]),
+            tt(input_s="연료 센서", want_token_list=["연료", "센서"]),
+            tt(
+                input_s="เซ็นเซอร์",
+                want_token_list=["เซ", "ซ็", "็น", "นเ", "เซ", "ซอ", "อร", "ร์"],
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                got_token_list = sw_compdocs.search.tokenize(tc.input_s)
+                self.assertEqual(got_token_list, tc.want_token_list)
+
+
+class TestIndexBuilder(unittest.TestCase):
+    def test(self) -> None:
+        builder = sw_compdocs.search.IndexBuilder()
+        builder.add(["a", "A"], ["foo bar", "foo"])
+        builder.add(["b", "B"], ["bar baz"])
+        builder.add(["c", "C"], [])
+        self.assertEqual(
+            builder.build(),
+            {
+                "version": 1,
+                "docs": [["a", "A"], ["b", "B"], ["c", "C"]],
+                "terms": {"bar": [0, 1], "baz": [1], "foo": [0]},
+            },
+        )
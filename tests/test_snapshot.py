@@ -0,0 +1,142 @@
+import pathlib
+import sw_compdocs.component
+import sw_compdocs.language
+import sw_compdocs.snapshot
+import tempfile
+import unittest
+
+
+class TestSnapshotErrorInit(unittest.TestCase):
+    def test_pass(self) -> None:
+        exc = sw_compdocs.snapshot.SnapshotError("msg", file="file")
+        self.assertEqual(exc.args, ("msg", "file"))
+        self.assertEqual(exc.msg, "msg")
+        self.assertEqual(exc.file, "file")
+
+
+class TestSnapshotErrorStr(unittest.TestCase):
+    def test(self) -> None:
+        exc = sw_compdocs.snapshot.SnapshotError("msg")
+        self.assertEqual(str(exc), "msg")
+
+        exc = sw_compdocs.snapshot.SnapshotError("msg", file=b"file")
+        self.assertEqual(str(exc), "msg (in file 'file')")
+
+
+class TestSaveLoadCompList(unittest.TestCase):
+    def test_pass(self) -> None:
+        comp_list: list[sw_compdocs.component.Component] = [
+            sw_compdocs.component.Component(
+                defn=sw_compdocs.component.Definition(
+                    file="path/to/a.xml",
+                    key="a",
+                    name=sw_compdocs.language.Text(id="def_a_name", en="名前"),
+                    category=sw_compdocs.component.Category.WINDOWS,
+                    mass=1.5,
+                    value=10,
+                    flags=sw_compdocs.component.Flags(1 << 29 | 1),
+                    tags="basic,window",
+                    tooltip_properties=sw_compdocs.component.TooltipProperties(
+                        short_description=sw_compdocs.language.Text(
+                            id="def_a_s_desc", en="short"
+                        ),
+                        description=sw_compdocs.language.Text(
+                            id="def_a_desc", en="desc"
+                        ),
+                    ),
+                    logic_nodes=sw_compdocs.component.LogicNodeList(
+                        [
+                            sw_compdocs.component.LogicNode(
+                                label=sw_compdocs.language.Text(
+                                    id="def_a_node_0_label", en="label"
+                                ),
+                                mode=sw_compdocs.component.LogicNodeMode.INPUT,
+                                type=sw_compdocs.component.LogicNodeType.ROPE,
+                                description=sw_compdocs.language.Text(
+                                    id="def_a_node_0_desc", en="desc"
+                                ),
+                            ),
+                        ]
+                    ),
+                    voxels=sw_compdocs.component.VoxelList(
+                        [
+                            sw_compdocs.component.Voxel(
+                                position=sw_compdocs.component.VoxelPos(x=-1, y=2, z=3)
+                            ),
+                            sw_compdocs.component.Voxel(),
+                        ]
+                    ),
+                )
+            ),
+            sw_compdocs.component.Multibody(
+                defn=sw_compdocs.component.Definition(
+                    key="b",
+                    flags=sw_compdocs.component.Flags.MULTIBODY_PARENT,
+                    child_name="c",
+                    voxel_location_child=sw_compdocs.component.VoxelPos(x=1, y=2, z=3),
+                ),
+                child=sw_compdocs.component.Definition(
+                    key="c",
+                    flags=sw_compdocs.component.Flags.MULTIBODY_CHILD,
+                    logic_nodes=sw_compdocs.component.LogicNodeList(
+                        [sw_compdocs.component.LogicNode()]
+                    ),
+                ),
+            ),
+            sw_compdocs.component.Component(defn=sw_compdocs.component.Definition()),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "snapshot.bin")
+            sw_compdocs.snapshot.save_comp_list(file, comp_list)
+            self.assertTrue(sw_compdocs.snapshot.is_snapshot(file))
+            got_comp_list = sw_compdocs.snapshot.load_comp_list(file)
+        self.assertEqual(got_comp_list, comp_list)
+        self.assertIs(type(got_comp_list[1]), sw_compdocs.component.Multibody)
+
+    def test_pass_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "snapshot.bin")
+            sw_compdocs.snapshot.save_comp_list(file, [])
+            got_comp_list = sw_compdocs.snapshot.load_comp_list(file)
+        self.assertEqual(got_comp_list, [])
+
+    def test_exc(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "snapshot.bin")
+            sw_compdocs.snapshot.save_comp_list(
+                file,
+                [
+                    sw_compdocs.component.Component(
+                        defn=sw_compdocs.component.Definition(key="a")
+                    )
+                ],
+            )
+            data = file.read_bytes()
+
+            for input_data, want_msg in [
+                (b"", "truncated snapshot header"),
+                (data[:12], "truncated snapshot header"),
+                (b"NOTASNAP" + data[8:], "not a snapshot file"),
+                (data[:8] + b"\x02" + data[9:], "unsupported snapshot version 2"),
+                (data[:20], "truncated snapshot header"),
+                (data[: len(data) - 8], "invalid snapshot column 'comp_child'"),
+            ]:
+                with self.subTest(want_msg=want_msg, size=len(input_data)):
+                    file.write_bytes(input_data)
+                    with self.assertRaises(sw_compdocs.snapshot.SnapshotError) as ctx:
+                        sw_compdocs.snapshot.load_comp_list(file)
+                    self.assertEqual(ctx.exception.msg, want_msg)
+                    self.assertEqual(ctx.exception.file, file)
+
+
+class TestIsSnapshot(unittest.TestCase):
+    def test(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = pathlib.Path(temp_dir, "file")
+            file.write_bytes(b"<definition/>")
+            self.assertFalse(sw_compdocs.snapshot.is_snapshot(file))
+            self.assertFalse(sw_compdocs.snapshot.is_snapshot(temp_dir))
+            self.assertFalse(
+                sw_compdocs.snapshot.is_snapshot(pathlib.Path(temp_dir, "missing"))
+            )
@@ -74,3 +74,28 @@ class TestFormat(unittest.TestCase):
             with self.subTest(tc=tc):
                 got_s = sw_compdocs.template.format(tc.input_template, tc.input_mapping)
                 self.assertEqual(got_s, tc.want_s)
+
+
+class TestKeys(unittest.TestCase):
+    def test(self) -> None:
+        tt = typing.NamedTuple(
+            "tt",
+            [
+                ("input_template", str),
+                ("want_key_list", list[str]),
+            ],
+        )
+
+        for tc in [
+            tt(input_template="", want_key_list=[]),
+            tt(input_template="$foo ${foo} $[foo", want_key_list=[]),
+            tt(input_template="$[foo]", want_key_list=["foo"]),
+            tt(input_template="$[foo\n]", want_key_list=["foo\n"]),
+            tt(
+                input_template="foo $[foo] baz $[baz] $[foo]",
+                want_key_list=["foo", "baz", "foo"],
+            ),
+        ]:
+            with self.subTest(tc=tc):
+                got_key_list = sw_compdocs.template.keys(tc.input_template)
+                self.assertEqual(got_key_list, tc.want_key_list)